@@ -0,0 +1,371 @@
+"""HTTP API for the resume analysis pipeline.
+
+Exposes parsing, analysis against a catalog role or a custom job
+description, suggestions and reports so the analyzer can sit behind other
+systems without the Streamlit UI. CPU-bound stages run in a process pool
+off the event loop; request bodies are size-capped as they stream in.
+
+Run:
+    python api_server.py --host 0.0.0.0 --port 8000 --workers 8
+    uvicorn api_server:app
+
+Endpoints:
+    GET  /health                    Liveness and pool status
+    GET  /roles                     Catalog role names
+    POST /parse                     Multipart "file" -> text and sections
+    POST /analyze/role              Multipart "file" and "role" -> analysis and suggestions
+    POST /analyze/job-description   Multipart "file" and "job_description" -> analysis and suggestions
+    POST /suggestions               JSON analysis, resume_sections and job_data -> suggestions
+    POST /report?format=pdf         JSON report data -> PDF, HTML or Markdown report
+"""
+import argparse
+import asyncio
+import functools
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+from fastapi import FastAPI, File, Form, HTTPException, Query, UploadFile
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, ConfigDict
+
+from report_renderers import REPORT_FORMATS, render_report
+from resume_parser import MIME_TYPES
+from role_registry import get_role_registry
+
+MAX_UPLOAD_BYTES = int(os.getenv("RESUME_API_MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_CHUNK_BYTES = 64 * 1024
+# Room for multipart boundaries and form fields on top of the file itself
+MAX_REQUEST_BYTES = MAX_UPLOAD_BYTES + 256 * 1024
+WORKERS = int(os.getenv("RESUME_API_WORKERS", "0")) or os.cpu_count() or 1
+# Jobs allowed to wait for the pool; beyond this requests are refused with 503
+# instead of queueing without bound and dragging out tail latency
+MAX_QUEUED_JOBS = int(os.getenv("RESUME_API_MAX_QUEUED", "0")) or WORKERS * 8
+QUEUE_TIMEOUT = float(os.getenv("RESUME_API_QUEUE_TIMEOUT", "10"))
+
+# Per-process pipeline state, built once by _init_worker
+_pipeline = None
+
+
+def _init_worker():
+    """Build the parser, matcher, suggestion engine and report generator once per worker process"""
+    global _pipeline
+    from job_matcher import JobMatcher
+    from parse_cache import get_default_cache
+    from report_generator import ReportGenerator
+    from resume_parser import ResumeParser
+    from suggestor import SuggestionEngine
+    # Workers already saturate the cores, so don't nest a page-level pool
+    parser = ResumeParser(parallel_page_threshold=None, cache=get_default_cache())
+    _pipeline = (parser, JobMatcher(), SuggestionEngine(), ReportGenerator())
+
+
+class InvalidResume(ValueError):
+    """The uploaded file could not be parsed as a resume"""
+
+
+class PipelineError(Exception):
+    """A pipeline stage failed in a worker; carries only the message so it always pickles"""
+
+
+def _worker_errors(fn):
+    """Re-raise failures inside a worker as picklable exceptions.
+
+    An exception that can't be unpickled in the parent breaks the whole
+    pool, which would be mistaken for a dead worker.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args):
+        try:
+            return fn(*args)
+        except InvalidResume:
+            raise
+        except Exception as e:
+            raise PipelineError(f"{type(e).__name__}: {e}") from None
+    return wrapper
+
+
+def _parse(data: bytes, name: str, mime_type: str) -> Tuple[str, Dict[str, str]]:
+    from resume_parser import ResumeFile
+    parser = _pipeline[0]
+    try:
+        return parser.extract_text_and_sections(ResumeFile(data, name, mime_type))
+    except Exception as e:
+        raise InvalidResume(str(e)) from None
+
+
+@_worker_errors
+def _analyze(data: bytes, name: str, mime_type: str, role: Optional[str],
+             job_description: Optional[str]) -> Dict:
+    _, matcher, suggestor, _ = _pipeline
+    resume_text, resume_sections = _parse(data, name, mime_type)
+    if job_description is not None:
+        job_data = matcher.analyze_job_description(job_description)
+    else:
+        job_data = matcher.get_job_requirements(role)
+    analysis_results = matcher.analyze_resume(resume_text, resume_sections, job_data)
+    return {
+        'job_role': role or "Custom",
+        'analysis': analysis_results,
+        'suggestions': suggestor.generate_suggestions(analysis_results, resume_sections, job_data),
+        'resume_sections': resume_sections,
+        'job_data': job_data,
+        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+@_worker_errors
+def _suggest(analysis: Dict, resume_sections: Dict[str, str], job_data: Dict) -> Dict:
+    return _pipeline[2].generate_suggestions(analysis, resume_sections, job_data)
+
+
+@_worker_errors
+def _render_pdf(report_data: Dict) -> bytes:
+    return _pipeline[3].render_pdf(report_data)
+
+
+class AnalysisResults(BaseModel):
+    """Fields of JobMatcher.analyze_resume output that suggestions and reports read"""
+    model_config = ConfigDict(extra='allow')
+
+    overall_score: Union[int, float]
+    skill_match_percentage: float
+    readability_score: float
+    matched_skills: List[str]
+    missing_skills: List[str]
+    matched_keywords: List[str]
+    missing_keywords: List[str]
+
+
+class SuggestionsRequest(BaseModel):
+    analysis: AnalysisResults
+    resume_sections: Dict[str, str]
+    job_data: Dict
+
+
+class ReportRequest(BaseModel):
+    analysis: AnalysisResults
+    suggestions: Dict
+    job_role: str = "Custom"
+    timestamp: Optional[str] = None
+    ai_suggestions: Optional[Dict[str, str]] = None
+
+
+class _Pool:
+    """Process pool with a bounded wait queue in front of it"""
+
+    def __init__(self, workers: int, max_queued: int):
+        self.workers = workers
+        self.executor = self._new_executor()
+        self._slots = asyncio.Semaphore(workers + max_queued)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # spawn: forking a process that runs an event loop and threads is unsafe
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   mp_context=multiprocessing.get_context("spawn"))
+
+    def _replace_broken(self, executor: ProcessPoolExecutor):
+        """Swap in a fresh executor after a worker died; a broken one never recovers"""
+        if self.executor is executor:
+            self.executor = self._new_executor()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, fn, *args):
+        try:
+            await asyncio.wait_for(self._slots.acquire(), QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=503, detail="Server busy, retry later")
+        executor = self.executor
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            self._replace_broken(executor)
+            raise HTTPException(status_code=503, detail="Worker process failed, retry later")
+        finally:
+            self._slots.release()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pool: Optional[_Pool] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _pool
+    _pool = _Pool(WORKERS, MAX_QUEUED_JOBS)
+    try:
+        yield
+    finally:
+        _pool.shutdown()
+        _pool = None
+
+
+app = FastAPI(title="Smart Resume Analyzer API", lifespan=lifespan)
+
+
+class LimitRequestSize:
+    """ASGI middleware refusing request bodies over max_bytes with a 413.
+
+    A declared Content-Length is checked before anything is read; chunked
+    bodies without one are counted as they stream in and cut off as soon as
+    they cross the limit.
+    """
+
+    def __init__(self, app, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    def _too_large(self) -> HTTPException:
+        return HTTPException(status_code=413, detail=f"Request exceeds {self.max_bytes} bytes")
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        length = dict(scope['headers']).get(b'content-length', b'')
+        if length.isdigit() and int(length) > self.max_bytes:
+            error = self._too_large()
+            response = JSONResponse({'detail': error.detail}, status_code=error.status_code)
+            return await response(scope, receive, send)
+
+        received = 0
+
+        async def receive_limited():
+            nonlocal received
+            message = await receive()
+            if message['type'] == 'http.request':
+                received += len(message.get('body', b''))
+                if received > self.max_bytes:
+                    # Raised while the endpoint reads its body, so FastAPI answers with a 413
+                    raise self._too_large()
+            return message
+
+        await self.app(scope, receive_limited, send)
+
+
+app.add_middleware(LimitRequestSize, max_bytes=MAX_REQUEST_BYTES)
+
+
+async def _read_upload(upload: UploadFile) -> Tuple[bytes, str, str]:
+    """Read an uploaded resume, rejecting unsupported or oversized files early.
+
+    Starlette spools the upload into a SpooledTemporaryFile; it is scanned in
+    chunks and only loaded into memory once it is known to be within the cap.
+    """
+    name = upload.filename or "resume"
+    extension = os.path.splitext(name)[1].lower()
+    mime_type = upload.content_type if upload.content_type in MIME_TYPES.values() else MIME_TYPES.get(extension)
+    if mime_type is None:
+        raise HTTPException(status_code=415, detail="Upload a PDF or DOCX resume")
+
+    size = 0
+    while True:
+        chunk = await upload.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail=f"File exceeds {MAX_UPLOAD_BYTES} bytes")
+    if not size:
+        raise HTTPException(status_code=400, detail="Empty file")
+    await upload.seek(0)
+    return await upload.read(), name, mime_type
+
+
+async def _run_pipeline(fn, *args):
+    """Run a CPU-bound stage in the pool; unparseable resumes become 422s
+    and any other pipeline failure a 500"""
+    try:
+        return await _pool.run(fn, *args)
+    except InvalidResume as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except PipelineError as e:
+        raise HTTPException(status_code=500, detail=f"Pipeline failed: {e}")
+
+
+@app.get("/health")
+async def health() -> Dict:
+    return {'status': 'ok', 'workers': _pool.workers if _pool else 0}
+
+
+@app.get("/roles")
+async def roles() -> Dict:
+    return {'roles': get_role_registry().role_names()}
+
+
+@app.post("/parse")
+async def parse(file: UploadFile = File(...)) -> Dict:
+    data, name, mime_type = await _read_upload(file)
+    text, sections = await _run_pipeline(_parse, data, name, mime_type)
+    return {'text': text, 'sections': sections}
+
+
+@app.post("/analyze/role")
+async def analyze_role(file: UploadFile = File(...), role: str = Form(...)) -> Dict:
+    if get_role_registry().get(role) is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job role: {role}")
+    data, name, mime_type = await _read_upload(file)
+    return await _run_pipeline(_analyze, data, name, mime_type, role, None)
+
+
+@app.post("/analyze/job-description")
+async def analyze_job_description(file: UploadFile = File(...),
+                                  job_description: str = Form(...)) -> Dict:
+    if not job_description.strip():
+        raise HTTPException(status_code=400, detail="Job description is empty")
+    data, name, mime_type = await _read_upload(file)
+    return await _run_pipeline(_analyze, data, name, mime_type, None, job_description)
+
+
+@app.post("/suggestions")
+async def suggestions(request: SuggestionsRequest) -> Dict:
+    result = await _run_pipeline(_suggest, request.analysis.model_dump(), request.resume_sections,
+                                 request.job_data)
+    return {'suggestions': result}
+
+
+@app.post("/report")
+async def report(request: ReportRequest,
+                 fmt: str = Query("pdf", alias="format", pattern="^(pdf|html|markdown)$")) -> Response:
+    report_data = request.model_dump()
+    report_data['timestamp'] = report_data['timestamp'] or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    mime_type, extension = REPORT_FORMATS[fmt]
+
+    if fmt == 'pdf':
+        content = await _run_pipeline(_render_pdf, report_data)
+    else:
+        # Template rendering takes microseconds, cheaper than a trip to the pool
+        content = render_report(report_data, fmt)
+
+    return Response(content=content, media_type=mime_type, headers={
+        'Content-Disposition': f'attachment; filename="resume_analysis.{extension}"'
+    })
+
+
+def main(argv=None) -> int:
+    global WORKERS, MAX_QUEUED_JOBS
+    arg_parser = argparse.ArgumentParser(description="Serve the resume analysis pipeline over HTTP")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8000)
+    arg_parser.add_argument("-w", "--workers", type=int, help="Pipeline worker processes (default: CPU count)")
+    args = arg_parser.parse_args(argv)
+
+    if args.workers:
+        WORKERS = args.workers
+        MAX_QUEUED_JOBS = int(os.getenv("RESUME_API_MAX_QUEUED", "0")) or WORKERS * 8
+
+    import uvicorn
+    # One event loop process is enough: the heavy lifting happens in the pool
+    uvicorn.run(app, host=args.host, port=args.port, backlog=2048)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,21 @@
 import streamlit as st
 import os
 import json
+import hashlib
+import time
 from datetime import datetime
-import plotly.graph_objects as go
-import plotly.express as px
-from resume_parser import ResumeParser
+from resume_parser import ResumeFile, ResumeParser
 from job_matcher import JobMatcher
 from suggestor import SuggestionEngine
-from llm_optimizer import LLMOptimizer
-import pandas as pd
+from parse_cache import get_default_cache
+from role_registry import get_role_registry
+
+# Seconds between UI refreshes while AI suggestions stream in the background
+AI_POLL_INTERVAL = 0.25
+
+# Memoized analyses kept per server process, and how long they stay fresh
+ANALYSIS_CACHE_ENTRIES = 64
+ANALYSIS_CACHE_TTL = 3600
 
 # Page configuration
 st.set_page_config(
@@ -53,6 +60,72 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def get_resume_parser() -> ResumeParser:
+    """Process-wide parser; it holds no per-request state"""
+    return ResumeParser(cache=get_default_cache())
+
+@st.cache_resource
+def get_job_matcher() -> JobMatcher:
+    return JobMatcher()
+
+@st.cache_resource
+def get_suggestion_engine() -> SuggestionEngine:
+    return SuggestionEngine()
+
+@st.cache_resource(max_entries=16)
+def get_llm_optimizer(api_key: str):
+    from llm_optimizer import LLMOptimizer
+    return LLMOptimizer(api_key)
+
+@st.cache_data(max_entries=ANALYSIS_CACHE_ENTRIES, ttl=ANALYSIS_CACHE_TTL, show_spinner=False)
+def run_analysis(file_hash: str, file_type: str, job_option: str, selected_role,
+                 job_description_hash: str, recommendation_count: int,
+                 _file_bytes: bytes, _file_name: str, _job_description: str):
+    """Parse, match and suggest, memoized by file hash, target and settings.
+
+    Underscore arguments are excluded from the cache key; the hashes stand in for them.
+    """
+    parser = get_resume_parser()
+    resume_text, resume_sections = parser.extract_text_and_sections(
+        ResumeFile(_file_bytes, _file_name, file_type)
+    )
+    
+    # Match with job
+    matcher = get_job_matcher()
+    recommendations = None
+    if job_option == "Recommend Roles for Me":
+        recommendations = matcher.recommend_roles(
+            resume_text, resume_sections, top_k=recommendation_count
+        )
+        if not recommendations:
+            raise ValueError("No matching roles found for this resume")
+        selected_role = recommendations[0]['role']
+    
+    if job_option != "Custom Job Description":
+        job_data = matcher.get_job_requirements(selected_role)
+    else:
+        job_data = matcher.analyze_job_description(_job_description)
+    
+    # Perform analysis
+    analysis_results = matcher.analyze_resume(
+        resume_text, resume_sections, job_data
+    )
+    
+    # Generate suggestions
+    suggestions = get_suggestion_engine().generate_suggestions(
+        analysis_results, resume_sections, job_data
+    )
+    
+    return {
+        'analysis': analysis_results,
+        'suggestions': suggestions,
+        'recommendations': recommendations,
+        'resume_sections': resume_sections,
+        'job_role': selected_role,
+        'job_data': job_data
+    }
+
 def main():
     # Header
     st.markdown("""
@@ -67,6 +140,8 @@ def main():
         st.session_state.analysis_complete = False
     if 'resume_data' not in st.session_state:
         st.session_state.resume_data = None
+    if 'ai_job' not in st.session_state:
+        st.session_state.ai_job = None
 
     # Sidebar
     with st.sidebar:
@@ -83,18 +158,21 @@ def main():
         st.subheader("🎯 Target Job Role")
         job_option = st.radio(
             "Choose analysis type:",
-            ["Predefined Job Role", "Custom Job Description"]
+            ["Predefined Job Role", "Custom Job Description", "Recommend Roles for Me"]
         )
         
+        recommendation_count = 3
         if job_option == "Predefined Job Role":
-            job_roles = [
-                "Software Engineer", "Data Scientist", "Product Manager",
-                "Marketing Manager", "Sales Representative", "Business Analyst",
-                "UI/UX Designer", "DevOps Engineer", "Project Manager",
-                "Financial Analyst", "HR Manager", "Content Writer"
-            ]
+            job_roles = get_role_registry().role_names()
             selected_role = st.selectbox("Select Job Role:", job_roles)
             job_description = ""
+        elif job_option == "Recommend Roles for Me":
+            recommendation_count = st.slider(
+                "Number of roles to recommend:", 1, 10, 3,
+                help="Your resume is analyzed against the best-matching role"
+            )
+            selected_role = None
+            job_description = ""
         else:
             selected_role = "Custom"
             job_description = st.text_area(
@@ -116,57 +194,49 @@ def main():
                 type="password",
                 help="Enter your OpenAI API key for enhanced AI features"
             )
+            single_ai_request = st.checkbox(
+                "Combine AI requests",
+                help="Ask for all sections in one request: fewer round trips and tokens"
+            )
         else:
             api_key = None
+            single_ai_request = False
 
     # Main content
     if uploaded_file is not None:
         if st.button("🚀 Analyze Resume", type="primary"):
+            # A new analysis supersedes any AI job still running for the previous one
+            if st.session_state.ai_job is not None:
+                st.session_state.ai_job.cancel()
+                st.session_state.ai_job = None
+            
             with st.spinner("Analyzing your resume... This may take a few moments."):
                 try:
-                    # Parse resume
-                    parser = ResumeParser()
-                    resume_text, resume_sections = parser.extract_text_and_sections(uploaded_file)
-                    
-                    # Match with job
-                    matcher = JobMatcher()
-                    if job_option == "Predefined Job Role":
-                        job_data = matcher.get_job_requirements(selected_role)
-                        comparison_text = job_data['description']
-                    else:
-                        comparison_text = job_description
-                        job_data = matcher.analyze_job_description(job_description)
-                    
-                    # Perform analysis
-                    analysis_results = matcher.analyze_resume(
-                        resume_text, resume_sections, job_data
-                    )
-                    
-                    # Generate suggestions
-                    suggestor = SuggestionEngine()
-                    suggestions = suggestor.generate_suggestions(
-                        analysis_results, resume_sections, job_data
+                    file_bytes = uploaded_file.getvalue()
+                    result = run_analysis(
+                        hashlib.sha256(file_bytes).hexdigest(), uploaded_file.type, job_option,
+                        selected_role, hashlib.sha256(job_description.encode("utf-8")).hexdigest(),
+                        recommendation_count,
+                        _file_bytes=file_bytes, _file_name=uploaded_file.name,
+                        _job_description=job_description
                     )
                     
-                    # AI optimization (if enabled)
-                    ai_suggestions = None
+                    # AI optimization (if enabled) runs in the background and fills in the AI Insights tab
                     if use_ai_optimization and api_key:
                         try:
-                            optimizer = LLMOptimizer(api_key)
-                            ai_suggestions = optimizer.optimize_resume_sections(
-                                resume_sections, job_data, analysis_results
-                            )
+                            from background_tasks import AIOptimizationJob
+                            st.session_state.ai_job = AIOptimizationJob(
+                                get_llm_optimizer(api_key), result['resume_sections'],
+                                result['job_data'], result['analysis'],
+                                mode="structured" if single_ai_request else "per_section"
+                            ).start()
                         except Exception as e:
                             st.warning(f"AI optimization failed: {str(e)}")
                     
                     # Store results in session state
                     st.session_state.resume_data = {
-                        'analysis': analysis_results,
-                        'suggestions': suggestions,
-                        'ai_suggestions': ai_suggestions,
-                        'resume_sections': resume_sections,
-                        'job_role': selected_role,
-                        'job_data': job_data,
+                        **result,
+                        'ai_suggestions': None,
                         'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     }
                     st.session_state.analysis_complete = True
@@ -177,16 +247,27 @@ def main():
 
     # Display results
     if st.session_state.analysis_complete and st.session_state.resume_data:
-        display_analysis_results(st.session_state.resume_data)
+        ai_progress = display_analysis_results(st.session_state.resume_data)
+        if ai_progress:
+            follow_ai_job(st.session_state.resume_data, *ai_progress)
 
 def display_analysis_results(data):
-    """Display comprehensive analysis results"""
+    """Display comprehensive analysis results.
+
+    Returns the AI Insights placeholders while a background AI job is still
+    running, otherwise None.
+    """
+    import plotly.graph_objects as go
+    
     analysis = data['analysis']
     suggestions = data['suggestions']
     ai_suggestions = data['ai_suggestions']
     
     st.header("📊 Analysis Results")
     
+    if data.get('recommendations'):
+        display_role_recommendations(data['recommendations'])
+    
     # Overall score and metrics
     col1, col2, col3, col4 = st.columns(4)
     
@@ -251,6 +332,7 @@ def display_analysis_results(data):
     st.plotly_chart(fig, use_container_width=True)
     
     # Detailed analysis tabs
+    ai_progress = None
     tab1, tab2, tab3, tab4 = st.tabs(["🎯 Skills Analysis", "💡 Suggestions", "🤖 AI Insights", "📄 Report"])
     
     with tab1:
@@ -262,11 +344,32 @@ def display_analysis_results(data):
     with tab3:
         if ai_suggestions:
             display_ai_suggestions(ai_suggestions)
+        elif st.session_state.ai_job is not None:
+            ai_progress = display_ai_progress(st.session_state.ai_job)
         else:
             st.info("AI suggestions not available. Enable AI optimization and provide an API key to access this feature.")
     
     with tab4:
         display_report_options(data)
+    
+    return ai_progress
+
+def display_role_recommendations(recommendations):
+    """Display the best-matching roles for the uploaded resume"""
+    st.subheader("🧭 Recommended Roles")
+    st.caption(f"Detailed results below are for your top match: {recommendations[0]['role']}")
+    
+    st.dataframe([
+        {
+            'Role': rec['role'],
+            'Overall Score': rec['overall_score'],
+            'Skill Match (%)': round(rec['skill_match_percentage'], 1),
+            'Keyword Match (%)': round(rec['keyword_match_percentage'], 1),
+            'Similarity (%)': round(rec['similarity_score'], 1),
+            'Missing Skills': ', '.join(rec['missing_skills'][:5])
+        }
+        for rec in recommendations
+    ], use_container_width=True, hide_index=True)
 
 def display_skills_analysis(analysis):
     """Display detailed skills analysis"""
@@ -326,6 +429,39 @@ def display_ai_suggestions(ai_suggestions):
                 st.write("**AI Suggestion:**")
                 st.info(suggestion)
 
+def display_ai_progress(job):
+    """Lay out AI Insights placeholders for a job that is still generating"""
+    st.subheader("🤖 AI-Powered Optimization")
+    status = st.empty()
+    status.caption("⏳ Generating AI suggestions...")
+    
+    placeholders = {}
+    for section in job.sections:
+        with st.expander(f"✨ {section.title()} Enhancement", expanded=True):
+            st.write("**AI Suggestion:**")
+            placeholders[section] = st.empty()
+    return job, status, placeholders
+
+def follow_ai_job(data, job, status, placeholders):
+    """Stream a background AI job into its placeholders, then rerun with the final text"""
+    while True:
+        finished = job.done()
+        for section, text in job.snapshot().items():
+            if text:
+                placeholders[section].info(text)
+        if finished:
+            break
+        time.sleep(AI_POLL_INTERVAL)
+    
+    st.session_state.ai_job = None
+    try:
+        data['ai_suggestions'] = job.result()
+    except Exception as e:
+        status.warning(f"AI optimization failed: {str(e)}")
+        return
+    # Rerun so the report and every other tab include the finished suggestions
+    st.rerun()
+
 def display_report_options(data):
     """Display report generation options"""
     st.subheader("📄 Generate Report")
@@ -333,22 +469,26 @@ def display_report_options(data):
     col1, col2 = st.columns(2)
     
     with col1:
-        if st.button("📊 Generate PDF Report", type="primary"):
+        report_format = st.selectbox(
+            "Report format:", ["PDF", "HTML", "Markdown"],
+            help="HTML and Markdown reports are lightweight and quick to share"
+        )
+        if st.button(f"📊 Generate {report_format} Report", type="primary"):
             try:
-                from report_generator import ReportGenerator
-                generator = ReportGenerator()
-                pdf_path = generator.generate_pdf_report(data)
+                from report_renderers import REPORT_FORMATS, render_report
+                fmt = report_format.lower()
+                mime, extension = REPORT_FORMATS[fmt]
+                report_bytes = render_report(data, fmt)
                 
-                with open(pdf_path, "rb") as pdf_file:
-                    st.download_button(
-                        label="📥 Download PDF Report",
-                        data=pdf_file.read(),
-                        file_name=f"resume_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-                        mime="application/pdf"
-                    )
-                st.success("PDF report generated successfully!")
+                st.download_button(
+                    label=f"📥 Download {report_format} Report",
+                    data=report_bytes,
+                    file_name=f"resume_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}",
+                    mime=mime
+                )
+                st.success(f"{report_format} report generated successfully!")
             except Exception as e:
-                st.error(f"Error generating PDF: {str(e)}")
+                st.error(f"Error generating report: {str(e)}")
     
     with col2:
         if st.button("📋 Copy Analysis Summary"):
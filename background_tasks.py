@@ -0,0 +1,88 @@
+"""Run AI optimization off the Streamlit script thread.
+
+The deterministic analysis renders as soon as it is ready while an
+AIOptimizationJob streams LLM suggestions in a shared thread pool. The UI
+polls snapshot() to show partial text and cancels the job when the user
+starts a new analysis.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor(max_workers: int = 4) -> ThreadPoolExecutor:
+    """Process-wide pool shared by every session's background jobs"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ai-job")
+        return _executor
+
+
+class AIOptimizationJob:
+    """LLM optimization running in the background with readable partial results"""
+
+    def __init__(self, optimizer, resume_sections: Dict[str, str], job_data: Dict,
+                 analysis_results: Dict, mode: str = "per_section"):
+        self.optimizer = optimizer
+        self.resume_sections = resume_sections
+        self.job_data = job_data
+        self.analysis_results = analysis_results
+        self.mode = mode
+        self.sections = optimizer.sections_to_optimize(resume_sections)
+        self._partial = {section: "" for section in self.sections}
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._future = None
+
+    def start(self, executor: Optional[ThreadPoolExecutor] = None) -> 'AIOptimizationJob':
+        self._future = (executor or get_executor()).submit(self._run)
+        return self
+
+    def _run(self) -> Dict[str, str]:
+        if self.mode == "structured":
+            result = self.optimizer.optimize_resume_sections(
+                self.resume_sections, self.job_data, self.analysis_results, mode="structured"
+            )
+            with self._lock:
+                self._partial.update(result)
+            return result
+
+        stream = self.optimizer.stream_resume_sections(
+            self.resume_sections, self.job_data, self.analysis_results
+        )
+        try:
+            for section, delta in stream:
+                if self._cancelled.is_set():
+                    break
+                with self._lock:
+                    self._partial[section] += delta
+        finally:
+            # Stops the section streams that are still running
+            stream.close()
+        return self.snapshot()
+
+    def cancel(self):
+        """Stop streaming; a job that has not started yet never runs"""
+        self._cancelled.set()
+        if self._future is not None:
+            self._future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def done(self) -> bool:
+        return self._future is not None and self._future.done()
+
+    def snapshot(self) -> Dict[str, str]:
+        """Text generated so far for each section"""
+        with self._lock:
+            return dict(self._partial)
+
+    def result(self, timeout: Optional[float] = None) -> Dict[str, str]:
+        """Final suggestions; re-raises any error from the background thread"""
+        return self._future.result(timeout)
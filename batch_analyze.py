@@ -0,0 +1,155 @@
+"""Headless batch analysis of resumes against a target role.
+
+Runs the same pipeline as the Streamlit app (parse -> match -> suggest) over a
+directory or manifest of PDF/DOCX files and streams one JSON line per resume
+as soon as it finishes.
+
+Examples:
+    python batch_analyze.py resumes/ --role "Data Scientist" > results.jsonl
+    python batch_analyze.py manifest.txt --job-description job.txt -o results.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+from job_matcher import JobMatcher
+from parallel import bounded_imap_unordered
+from parse_cache import ParseCache
+from resume_parser import MIME_TYPES, ResumeFile, ResumeParser
+from suggestor import SuggestionEngine
+
+# Per-process pipeline state, built once by _init_worker
+_pipeline = None
+
+
+def iter_resume_paths(source: str) -> Iterator[str]:
+    """Yield resume paths from a directory (recursive) or a manifest file.
+
+    A manifest lists one path per line; relative paths are resolved against
+    the manifest's directory and lines starting with '#' are ignored.
+    """
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if os.path.splitext(name)[1].lower() in MIME_TYPES:
+                    yield os.path.join(root, name)
+        return
+
+    base_dir = os.path.dirname(os.path.abspath(source))
+    with open(source, encoding="utf-8") as manifest:
+        for line in manifest:
+            path = line.strip()
+            if path and not path.startswith('#'):
+                yield path if os.path.isabs(path) else os.path.join(base_dir, path)
+
+
+def _init_worker(job_role: str, job_description: Optional[str], cache_dir: Optional[str]):
+    """Build the parser, matcher and suggestion engine once per worker process"""
+    global _pipeline
+    cache = ParseCache(cache_dir=cache_dir) if cache_dir else None
+    # Workers already saturate the cores, so don't nest a page-level pool
+    parser = ResumeParser(parallel_page_threshold=None, cache=cache)
+    matcher = JobMatcher()
+    if job_description:
+        job_data = matcher.analyze_job_description(job_description)
+    else:
+        job_data = matcher.get_job_requirements(job_role)
+    _pipeline = (parser, matcher, SuggestionEngine(), job_data)
+
+
+def analyze_file(path: str) -> Dict:
+    """Run the full analysis pipeline for a single resume file"""
+    parser, matcher, suggestor, job_data = _pipeline
+    try:
+        resume_text, resume_sections = parser.extract_text_and_sections(ResumeFile.from_path(path))
+        analysis_results = matcher.analyze_resume(resume_text, resume_sections, job_data)
+        suggestions = suggestor.generate_suggestions(analysis_results, resume_sections, job_data)
+        return {
+            'file': path,
+            'status': 'ok',
+            'analysis': analysis_results,
+            'suggestions': suggestions,
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    except Exception as e:
+        return {'file': path, 'status': 'error', 'error': str(e)}
+
+
+def run_batch(source: str, output, job_role: str = "Custom",
+              job_description: Optional[str] = None,
+              workers: Optional[int] = None, max_in_flight: Optional[int] = None,
+              cache_dir: Optional[str] = None) -> Dict[str, int]:
+    """Analyze every resume in source and write JSON lines to output.
+
+    When cache_dir is given, parsed resumes are cached there by content so
+    repeated runs skip PDF/DOCX extraction. Returns counts of successful and
+    failed resumes.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    counts = {'ok': 0, 'error': 0}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(job_role, job_description, cache_dir)) as executor:
+        for path, future in bounded_imap_unordered(executor, analyze_file,
+                                                   iter_resume_paths(source), max_in_flight):
+            try:
+                record = future.result()
+            except Exception as e:
+                record = {'file': path, 'status': 'error', 'error': str(e)}
+
+            record['job_role'] = job_role
+            counts[record['status']] += 1
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+
+    return counts
+
+
+def main(argv=None) -> int:
+    arg_parser = argparse.ArgumentParser(
+        description="Analyze a batch of resumes and stream JSON lines results"
+    )
+    arg_parser.add_argument("source", help="Directory of PDF/DOCX resumes or a manifest file")
+    target = arg_parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--role", help="Predefined job role to match against")
+    target.add_argument("--job-description", metavar="FILE",
+                        help="Text file containing a custom job description")
+    arg_parser.add_argument("-o", "--output", help="Output JSONL file (default: stdout)")
+    arg_parser.add_argument("-w", "--workers", type=int, help="Worker processes (default: CPU count)")
+    arg_parser.add_argument("--max-in-flight", type=int,
+                            help="Maximum resumes queued at once (default: 4 x workers)")
+    arg_parser.add_argument("--cache-dir", help="Directory for the shared parse cache")
+    args = arg_parser.parse_args(argv)
+
+    if not os.path.exists(args.source):
+        arg_parser.error(f"Source not found: {args.source}")
+
+    job_description = None
+    job_role = args.role
+    if args.job_description:
+        with open(args.job_description, encoding="utf-8") as f:
+            job_description = f.read()
+        job_role = "Custom"
+    elif not JobMatcher().get_job_requirements(job_role):
+        arg_parser.error(f"Unknown job role: {job_role}")
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        counts = run_batch(args.source, output, job_role, job_description,
+                           args.workers, args.max_in_flight, args.cache_dir)
+    finally:
+        if args.output:
+            output.close()
+
+    print(f"Analyzed {counts['ok']} resumes ({counts['error']} failed)", file=sys.stderr)
+    return 0 if counts['error'] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
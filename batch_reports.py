@@ -0,0 +1,152 @@
+"""Render reports for a batch of analysis results.
+
+Takes the JSON lines written by batch_analyze.py (or any iterable of report
+data dicts) and renders one PDF, HTML or Markdown report per resume in a
+process pool. Reports are streamed into a zip archive or a directory as
+they finish, with a bounded number in flight, so memory stays flat however
+large the batch is.
+
+Examples:
+    python batch_reports.py results.jsonl -o reports.zip
+    python batch_reports.py results.jsonl -o reports/ --workers 8
+    python batch_reports.py results.jsonl -o reports.zip --format html
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from parallel import bounded_imap_unordered
+from report_renderers import REPORT_FORMATS, render_report
+
+# Per-process report generator and format, set once by _init_worker
+_generator = None
+_format = 'pdf'
+
+
+def iter_records(path: str) -> Iterator[Dict]:
+    """Yield successful analysis records from a batch_analyze JSONL file"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                if record.get('status', 'ok') == 'ok':
+                    yield record
+
+
+def report_filename(index: int, record: Dict, extension: str = 'pdf') -> str:
+    """Unique, filesystem-safe report file name for a record"""
+    stem = os.path.splitext(os.path.basename(record.get('file') or 'resume'))[0]
+    stem = re.sub(r'[^\w.-]+', '_', stem).strip('._') or 'resume'
+    return f"{index:05d}_{stem}.{extension}"
+
+
+def _init_worker(fmt: str):
+    """Build one ReportGenerator per worker; its chart cache is shared by every report it renders"""
+    global _generator, _format
+    _format = fmt
+    if fmt == 'pdf':
+        from report_generator import ReportGenerator
+        _generator = ReportGenerator()
+
+
+def _render_report(item: Tuple[int, Dict]) -> Tuple[Optional[str], Optional[bytes], Optional[str]]:
+    """Render one record; failures come back as an error message so an
+    unpicklable exception can't break the pool"""
+    index, record = item
+    try:
+        name = report_filename(index, record, REPORT_FORMATS[_format][1])
+        if _generator is not None:
+            return name, _generator.render_pdf(record), None
+        return name, render_report(record, _format), None
+    except Exception as e:
+        return None, None, f"{type(e).__name__}: {e}"
+
+
+class _ZipWriter:
+    def __init__(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._archive = zipfile.ZipFile(path, "w")
+
+    def write(self, name: str, data: bytes):
+        # PDFs are already compressed, so store them as-is; text reports compress well
+        compression = zipfile.ZIP_STORED if name.endswith('.pdf') else zipfile.ZIP_DEFLATED
+        self._archive.writestr(name, data, compress_type=compression)
+
+    def close(self):
+        self._archive.close()
+
+
+class _DirectoryWriter:
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, name: str, data: bytes):
+        with open(os.path.join(self.path, name), "wb") as f:
+            f.write(data)
+
+    def close(self):
+        pass
+
+
+def render_reports(records: Iterable[Dict], output: str, workers: Optional[int] = None,
+                   max_in_flight: Optional[int] = None, fmt: str = 'pdf') -> Dict[str, int]:
+    """Render a report per record into output, a .zip archive or a directory.
+
+    Returns counts of rendered and failed reports.
+    """
+    if fmt not in REPORT_FORMATS:
+        raise ValueError(f"Unknown report format: {fmt}")
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    counts = {'ok': 0, 'error': 0}
+
+    writer = _ZipWriter(output) if output.lower().endswith('.zip') else _DirectoryWriter(output)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(fmt,)) as executor:
+            for (index, record), future in bounded_imap_unordered(
+                executor, _render_report, enumerate(records), max_in_flight
+            ):
+                try:
+                    name, report_bytes, error = future.result()
+                except Exception as e:
+                    name, report_bytes, error = None, None, str(e)
+                if error is not None:
+                    counts['error'] += 1
+                    print(f"Report failed for {record.get('file', index)}: {error}", file=sys.stderr)
+                    continue
+                writer.write(name, report_bytes)
+                counts['ok'] += 1
+    finally:
+        writer.close()
+
+    return counts
+
+
+def main(argv=None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Render reports for batch analysis results")
+    arg_parser.add_argument("results", help="JSONL results from batch_analyze.py")
+    arg_parser.add_argument("-o", "--output", required=True,
+                            help="Output .zip archive or directory")
+    arg_parser.add_argument("-f", "--format", choices=sorted(REPORT_FORMATS), default="pdf",
+                            help="Report format (default: pdf)")
+    arg_parser.add_argument("-w", "--workers", type=int, help="Worker processes (default: CPU count)")
+    arg_parser.add_argument("--max-in-flight", type=int,
+                            help="Maximum reports queued at once (default: 4 x workers)")
+    args = arg_parser.parse_args(argv)
+
+    counts = render_reports(iter_records(args.results), args.output, args.workers,
+                            args.max_in_flight, args.format)
+    print(f"Rendered {counts['ok']} reports ({counts['error']} failed) to {args.output}", file=sys.stderr)
+    return 0 if counts['error'] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import textstat
+from scipy import sparse
+from sklearn.preprocessing import normalize
+from job_matcher import SCORE_WEIGHTS, JobMatcher
+from role_registry import RoleProfile
+
+ParsedResume = Tuple[str, Dict[str, str]]
+
+
+def _indicator_matrix(rows: Sequence, vocab: Dict[str, int], counts: bool = False) -> sparse.csr_matrix:
+    """Sparse matrix with one row per item set/sequence over a term vocabulary"""
+    data, indices, indptr = [], [], [0]
+    for items in rows:
+        row = {}
+        for item in items:
+            column = vocab.get(item)
+            if column is not None:
+                row[column] = row.get(column, 0) + 1 if counts else 1
+        indices.extend(row)
+        data.extend(row.values())
+        indptr.append(len(indices))
+    return sparse.csr_matrix((np.array(data, dtype=np.float64), indices, indptr),
+                             shape=(len(rows), len(vocab)))
+
+
+def _vectorized_similarity(matcher: JobMatcher, texts: List[str], profiles: List[RoleProfile],
+                           job_specs: Sequence[Dict]) -> np.ndarray:
+    """Resume x job similarity matrix against the shared corpus model"""
+    resume_vectors = normalize(matcher.vectorizer.transform(texts).astype(np.float64))
+    job_vectors = []
+    for profile, job in zip(profiles, job_specs):
+        vector = matcher.registry.description_vector(profile)
+        if vector is None:
+            vector = matcher.vectorizer.transform([job.get('description', '')])
+        job_vectors.append(vector)
+    job_vectors = sparse.vstack(job_vectors).astype(np.float64)
+    return (resume_vectors @ normalize(job_vectors).T).toarray() * 100
+
+
+class ScoreMatrix:
+    """Scores for N resumes against M job specs, with per-pair drill-down.
+
+    Component matrices (skill_match, keyword_match, similarity) are N x M;
+    readability and sections are per resume. pair_details(i, j) rebuilds the
+    analyze_resume-style breakdown for a single pair on demand.
+    """
+
+    def __init__(self, overall, skill_match, keyword_match, similarity, readability,
+                 sections, resume_skills, resume_keywords, profiles, skill_vocab, keyword_vocab):
+        self.overall = overall
+        self.skill_match = skill_match
+        self.keyword_match = keyword_match
+        self.similarity = similarity
+        self.readability = readability
+        self.sections = sections
+        self.details: Optional[List[List[Dict]]] = None
+        self._resume_skills = resume_skills
+        self._resume_keywords = resume_keywords
+        self._profiles = profiles
+        self._skill_vocab = skill_vocab
+        self._keyword_vocab = keyword_vocab
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.overall.shape
+
+    def pair_details(self, resume_index: int, job_index: int) -> Dict:
+        """Score breakdown for one resume/job pair"""
+        profile = self._profiles[job_index]
+        skill_row = set(self._resume_skills[resume_index].indices)
+        keyword_row = set(self._resume_keywords[resume_index].indices)
+
+        matched_skills = [s for s in profile.required_skills if self._skill_vocab[s] in skill_row]
+        missing_skills = [s for s in profile.required_skills if self._skill_vocab[s] not in skill_row]
+        matched_keywords = [kw for kw in profile.keywords if self._keyword_vocab[kw] in keyword_row]
+        missing_keywords = [kw for kw in profile.keywords if self._keyword_vocab[kw] not in keyword_row]
+
+        return {
+            'overall_score': int(self.overall[resume_index, job_index]),
+            'skill_match_percentage': float(self.skill_match[resume_index, job_index]),
+            'similarity_score': float(self.similarity[resume_index, job_index]),
+            'keyword_match_percentage': float(self.keyword_match[resume_index, job_index]),
+            'readability_score': float(self.readability[resume_index]),
+            'sections_score': float(self.sections[resume_index]),
+            'matched_skills': [skill.title() for skill in matched_skills],
+            'missing_skills': [skill.title() for skill in missing_skills[:10]],  # Top 10
+            'matched_keywords': matched_keywords,
+            'missing_keywords': missing_keywords[:10]  # Top 10
+        }
+
+
+def score_resumes(resumes: Sequence[ParsedResume], job_specs: Sequence[Dict],
+                  matcher: Optional[JobMatcher] = None, details: bool = False) -> ScoreMatrix:
+    """Score N parsed resumes against M job specs with sparse matrix operations.
+
+    Produces the same overall score as JobMatcher.analyze_resume for every
+    pair. Per-pair breakdowns are only built when details is True; otherwise
+    use ScoreMatrix.pair_details for the pairs you need. Text similarity is
+    only vectorized with a prebuilt similarity model (see similarity_model).
+    """
+    matcher = matcher or JobMatcher()
+    profiles = [matcher.registry.profile_for(job) or RoleProfile('Custom', job) for job in job_specs]
+    texts = [text for text, _ in resumes]
+
+    # Vocabularies only need the terms some job asks for
+    skill_vocab: Dict[str, int] = {}
+    keyword_vocab: Dict[str, int] = {}
+    for profile in profiles:
+        for skill in profile.required_skills:
+            skill_vocab.setdefault(skill, len(skill_vocab))
+        for keyword in profile.keywords:
+            keyword_vocab.setdefault(keyword, len(keyword_vocab))
+
+    # Skill match: resumes x skills times skills x jobs, counting duplicate requirements
+    resume_skills = _indicator_matrix(
+        [{skill.lower() for skill in matcher._extract_skills_from_text(text)} for text in texts],
+        skill_vocab
+    )
+    job_skills = _indicator_matrix([profile.required_skills for profile in profiles],
+                                   skill_vocab, counts=True)
+    required_totals = np.asarray(job_skills.sum(axis=1)).ravel()
+    matched_skills = (resume_skills @ job_skills.T).toarray()
+    skill_match = matched_skills / np.maximum(required_totals, 1) * 100
+
+    # Keyword match uses the same substring test as analyze_resume
+    lowered_texts = [text.lower() for text in texts]
+    resume_keywords = _indicator_matrix(
+        [[kw for kw in keyword_vocab if kw in text_lower] for text_lower in lowered_texts],
+        keyword_vocab
+    )
+    job_keywords = _indicator_matrix([profile.keywords for profile in profiles],
+                                     keyword_vocab, counts=True)
+    keyword_totals = np.asarray(job_keywords.sum(axis=1)).ravel()
+    keyword_match = (resume_keywords @ job_keywords.T).toarray() / np.maximum(keyword_totals, 1) * 100
+
+    # TF-IDF cosine similarity between every resume and every job description, in float64
+    # like JobMatcher._calculate_text_similarity so rounded scores agree at .5 boundaries
+    if matcher.registry.has_corpus_model:
+        similarity = _vectorized_similarity(matcher, texts, profiles, job_specs)
+    else:
+        # No shared vocabulary to vectorize against: TF-IDF is fitted per pair
+        similarity = np.array([[matcher._calculate_text_similarity(text, job.get('description', ''))
+                                for job in job_specs] for text in texts], dtype=float)
+        similarity = similarity.reshape(len(texts), len(job_specs))
+
+    readability = np.array([textstat.flesch_reading_ease(text) for text in texts], dtype=float)
+    sections = np.array([matcher._calculate_sections_score(resume_sections)
+                         for _, resume_sections in resumes], dtype=float)
+
+    overall = np.rint(
+        np.minimum(skill_match, 100) * SCORE_WEIGHTS['skills'] +
+        np.minimum(similarity, 100) * SCORE_WEIGHTS['similarity'] +
+        keyword_match * SCORE_WEIGHTS['keywords'] +
+        np.clip(readability, 0, 100)[:, None] * SCORE_WEIGHTS['readability'] +
+        sections[:, None] * SCORE_WEIGHTS['sections']
+    ).astype(int)
+
+    result = ScoreMatrix(overall, skill_match, keyword_match, similarity, readability,
+                         sections, resume_skills, resume_keywords, profiles,
+                         skill_vocab, keyword_vocab)
+    if details:
+        result.details = [[result.pair_details(i, j) for j in range(len(profiles))]
+                          for i in range(len(texts))]
+    return result
@@ -1,149 +1,65 @@
 import json
 import re
-from typing import Dict, List, Set
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
-import textstat
+from collections import Counter
+from typing import Dict, List, Optional, Set
+from role_registry import RoleProfile, RoleRegistry, get_role_registry
+
+# Weights for different components of the overall score
+SCORE_WEIGHTS = {
+    'skills': 0.3,
+    'similarity': 0.2,
+    'keywords': 0.2,
+    'readability': 0.1,
+    'sections': 0.2
+}
 
 class JobMatcher:
     """Match resume content against job requirements and calculate scores"""
     
-    def __init__(self):
-        self.job_roles_data = self._load_job_roles()
-        self.vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
+    def __init__(self, registry: Optional[RoleRegistry] = None):
+        # Role data, skill matcher and description vectors are shared process-wide
+        self.registry = registry or get_role_registry()
+        self.job_roles_data = self.registry.roles
+        self.skill_matcher = self.registry.skill_matcher
     
-    def _load_job_roles(self) -> Dict:
-        """Load predefined job roles and their requirements"""
-        return {
-            "Software Engineer": {
-                "description": "Develop and maintain software applications using various programming languages and frameworks",
-                "required_skills": [
-                    "Python", "Java", "JavaScript", "C++", "Git", "SQL", "HTML", "CSS",
-                    "React", "Node.js", "API Development", "Database Design", "Testing",
-                    "Debugging", "Agile", "Problem Solving", "Team Collaboration"
-                ],
-                "preferred_skills": [
-                    "Docker", "Kubernetes", "AWS", "Machine Learning", "DevOps",
-                    "Microservices", "GraphQL", "TypeScript", "MongoDB", "Redis"
-                ],
-                "keywords": [
-                    "software development", "programming", "coding", "algorithms",
-                    "data structures", "version control", "code review", "deployment",
-                    "scalability", "performance optimization", "software architecture"
-                ]
-            },
-            "Data Scientist": {
-                "description": "Analyze complex data to extract insights and build predictive models",
-                "required_skills": [
-                    "Python", "R", "SQL", "Machine Learning", "Statistics", "Pandas",
-                    "NumPy", "Scikit-learn", "Data Visualization", "Jupyter", "Excel",
-                    "Problem Solving", "Critical Thinking", "Communication"
-                ],
-                "preferred_skills": [
-                    "TensorFlow", "PyTorch", "Deep Learning", "NLP", "Big Data",
-                    "Spark", "Hadoop", "Tableau", "Power BI", "A/B Testing",
-                    "Feature Engineering", "Model Deployment", "Cloud Platforms"
-                ],
-                "keywords": [
-                    "data analysis", "predictive modeling", "statistical analysis",
-                    "data mining", "business intelligence", "data pipeline",
-                    "feature selection", "model validation", "data cleaning"
-                ]
-            },
-            "Product Manager": {
-                "description": "Lead product development from conception to launch",
-                "required_skills": [
-                    "Product Strategy", "Market Research", "User Experience", "Analytics",
-                    "Project Management", "Communication", "Leadership", "Stakeholder Management",
-                    "Agile", "Scrum", "Data Analysis", "Problem Solving"
-                ],
-                "preferred_skills": [
-                    "SQL", "A/B Testing", "Wireframing", "Prototyping", "Customer Development",
-                    "Go-to-Market Strategy", "Pricing Strategy", "Competitive Analysis",
-                    "Product Marketing", "Technical Writing"
-                ],
-                "keywords": [
-                    "product roadmap", "user stories", "market analysis", "product launch",
-                    "customer feedback", "product metrics", "cross-functional teams",
-                    "product vision", "requirements gathering", "product lifecycle"
-                ]
-            },
-            "Marketing Manager": {
-                "description": "Develop and execute marketing strategies to promote products and services",
-                "required_skills": [
-                    "Digital Marketing", "Content Marketing", "Social Media", "SEO", "SEM",
-                    "Email Marketing", "Analytics", "Campaign Management", "Brand Management",
-                    "Communication", "Creativity", "Project Management"
-                ],
-                "preferred_skills": [
-                    "Google Analytics", "Facebook Ads", "Google Ads", "Marketing Automation",
-                    "CRM", "A/B Testing", "Conversion Optimization", "Influencer Marketing",
-                    "Video Marketing", "Graphic Design", "Copywriting"
-                ],
-                "keywords": [
-                    "marketing campaigns", "lead generation", "brand awareness",
-                    "customer acquisition", "marketing ROI", "content strategy",
-                    "market segmentation", "customer journey", "marketing funnel"
-                ]
-            },
-            "Business Analyst": {
-                "description": "Analyze business processes and requirements to improve efficiency",
-                "required_skills": [
-                    "Business Analysis", "Requirements Gathering", "Process Mapping",
-                    "Data Analysis", "SQL", "Excel", "Documentation", "Stakeholder Management",
-                    "Problem Solving", "Communication", "Critical Thinking"
-                ],
-                "preferred_skills": [
-                    "Tableau", "Power BI", "Python", "R", "JIRA", "Confluence",
-                    "Process Improvement", "Change Management", "Project Management",
-                    "Business Intelligence", "Data Modeling"
-                ],
-                "keywords": [
-                    "business requirements", "process optimization", "gap analysis",
-                    "business case", "stakeholder analysis", "workflow analysis",
-                    "business metrics", "reporting", "business intelligence"
-                ]
-            },
-            "UI/UX Designer": {
-                "description": "Design user interfaces and experiences for digital products",
-                "required_skills": [
-                    "UI Design", "UX Design", "Wireframing", "Prototyping", "User Research",
-                    "Figma", "Sketch", "Adobe Creative Suite", "Design Systems",
-                    "User Testing", "Information Architecture", "Creativity"
-                ],
-                "preferred_skills": [
-                    "HTML", "CSS", "JavaScript", "Animation", "Interaction Design",
-                    "Accessibility", "Mobile Design", "Responsive Design", "Design Thinking",
-                    "Usability Testing", "A/B Testing"
-                ],
-                "keywords": [
-                    "user experience", "user interface", "design thinking", "user journey",
-                    "design systems", "visual design", "interaction design",
-                    "usability", "accessibility", "design research"
-                ]
-            }
-        }
+    @property
+    def vectorizer(self):
+        """Shared TF-IDF vectorizer, loaded on first similarity calculation"""
+        return self.registry.vectorizer
     
     def get_job_requirements(self, job_role: str) -> Dict:
-        """Get requirements for a specific job role"""
+        """Get requirements for a specific job role (shared, read-only data)"""
         return self.job_roles_data.get(job_role, {})
     
+    def recommend_roles(self, resume_text: str, resume_sections: Dict[str, str],
+                        top_k: int = 3, candidate_limit: int = 20) -> List[Dict]:
+        """Rank catalog roles for a resume and return the top_k with score breakdowns.
+
+        Candidate roles come from the registry's skill and keyword inverted
+        indexes, so only roles sharing something with the resume are scored.
+        """
+        from batch_scoring import score_resumes
+        
+        hits = Counter()
+        for skill in self._extract_skills_from_text(resume_text):
+            hits.update(self.registry.skill_postings.get(skill.lower(), ()))
+        for keyword in self.registry.keyword_matcher.find_skills(resume_text):
+            hits.update(self.registry.keyword_postings.get(keyword, ()))
+        if not hits:
+            return []
+        
+        candidates = [name for name, _ in hits.most_common(max(candidate_limit, top_k))]
+        scores = score_resumes([(resume_text, resume_sections)],
+                               [self.job_roles_data[name] for name in candidates], matcher=self)
+        
+        ranked = sorted(range(len(candidates)),
+                        key=lambda j: (scores.overall[0, j], hits[candidates[j]]), reverse=True)
+        return [dict(role=candidates[j], **scores.pair_details(0, j)) for j in ranked[:top_k]]
+    
     def analyze_job_description(self, job_description: str) -> Dict:
         """Analyze a custom job description to extract requirements"""
-        # Extract skills and keywords from job description
-        text_lower = job_description.lower()
-        
-        # Common technical skills to look for
-        all_skills = set()
-        for role_data in self.job_roles_data.values():
-            all_skills.update([skill.lower() for skill in role_data.get('required_skills', [])])
-            all_skills.update([skill.lower() for skill in role_data.get('preferred_skills', [])])
-        
-        found_skills = []
-        for skill in all_skills:
-            if skill in text_lower:
-                found_skills.append(skill.title())
+        # Extract skills in order of appearance from the shared taxonomy
+        found_skills = [skill.title() for skill in self.skill_matcher.find_skills(job_description)]
         
         # Extract keywords (important phrases)
         keywords = self._extract_keywords_from_text(job_description)
@@ -186,13 +102,15 @@ class JobMatcher:
         # Extract skills from resume
         resume_skills = self._extract_skills_from_text(resume_text)
         
-        # Get job requirements
-        required_skills = [skill.lower() for skill in job_data.get('required_skills', [])]
-        preferred_skills = [skill.lower() for skill in job_data.get('preferred_skills', [])]
-        job_keywords = [kw.lower() for kw in job_data.get('keywords', [])]
+        # Get job requirements, precomputed for catalog roles
+        profile = self.registry.profile_for(job_data)
+        if profile is None:
+            profile = RoleProfile('Custom', job_data)
+        required_skills = profile.required_skills
+        job_keywords = profile.keywords
         
         # Calculate skill matches
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
+        resume_skills_lower = {skill.lower() for skill in resume_skills}
         matched_skills = [skill for skill in required_skills if skill in resume_skills_lower]
         missing_skills = [skill for skill in required_skills if skill not in resume_skills_lower]
         
@@ -202,13 +120,16 @@ class JobMatcher:
         missing_keywords = [kw for kw in job_keywords if kw not in resume_text_lower]
         
         # Calculate similarity score using TF-IDF
-        similarity_score = self._calculate_text_similarity(resume_text, job_data.get('description', ''))
+        similarity_score = self._calculate_text_similarity(
+            resume_text, job_data.get('description', ''), self.registry.description_vector(profile)
+        )
         
         # Calculate skill match percentage
         total_required_skills = len(required_skills) if required_skills else 1
         skill_match_percentage = (len(matched_skills) / total_required_skills) * 100
         
         # Calculate readability score
+        import textstat
         readability_score = textstat.flesch_reading_ease(resume_text)
         
         # Calculate overall score
@@ -232,39 +153,29 @@ class JobMatcher:
     
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract skills from resume text"""
-        # Get all possible skills from job roles
-        all_skills = set()
-        for role_data in self.job_roles_data.values():
-            all_skills.update(role_data.get('required_skills', []))
-            all_skills.update(role_data.get('preferred_skills', []))
-        
-        # Additional common skills
-        additional_skills = [
-            "Leadership", "Communication", "Problem Solving", "Team Work",
-            "Project Management", "Time Management", "Critical Thinking",
-            "Analytical Skills", "Creativity", "Adaptability", "Customer Service",
-            "Sales", "Negotiation", "Presentation", "Writing", "Research"
-        ]
-        
-        all_skills.update(additional_skills)
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in all_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        
-        return list(set(found_skills))
+        # Role skills keep their catalog casing; lowercase base skills are title-cased
+        return [skill if skill != skill.lower() else skill.title()
+                for skill in self.skill_matcher.find_skills(text)]
     
-    def _calculate_text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two texts using TF-IDF"""
+    def _calculate_text_similarity(self, text1: str, text2: str, text2_vector=None) -> float:
+        """Calculate similarity between two texts using the shared TF-IDF model.
+
+        Without a prebuilt corpus model the shared vocabulary only covers the
+        catalog descriptions, so TF-IDF is fitted on the pair itself.
+        """
         if not text1 or not text2:
             return 0.0
         
         try:
-            tfidf_matrix = self.vectorizer.fit_transform([text1, text2])
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            from sklearn.metrics.pairwise import cosine_similarity
+            if not self.registry.has_corpus_model:
+                from sklearn.feature_extraction.text import TfidfVectorizer
+                tfidf_matrix = TfidfVectorizer(stop_words='english', max_features=1000).fit_transform([text1, text2])
+                return float(cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0] * 100)
+            vector1 = self.vectorizer.transform([text1])
+            vector2 = text2_vector if text2_vector is not None else self.vectorizer.transform([text2])
+            # float64 regardless of the model's dtype, matching batch_scoring.score_resumes
+            similarity = cosine_similarity(vector1.astype('float64'), vector2.astype('float64'))[0][0]
             return float(similarity * 100)  # Convert to percentage
         except:
             return 0.0
@@ -274,14 +185,7 @@ class JobMatcher:
                                missing_kw_count: int, sections: Dict[str, str]) -> int:
         """Calculate overall resume score"""
         
-        # Weights for different components
-        weights = {
-            'skills': 0.3,
-            'similarity': 0.2,
-            'keywords': 0.2,
-            'readability': 0.1,
-            'sections': 0.2
-        }
+        weights = SCORE_WEIGHTS
         
         # Skills score (0-100)
         skills_score = min(skill_match_pct, 100)
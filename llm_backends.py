@@ -0,0 +1,207 @@
+"""Chat completion backends used by LLMOptimizer.
+
+OpenAIBackend talks to the OpenAI API or any OpenAI-compatible server (a
+local inference server via base_url). StubBackend is deterministic and
+offline: it returns canned or replayed responses after a configurable
+latency, so the AI pipeline can be benchmarked and load-tested without a
+network. RecordingBackend wraps a real backend and saves its responses
+for StubBackend to replay.
+
+Environment:
+    LLM_BACKEND          "openai" (default) or "stub"
+    LLM_BASE_URL         OpenAI-compatible server URL for the openai backend
+    LLM_STUB_REPLAY      JSONL recording replayed by the stub backend
+    LLM_STUB_LATENCY     Seconds before the stub's first token
+    LLM_STUB_TOKEN_DELAY Seconds between the stub's streamed chunks
+"""
+import abc
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+Messages = List[Dict[str, str]]
+
+
+def request_key(model: str, messages: Messages) -> str:
+    """Stable key for a recorded response"""
+    payload = json.dumps({'model': model, 'messages': messages}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMBackend(abc.ABC):
+    """Chat completion interface; subclasses implement complete and may override stream.
+
+    timeout is the deadline in seconds for the whole call, retries included.
+    """
+
+    name = "base"
+    # Whether the shared on-disk response cache should front this backend
+    use_response_cache = True
+
+    @abc.abstractmethod
+    def complete(self, model: str, messages: Messages, max_tokens: int,
+                 temperature: float, timeout: Optional[float] = None) -> str:
+        """The full completion for messages"""
+
+    def stream(self, model: str, messages: Messages, max_tokens: int,
+               temperature: float, timeout: Optional[float] = None) -> Iterator[str]:
+        """Yield the completion in chunks; by default the whole reply as one chunk"""
+        yield self.complete(model, messages, max_tokens, temperature, timeout)
+
+
+class OpenAIBackend(LLMBackend):
+    """OpenAI API or any OpenAI-compatible server, through the shared pooled client"""
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None):
+        from llm_client import get_llm_client
+        self.base_url = base_url
+        self.name = base_url or "openai"
+        self.client = get_llm_client(api_key, base_url)
+
+    def complete(self, model: str, messages: Messages, max_tokens: int,
+                 temperature: float, timeout: Optional[float] = None) -> str:
+        response = self.client.create_chat_completion(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            timeout=timeout
+        )
+        return response.choices[0].message.content
+
+    def stream(self, model: str, messages: Messages, max_tokens: int,
+               temperature: float, timeout: Optional[float] = None) -> Iterator[str]:
+        stream = self.client.create_chat_completion(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            timeout=timeout,
+            stream=True
+        )
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+
+class StubBackend(LLMBackend):
+    """Deterministic offline backend with canned or replayed responses.
+
+    Responses come from, in order: a recording loaded from replay_path, the
+    responses mapping (request key or section name to text) or callable, and
+    finally a canned reply derived from the prompt.
+    """
+
+    name = "stub"
+    use_response_cache = False
+
+    def __init__(self, responses: Union[Dict[str, str], Callable[[str, Messages], str], None] = None,
+                 replay_path: Optional[str] = None, latency: float = 0.0, token_delay: float = 0.0):
+        self.responses = responses or {}
+        self.latency = latency
+        self.token_delay = token_delay
+        self.recorded: Dict[str, str] = {}
+        self.calls = 0
+        self._lock = threading.Lock()
+        if replay_path:
+            with open(replay_path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self.recorded[record['key']] = record['response']
+
+    def _response(self, model: str, messages: Messages) -> str:
+        key = request_key(model, messages)
+        if key in self.recorded:
+            return self.recorded[key]
+        if callable(self.responses):
+            return self.responses(model, messages)
+        if key in self.responses:
+            return self.responses[key]
+
+        prompt = messages[-1]['content']
+        if 'Respond with a single JSON object' in prompt:
+            # Structured mode: answer every requested key so the reply validates
+            sections = re.findall(r'^\s*- "(\w+)":', prompt, re.MULTILINE)
+            return json.dumps({name: self.responses.get(name, f"Stub suggestion for {name} ({key[:8]})")
+                               for name in sections})
+        section = self._section_of(prompt)
+        return self.responses.get(section, f"Stub suggestion for {section} ({key[:8]})")
+
+    @staticmethod
+    def _section_of(prompt: str) -> str:
+        lowered = prompt.lower()
+        for section, marker in (('summary', 'professional summary'), ('experience', 'experience section'),
+                                ('skills', 'skills section'), ('cover_letter', 'cover letter')):
+            if marker in lowered:
+                return section
+        return 'overall'
+
+    def complete(self, model: str, messages: Messages, max_tokens: int,
+                 temperature: float, timeout: Optional[float] = None) -> str:
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self._response(model, messages)
+
+    def stream(self, model: str, messages: Messages, max_tokens: int,
+               temperature: float, timeout: Optional[float] = None) -> Iterator[str]:
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        for index, chunk in enumerate(re.findall(r'\s*\S+(?:\s+$)?', self._response(model, messages))):
+            if index and self.token_delay:
+                time.sleep(self.token_delay)
+            yield chunk
+
+
+class RecordingBackend(LLMBackend):
+    """Pass requests through to another backend and append every reply to a JSONL recording"""
+
+    def __init__(self, backend: LLMBackend, path: str):
+        self.backend = backend
+        self.path = path
+        self.name = backend.name
+        self.use_response_cache = backend.use_response_cache
+        self._lock = threading.Lock()
+
+    def _record(self, model: str, messages: Messages, response: str):
+        record = {'key': request_key(model, messages), 'model': model, 'response': response}
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def complete(self, model: str, messages: Messages, max_tokens: int,
+                 temperature: float, timeout: Optional[float] = None) -> str:
+        response = self.backend.complete(model, messages, max_tokens, temperature, timeout)
+        self._record(model, messages, response)
+        return response
+
+    def stream(self, model: str, messages: Messages, max_tokens: int,
+               temperature: float, timeout: Optional[float] = None) -> Iterator[str]:
+        parts = []
+        for delta in self.backend.stream(model, messages, max_tokens, temperature, timeout):
+            parts.append(delta)
+            yield delta
+        self._record(model, messages, "".join(parts))
+
+
+def backend_from_env(api_key: Optional[str] = None, base_url: Optional[str] = None) -> Optional[LLMBackend]:
+    """Backend selected by LLM_BACKEND; None when the OpenAI backend has no API key"""
+    if os.getenv("LLM_BACKEND", "openai").lower() == "stub":
+        return StubBackend(
+            replay_path=os.getenv("LLM_STUB_REPLAY") or None,
+            latency=float(os.getenv("LLM_STUB_LATENCY", "0")),
+            token_delay=float(os.getenv("LLM_STUB_TOKEN_DELAY", "0"))
+        )
+    if not api_key:
+        return None
+    return OpenAIBackend(api_key, base_url or os.getenv("LLM_BASE_URL") or None)
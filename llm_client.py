@@ -0,0 +1,161 @@
+"""Process-wide pool of LLM API clients.
+
+One client, and so one keep-alive connection pool, is shared by every
+session that uses the same API key and base URL. Requests are paced by a
+token bucket per API key and retried with jittered exponential backoff on
+rate limits (429), server errors (5xx) and connection failures.
+"""
+import hashlib
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "120"))
+BURST = float(os.getenv("LLM_BURST", "10"))
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 20.0
+MAX_CONNECTIONS = 20
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at rate tokens per second up to capacity"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Block until tokens are available; False if that would take longer than timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class LLMClient:
+    """Shared OpenAI client for one API key and base URL with rate limiting and retries"""
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None,
+                 rate_limiter: Optional[TokenBucket] = None, max_retries: int = MAX_RETRIES,
+                 backoff_base: float = BACKOFF_BASE, backoff_max: float = BACKOFF_MAX):
+        import httpx
+        import openai  # Deferred: only needed once AI optimization is enabled
+        self._openai = openai
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.rate_limiter = rate_limiter or TokenBucket(REQUESTS_PER_MINUTE / 60, BURST)
+        # Retries are handled here so they share the rate limiter; the SDK's own are disabled
+        self.client = openai.OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=0,
+            http_client=httpx.Client(limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS
+            ))
+        )
+
+    def _is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, self._openai.APIConnectionError):
+            return True  # Includes timeouts
+        if isinstance(error, self._openai.APIStatusError):
+            return error.status_code == 429 or error.status_code >= 500
+        return False
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """Full-jitter exponential backoff, never shorter than the server's Retry-After"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        try:
+            delay = max(delay, min(float(retry_after), self.backoff_max))
+        except (TypeError, ValueError):
+            pass
+        return delay
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        """Seconds left before deadline; raises TimeoutError once it has passed"""
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("LLM request deadline exceeded")
+        return remaining
+
+    def create_chat_completion(self, timeout: Optional[float] = None, **kwargs):
+        """chat.completions.create with pacing and retries.
+
+        timeout bounds the whole call: rate-limit waits, every attempt and the
+        backoff between them stop once it expires, and each attempt's HTTP
+        timeout is whatever is left. With stream=True only opening the stream
+        is retried; errors after the first chunk reach the caller.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        attempt = 0
+        while True:
+            if not self.rate_limiter.acquire(timeout=self._remaining(deadline)):
+                raise TimeoutError("LLM request deadline exceeded waiting for the rate limiter")
+            try:
+                return self.client.chat.completions.create(timeout=self._remaining(deadline), **kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    raise
+                delay = self._backoff(attempt, e)
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+
+# Clients kept alive for reuse; the least recently used are dropped beyond this
+MAX_CLIENTS = 16
+
+_clients: "OrderedDict[str, LLMClient]" = OrderedDict()
+_buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+_clients_lock = threading.Lock()
+
+
+def _fingerprint(*parts: Optional[str]) -> str:
+    """Hash used as the registry key so API keys are not kept as dictionary keys"""
+    return hashlib.sha256("\0".join(part or "" for part in parts).encode("utf-8")).hexdigest()
+
+
+def _lru_get(entries: OrderedDict, key: str, create):
+    entry = entries.get(key)
+    if entry is None:
+        entry = entries[key] = create()
+    entries.move_to_end(key)
+    while len(entries) > MAX_CLIENTS:
+        entries.popitem(last=False)
+    return entry
+
+
+def get_llm_client(api_key: str, base_url: Optional[str] = None) -> LLMClient:
+    """Shared client for an API key and base URL; every client for a key shares one rate limiter.
+
+    At most MAX_CLIENTS clients are kept; the least recently used are released.
+    """
+    with _clients_lock:
+        bucket = _lru_get(_buckets, _fingerprint(api_key),
+                          lambda: TokenBucket(REQUESTS_PER_MINUTE / 60, BURST))
+        return _lru_get(_clients, _fingerprint(api_key, base_url),
+                        lambda: LLMClient(api_key, base_url, rate_limiter=bucket))
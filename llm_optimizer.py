@@ -1,203 +1,638 @@
-import openai
-from typing import Dict, Optional
+import asyncio
+import functools
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import json
+import os
+from llm_backends import LLMBackend, backend_from_env
+from llm_cache import LLMResponseCache, get_default_cache
+from prompt_builder import PROMPT_BUDGETS, select_content
+
+# Default model; LLM_MODEL overrides it and per-section choices override both
+MODEL = os.getenv("LLM_MODEL", "gpt-3.5-turbo")
+TEMPERATURE = 0.7
+
+# Completion length per section prompt
+SECTION_MAX_TOKENS = {
+    'summary': 500,
+    'experience': 600,
+    'skills': 500,
+    'overall': 600
+}
+
+
+class _Abandoned(Exception):
+    """The leader gave up before finishing; waiting callers should retry"""
+
+
+class SingleFlight:
+    """Coalesce concurrent requests with the same fingerprint into one in-flight call.
+
+    The first caller (the leader) makes the request; callers arriving while it
+    is in flight wait for the leader's result instead of sending their own.
+    If the leader is cancelled, the flight is dropped and one of the waiting
+    callers takes over as the new leader.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self.requests = 0
+        self.coalesced = 0
+    
+    def join(self, key: str) -> Tuple[Future, bool]:
+        """Future for key's result and whether the caller is the leader"""
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = self._in_flight[key] = Future()
+            self.requests += 1
+            return future, True
+    
+    def finish(self, key: str, result=None, error: Optional[BaseException] = None):
+        """Publish the leader's outcome to every waiting caller"""
+        with self._lock:
+            future = self._in_flight.pop(key)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def abandon(self, key: str):
+        """Drop a flight whose leader was cancelled, waking its followers to retry"""
+        self.finish(key, error=_Abandoned())
+    
+    @staticmethod
+    def wait(future: Future, timeout: Optional[float] = None):
+        """Leader's result for a follower.
+
+        Raises TimeoutError if the leader takes longer than timeout and
+        _Abandoned if it was cancelled, in which case the caller joins again.
+        """
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            raise TimeoutError("Coalesced LLM request did not finish in time")
+    
+    def do(self, key: str, fn: Callable[[], str], timeout: Optional[float] = None) -> str:
+        """fn's result, computed once across concurrent callers with the same key.
+
+        Followers wait at most timeout seconds for the leader.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            future, leader = self.join(key)
+            if leader:
+                break
+            try:
+                return self.wait(future, None if deadline is None else max(deadline - time.monotonic(), 0))
+            except _Abandoned:
+                continue
+        try:
+            result = fn()
+        except Exception as e:
+            self.finish(key, error=e)
+            raise
+        except BaseException:
+            self.abandon(key)
+            raise
+        self.finish(key, result)
+        return result
+    
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._in_flight)
+            }
+
+
+# Shared by every optimizer so identical prompts from different sessions coalesce
+_single_flight = SingleFlight()
+
+
+def get_llm_metrics() -> Dict[str, int]:
+    """Requests sent to the LLM API, calls coalesced onto one already in flight, and calls in flight now"""
+    return _single_flight.metrics()
 
 class LLMOptimizer:
     """Use LLM to generate enhanced resume suggestions and optimizations"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        if api_key:
-            openai.api_key = api_key
-            self.client = openai.OpenAI(api_key=api_key)
-        else:
-            self.client = None
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 max_concurrency: int = 4, timeout: float = 60.0,
+                 cache: Optional[LLMResponseCache] = None,
+                 backend: Optional[LLMBackend] = None,
+                 models: Optional[Dict[str, str]] = None):
+        # base_url points the OpenAI backend at any OpenAI-compatible server (e.g. a local one);
+        # models maps a section ('summary', 'experience', 'skills', 'overall', 'structured',
+        # 'cover_letter') to the model used for it
+        self.api_key = api_key
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.cache = cache
+        self.models = models or {}
+        self.backend = backend or backend_from_env(api_key, base_url)
+        if self.backend is not None and self.cache is None and self.backend.use_response_cache:
+            self.cache = get_default_cache()
+    
+    def model_for(self, section: str) -> str:
+        return self.models.get(section, MODEL)
+    
+    @staticmethod
+    def sections_to_optimize(resume_sections: Dict[str, str]) -> List[str]:
+        """Sections that get a suggestion, in display order"""
+        sections = [section for section in ('summary', 'experience', 'skills') if resume_sections.get(section)]
+        sections.append('overall')
+        return sections
+    
+    def _section_prompts(self, resume_sections: Dict[str, str], job_data: Dict,
+                         analysis_results: Dict) -> List[Tuple[str, str]]:
+        """(section, prompt) pairs for every section that should be optimized"""
+        builders = {
+            'summary': self._summary_prompt,
+            'experience': self._experience_prompt,
+            'skills': self._skills_prompt
+        }
+        prompts = []
+        for section in self.sections_to_optimize(resume_sections):
+            if section == 'overall':
+                prompt = self._overall_prompt(resume_sections, job_data, analysis_results)
+            else:
+                prompt = builders[section](resume_sections[section], job_data, analysis_results)
+            prompts.append((section, prompt))
+        return prompts
+    
+    def _fingerprint(self, model: str, messages: List[Dict[str, str]], max_tokens: int) -> str:
+        """Key for everything that determines a completion, shared by the cache and request coalescing"""
+        return LLMResponseCache.make_key(model, messages, max_tokens=max_tokens,
+                                         temperature=TEMPERATURE, backend=self.backend.name)
+    
+    def _chat(self, prompt: str, max_tokens: int, use_cache: bool = True,
+              validate: Optional[Callable[[str], bool]] = None, model: str = MODEL,
+              timeout: Optional[float] = None) -> str:
+        """Single chat completion served from the response cache when possible.
+
+        Concurrent calls with the same prompt share one request. When validate
+        is given, only responses it accepts are cached. timeout (default
+        self.timeout) bounds the request including its retries.
+        """
+        timeout = timeout or self.timeout
+        messages = [{"role": "user", "content": prompt}]
+        fingerprint = self._fingerprint(model, messages, max_tokens)
+        use_cache = use_cache and self.cache is not None
+        if use_cache:
+            cached = self.cache.get(fingerprint)
+            if cached is not None:
+                return cached
+        
+        def request() -> str:
+            content = self.backend.complete(model, messages, max_tokens, TEMPERATURE, timeout)
+            if use_cache and content and (validate is None or validate(content)):
+                self.cache.put(fingerprint, content)
+            return content
+        
+        return _single_flight.do(fingerprint, request, timeout)
+    
+    def _stream_chat(self, prompt: str, max_tokens: int, use_cache: bool = True,
+                     model: str = MODEL) -> Iterator[str]:
+        """Yield a chat completion as it arrives; the assembled reply is cached once complete.
+
+        A caller whose prompt is already in flight receives the full reply as a
+        single chunk once that request finishes, waiting at most self.timeout.
+        """
+        messages = [{"role": "user", "content": prompt}]
+        fingerprint = self._fingerprint(model, messages, max_tokens)
+        use_cache = use_cache and self.cache is not None
+        if use_cache:
+            cached = self.cache.get(fingerprint)
+            if cached is not None:
+                yield cached
+                return
+        
+        deadline = time.monotonic() + self.timeout
+        while True:
+            future, leader = _single_flight.join(fingerprint)
+            if leader:
+                break
+            try:
+                yield _single_flight.wait(future, max(deadline - time.monotonic(), 0))
+                return
+            except _Abandoned:
+                continue  # The leader's consumer went away; take over or follow the new leader
+        
+        parts = []
+        try:
+            for delta in self.backend.stream(model, messages, max_tokens, TEMPERATURE, self.timeout):
+                parts.append(delta)
+                yield delta
+        except GeneratorExit:
+            # Only this consumer stopped listening; let a follower re-issue the request
+            _single_flight.abandon(fingerprint)
+            raise
+        except Exception as e:
+            _single_flight.finish(fingerprint, error=e)
+            raise
+        
+        content = "".join(parts)
+        if use_cache and content:
+            self.cache.put(fingerprint, content)
+        _single_flight.finish(fingerprint, content)
+    
+    def _stream_prompt(self, section: str, prompt: str, use_cache: bool = True) -> Iterator[str]:
+        """Stream one section prompt, ending with an error note instead of raising"""
+        started = False
+        try:
+            for delta in self._stream_chat(prompt, SECTION_MAX_TOKENS[section], use_cache,
+                                           model=self.model_for(section)):
+                started = True
+                yield delta
+        except Exception as e:
+            note = f"AI optimization unavailable: {str(e)}"
+            yield "\n\n" + note if started else note
+    
+    def _complete_section(self, section: str, prompt: str, use_cache: bool = True) -> str:
+        """Run one section prompt, returning an error note instead of raising"""
+        try:
+            return self._chat(prompt, SECTION_MAX_TOKENS[section], use_cache,
+                              model=self.model_for(section))
+        except Exception as e:
+            return f"AI optimization unavailable: {str(e)}"
     
     def optimize_resume_sections(self, resume_sections: Dict[str, str], 
-                               job_data: Dict, analysis_results: Dict) -> Dict[str, str]:
-        """Generate AI-powered suggestions for each resume section"""
-        if not self.client:
+                               job_data: Dict, analysis_results: Dict,
+                               use_cache: bool = True, mode: str = "per_section") -> Dict[str, str]:
+        """Generate AI-powered suggestions for each resume section.
+
+        mode="structured" asks for every section in one JSON response and
+        falls back to per-section calls for anything it fails to return.
+        Responses are served from the LLM response cache unless use_cache is False.
+        """
+        if not self.backend:
             return {}
         
-        optimizations = {}
+        if mode == "structured":
+            return self._optimize_structured(resume_sections, job_data, analysis_results, use_cache)
+        if mode != "per_section":
+            raise ValueError(f"Unknown optimization mode: {mode}")
         
-        # Optimize summary/objective
-        if resume_sections.get('summary'):
-            optimizations['summary'] = self._optimize_summary(
-                resume_sections['summary'], job_data, analysis_results
+        optimizers = {
+            'summary': self._optimize_summary,
+            'experience': self._optimize_experience,
+            'skills': self._optimize_skills
+        }
+        optimizations = {}
+        for section in self.sections_to_optimize(resume_sections):
+            if section == 'overall':
+                optimizations[section] = self._generate_overall_suggestions(
+                    resume_sections, job_data, analysis_results, use_cache
+                )
+            else:
+                optimizations[section] = optimizers[section](
+                    resume_sections[section], job_data, analysis_results, use_cache
+                )
+        return optimizations
+    
+    def _optimize_summary(self, summary_text: str, job_data: Dict, analysis_results: Dict,
+                          use_cache: bool = True) -> str:
+        """Optimize the professional summary section"""
+        return self._complete_section('summary', self._summary_prompt(summary_text, job_data, analysis_results),
+                                      use_cache)
+    
+    def _optimize_experience(self, experience_text: str, job_data: Dict, analysis_results: Dict,
+                             use_cache: bool = True) -> str:
+        """Optimize the work experience section"""
+        return self._complete_section('experience',
+                                      self._experience_prompt(experience_text, job_data, analysis_results),
+                                      use_cache)
+    
+    def _optimize_skills(self, skills_text: str, job_data: Dict, analysis_results: Dict,
+                         use_cache: bool = True) -> str:
+        """Optimize the skills section"""
+        return self._complete_section('skills', self._skills_prompt(skills_text, job_data, analysis_results),
+                                      use_cache)
+    
+    def _generate_overall_suggestions(self, resume_sections: Dict[str, str], job_data: Dict,
+                                      analysis_results: Dict, use_cache: bool = True) -> str:
+        """Generate overall resume improvement suggestions"""
+        return self._complete_section('overall',
+                                      self._overall_prompt(resume_sections, job_data, analysis_results),
+                                      use_cache)
+    
+    def _optimize_structured(self, resume_sections: Dict[str, str], job_data: Dict,
+                             analysis_results: Dict, use_cache: bool = True) -> Dict[str, str]:
+        """One request carrying the shared context once, parsed back into per-section results"""
+        sections = self.sections_to_optimize(resume_sections)
+        prompt = self._structured_prompt(resume_sections, job_data, analysis_results, sections)
+        max_tokens = sum(SECTION_MAX_TOKENS[section] for section in sections)
+        try:
+            content = self._chat(
+                prompt, max_tokens, use_cache,
+                validate=lambda text: len(self._parse_structured_response(text, sections) or {}) == len(sections),
+                model=self.model_for('structured')
             )
+            parsed = self._parse_structured_response(content, sections)
+        except Exception:
+            parsed = None
         
-        # Optimize experience section
-        if resume_sections.get('experience'):
-            optimizations['experience'] = self._optimize_experience(
-                resume_sections['experience'], job_data, analysis_results
-            )
+        if parsed is None:
+            parsed = {}
         
-        # Optimize skills section
-        if resume_sections.get('skills'):
-            optimizations['skills'] = self._optimize_skills(
-                resume_sections['skills'], job_data, analysis_results
-            )
+        # Fall back to individual prompts for any section the structured reply missed
+        missing = [section for section in sections if section not in parsed]
+        if missing:
+            for section, section_prompt in self._section_prompts(resume_sections, job_data, analysis_results):
+                if section in missing:
+                    parsed[section] = self._complete_section(section, section_prompt, use_cache)
+        
+        return {section: parsed[section] for section in sections}
+    
+    def _structured_prompt(self, resume_sections: Dict[str, str], job_data: Dict,
+                           analysis_results: Dict, sections: List[str]) -> str:
+        """Build a single prompt that asks for every section as a JSON object"""
+        section_texts = {
+            'summary': ("Current Summary", self._budgeted(
+                'summary', resume_sections.get('summary', ''), job_data, analysis_results)),
+            'experience': ("Current Experience", self._budgeted(
+                'experience', resume_sections.get('experience', ''), job_data, analysis_results)),
+            'skills': ("Current Skills", self._budgeted(
+                'skills', resume_sections.get('skills', ''), job_data, analysis_results))
+        }
+        tasks = {
+            'summary': "an improved 2-3 sentence summary, specific enhancement suggestions and keywords to incorporate",
+            'experience': "stronger action verbs, ways to quantify achievements, better alignment with the role, keywords to incorporate and structure improvements",
+            'skills': "how to organize and categorize the skills, skills to add or develop, how to show proficiency and which skills to prioritize",
+            'overall': "the top 3 strategic improvements, industry-specific advice, common mistakes to avoid, next steps for skill development and how to stand out"
+        }
         
-        # Generate overall improvement suggestions
-        optimizations['overall'] = self._generate_overall_suggestions(
-            resume_sections, job_data, analysis_results
+        resume_content = "\n\n".join(
+            f"{section_texts[section][0]}:\n{section_texts[section][1]}"
+            for section in sections if section in section_texts
         )
+        task_lines = "\n".join(f'- "{section}": {tasks[section]}' for section in sections)
         
-        return optimizations
+        return f"""
+        As a professional resume writer and senior career coach, review this resume for the target role below.
+
+        Target Role: {job_data.get('description', 'Professional role')}
+        - Required Skills: {', '.join(job_data.get('required_skills', [])[:10])}
+        - Key Keywords: {', '.join(job_data.get('keywords', [])[:10])}
+
+        Current Analysis:
+        - Overall Score: {analysis_results.get('overall_score', 0)}/100
+        - Skill Match: {analysis_results.get('skill_match_percentage', 0):.1f}%
+        - Missing Skills: {', '.join(analysis_results.get('missing_skills', [])[:10])}
+        - Sections Present: {', '.join([k for k, v in resume_sections.items() if v.strip()])}
+
+        {resume_content}
+
+        Respond with a single JSON object and nothing else. Use exactly these keys, each with a string value of actionable, specific advice:
+        {task_lines}
+        """
     
-    def _optimize_summary(self, summary_text: str, job_data: Dict, analysis_results: Dict) -> str:
-        """Optimize the professional summary section"""
+    @staticmethod
+    def _parse_structured_response(content: str, sections: List[str]) -> Optional[Dict[str, str]]:
+        """Parse and validate a structured reply; None if it is not usable"""
+        if not content:
+            return None
+        # Tolerate Markdown code fences or stray text around the JSON object
+        match = re.search(r"\{.*\}", content, re.DOTALL)
+        if not match:
+            return None
         try:
-            prompt = f"""
-            As a professional resume writer, please improve this professional summary for a {job_data.get('description', 'professional role')}:
+            data = json.loads(match.group(0))
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        
+        parsed = {}
+        for section in sections:
+            value = data.get(section)
+            if isinstance(value, list) and all(isinstance(item, str) for item in value):
+                value = "\n".join(value)
+            if isinstance(value, str) and value.strip():
+                parsed[section] = value.strip()
+        return parsed if parsed else None
+    
+    async def optimize_resume_sections_async(self, resume_sections: Dict[str, str],
+                                             job_data: Dict, analysis_results: Dict,
+                                             max_concurrency: Optional[int] = None,
+                                             timeout: Optional[float] = None,
+                                             use_cache: bool = True) -> Dict[str, str]:
+        """Generate the same suggestions as optimize_resume_sections, sending section prompts concurrently.
 
-            Current Summary:
-            {summary_text}
+        At most max_concurrency requests are in flight at once and each call is
+        bounded by timeout seconds, so total latency is close to the slowest call.
+        Calls run on the backend in executor threads, so they share its pooled
+        client, rate limiter and retries with every other request. Response
+        cache reads and writes happen inside _chat on those threads too, so the
+        synchronous SQLite I/O never blocks the event loop. The timeout
+        is handed to the backend as the call's deadline, so retries and backoff
+        stop with it instead of outliving the awaiting task.
+        """
+        if not self.backend:
+            return {}
+        
+        max_concurrency = max_concurrency or self.max_concurrency
+        timeout = timeout or self.timeout
+        semaphore = asyncio.Semaphore(max_concurrency)
+        loop = asyncio.get_running_loop()
+        
+        async def complete(section: str, prompt: str) -> str:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        loop.run_in_executor(None, functools.partial(
+                            self._chat, prompt, SECTION_MAX_TOKENS[section], use_cache,
+                            model=self.model_for(section), timeout=timeout
+                        )),
+                        timeout
+                    )
+                except (asyncio.TimeoutError, TimeoutError):
+                    return f"AI optimization unavailable: request timed out after {timeout:.0f}s"
+                except Exception as e:
+                    return f"AI optimization unavailable: {str(e)}"
+        
+        prompts = self._section_prompts(resume_sections, job_data, analysis_results)
+        results = await asyncio.gather(*(complete(section, prompt) for section, prompt in prompts))
+        
+        return {section: result for (section, _), result in zip(prompts, results)}
+    
+    def optimize_resume_sections_concurrent(self, resume_sections: Dict[str, str],
+                                            job_data: Dict, analysis_results: Dict,
+                                            use_cache: bool = True) -> Dict[str, str]:
+        """Blocking wrapper around optimize_resume_sections_async for synchronous callers"""
+        return asyncio.run(self.optimize_resume_sections_async(
+            resume_sections, job_data, analysis_results, use_cache=use_cache
+        ))
+    
+    def stream_section(self, section: str, resume_sections: Dict[str, str], job_data: Dict,
+                       analysis_results: Dict, use_cache: bool = True) -> Iterator[str]:
+        """Yield the suggestion for a single section token by token"""
+        if not self.backend:
+            return
+        prompts = dict(self._section_prompts(resume_sections, job_data, analysis_results))
+        if section not in prompts:
+            raise ValueError(f"Nothing to optimize for section: {section}")
+        yield from self._stream_prompt(section, prompts[section], use_cache)
+    
+    def stream_resume_sections(self, resume_sections: Dict[str, str], job_data: Dict,
+                               analysis_results: Dict, use_cache: bool = True,
+                               max_concurrency: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+        """Yield (section, text chunk) pairs as tokens arrive from every section.
 
-            Job Requirements:
-            - Required Skills: {', '.join(job_data.get('required_skills', [])[:10])}
-            - Key Keywords: {', '.join(job_data.get('keywords', [])[:10])}
+        Sections stream concurrently, so chunks of different sections are
+        interleaved; joining the chunks of a section gives its full suggestion.
+        Closing the generator early stops the remaining streams.
+        """
+        if not self.backend:
+            return
+        
+        prompts = self._section_prompts(resume_sections, job_data, analysis_results)
+        chunks = queue.Queue()
+        finished = object()
+        stopped = threading.Event()
+        
+        def pump(section: str, prompt: str):
+            try:
+                for delta in self._stream_prompt(section, prompt, use_cache):
+                    if stopped.is_set():
+                        return
+                    chunks.put((section, delta))
+            finally:
+                chunks.put((section, finished))
+        
+        executor = ThreadPoolExecutor(max_workers=max_concurrency or self.max_concurrency)
+        try:
+            for section, prompt in prompts:
+                executor.submit(pump, section, prompt)
+            remaining = len(prompts)
+            while remaining:
+                section, delta = chunks.get()
+                if delta is finished:
+                    remaining -= 1
+                else:
+                    yield section, delta
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False)
+    
+    @staticmethod
+    def _budgeted(budget: str, text: str, job_data: Dict, analysis_results: Optional[Dict] = None) -> str:
+        """Section text fitted to its prompt token budget, keeping the most relevant lines"""
+        priority_skills = (analysis_results or {}).get('missing_skills') or job_data.get('required_skills', [])
+        return select_content(text, PROMPT_BUDGETS[budget], priority_skills, job_data.get('keywords', []))
+    
+    def _summary_prompt(self, summary_text: str, job_data: Dict, analysis_results: Dict) -> str:
+        """Build the prompt for the professional summary section"""
+        return f"""
+        As a professional resume writer, please improve this professional summary for a {job_data.get('description', 'professional role')}:
 
-            Current Analysis:
-            - Skill Match: {analysis_results.get('skill_match_percentage', 0):.1f}%
-            - Missing Skills: {', '.join(analysis_results.get('missing_skills', [])[:5])}
+        Current Summary:
+        {self._budgeted('summary', summary_text, job_data, analysis_results)}
 
-            Please provide:
-            1. An improved version of the summary (2-3 sentences)
-            2. Specific suggestions for enhancement
-            3. Keywords to naturally incorporate
+        Job Requirements:
+        - Required Skills: {', '.join(job_data.get('required_skills', [])[:10])}
+        - Key Keywords: {', '.join(job_data.get('keywords', [])[:10])}
 
-            Focus on making it more compelling and aligned with the target role while maintaining authenticity.
-            """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500,
-                temperature=0.7
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
-            return f"AI optimization unavailable: {str(e)}"
+        Current Analysis:
+        - Skill Match: {analysis_results.get('skill_match_percentage', 0):.1f}%
+        - Missing Skills: {', '.join(analysis_results.get('missing_skills', [])[:5])}
+
+        Please provide:
+        1. An improved version of the summary (2-3 sentences)
+        2. Specific suggestions for enhancement
+        3. Keywords to naturally incorporate
+
+        Focus on making it more compelling and aligned with the target role while maintaining authenticity.
+        """
     
-    def _optimize_experience(self, experience_text: str, job_data: Dict, analysis_results: Dict) -> str:
-        """Optimize the work experience section"""
-        try:
-            prompt = f"""
-            As a professional resume writer, please provide suggestions to improve this work experience section for a {job_data.get('description', 'professional role')}:
+    def _experience_prompt(self, experience_text: str, job_data: Dict, analysis_results: Dict) -> str:
+        """Build the prompt for the work experience section"""
+        return f"""
+        As a professional resume writer, please provide suggestions to improve this work experience section for a {job_data.get('description', 'professional role')}:
 
-            Current Experience:
-            {experience_text[:1000]}...  # Truncate for API limits
+        Current Experience:
+        {self._budgeted('experience', experience_text, job_data, analysis_results)}
 
-            Target Role Requirements:
-            - Required Skills: {', '.join(job_data.get('required_skills', [])[:8])}
-            - Important Keywords: {', '.join(job_data.get('keywords', [])[:8])}
+        Target Role Requirements:
+        - Required Skills: {', '.join(job_data.get('required_skills', [])[:8])}
+        - Important Keywords: {', '.join(job_data.get('keywords', [])[:8])}
 
-            Please provide:
-            1. Suggestions for stronger action verbs
-            2. Ways to quantify achievements
-            3. How to better align with target role requirements
-            4. Keywords to naturally incorporate
-            5. Structure improvements
+        Please provide:
+        1. Suggestions for stronger action verbs
+        2. Ways to quantify achievements
+        3. How to better align with target role requirements
+        4. Keywords to naturally incorporate
+        5. Structure improvements
 
-            Focus on making accomplishments more impactful and relevant to the target role.
-            """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=600,
-                temperature=0.7
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
-            return f"AI optimization unavailable: {str(e)}"
+        Focus on making accomplishments more impactful and relevant to the target role.
+        """
     
-    def _optimize_skills(self, skills_text: str, job_data: Dict, analysis_results: Dict) -> str:
-        """Optimize the skills section"""
-        try:
-            missing_skills = analysis_results.get('missing_skills', [])[:10]
-            
-            prompt = f"""
-            As a professional resume writer, please provide suggestions to improve this skills section:
+    def _skills_prompt(self, skills_text: str, job_data: Dict, analysis_results: Dict) -> str:
+        """Build the prompt for the skills section"""
+        missing_skills = analysis_results.get('missing_skills', [])[:10]
+        
+        return f"""
+        As a professional resume writer, please provide suggestions to improve this skills section:
 
-            Current Skills:
-            {skills_text}
+        Current Skills:
+        {self._budgeted('skills', skills_text, job_data, analysis_results)}
 
-            Target Role Requirements:
-            - Required Skills: {', '.join(job_data.get('required_skills', [])[:10])}
-            - Missing Skills: {', '.join(missing_skills)}
+        Target Role Requirements:
+        - Required Skills: {', '.join(job_data.get('required_skills', [])[:10])}
+        - Missing Skills: {', '.join(missing_skills)}
 
-            Please provide:
-            1. How to better organize and present current skills
-            2. Suggestions for skills to add or develop
-            3. How to categorize skills (technical vs. soft skills)
-            4. Ways to demonstrate proficiency levels
-            5. Skills that should be prioritized for this role
+        Please provide:
+        1. How to better organize and present current skills
+        2. Suggestions for skills to add or develop
+        3. How to categorize skills (technical vs. soft skills)
+        4. Ways to demonstrate proficiency levels
+        5. Skills that should be prioritized for this role
 
-            Focus on making the skills section more comprehensive and aligned with the target role.
-            """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500,
-                temperature=0.7
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
-            return f"AI optimization unavailable: {str(e)}"
+        Focus on making the skills section more comprehensive and aligned with the target role.
+        """
     
-    def _generate_overall_suggestions(self, resume_sections: Dict[str, str], 
-                                    job_data: Dict, analysis_results: Dict) -> str:
-        """Generate overall resume improvement suggestions"""
-        try:
-            overall_score = analysis_results.get('overall_score', 0)
-            skill_match = analysis_results.get('skill_match_percentage', 0)
-            
-            prompt = f"""
-            As a senior career coach, please provide strategic advice for improving this resume:
+    def _overall_prompt(self, resume_sections: Dict[str, str], 
+                        job_data: Dict, analysis_results: Dict) -> str:
+        """Build the prompt for overall improvement suggestions"""
+        overall_score = analysis_results.get('overall_score', 0)
+        skill_match = analysis_results.get('skill_match_percentage', 0)
+        
+        return f"""
+        As a senior career coach, please provide strategic advice for improving this resume:
 
-            Resume Analysis:
-            - Overall Score: {overall_score}/100
-            - Skill Match: {skill_match:.1f}%
-            - Sections Present: {', '.join([k for k, v in resume_sections.items() if v.strip()])}
+        Resume Analysis:
+        - Overall Score: {overall_score}/100
+        - Skill Match: {skill_match:.1f}%
+        - Sections Present: {', '.join([k for k, v in resume_sections.items() if v.strip()])}
 
-            Target Role: {job_data.get('description', 'Professional role')}
-            Top Missing Skills: {', '.join(analysis_results.get('missing_skills', [])[:5])}
+        Target Role: {job_data.get('description', 'Professional role')}
+        Top Missing Skills: {', '.join(analysis_results.get('missing_skills', [])[:5])}
 
-            Please provide:
-            1. Top 3 strategic improvements to focus on
-            2. Industry-specific advice for this role
-            3. Common mistakes to avoid
-            4. Next steps for skill development
-            5. How to stand out from other candidates
+        Please provide:
+        1. Top 3 strategic improvements to focus on
+        2. Industry-specific advice for this role
+        3. Common mistakes to avoid
+        4. Next steps for skill development
+        5. How to stand out from other candidates
 
-            Provide actionable, specific advice that will have the biggest impact on job search success.
-            """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=600,
-                temperature=0.7
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
-            return f"AI optimization unavailable: {str(e)}"
+        Provide actionable, specific advice that will have the biggest impact on job search success.
+        """
     
     def generate_cover_letter_suggestions(self, resume_sections: Dict[str, str], 
-                                        job_data: Dict) -> str:
+                                        job_data: Dict, use_cache: bool = True) -> str:
         """Generate cover letter suggestions based on resume and job requirements"""
-        if not self.client:
+        if not self.backend:
             return "AI optimization not available"
         
         try:
@@ -205,9 +640,9 @@ class LLMOptimizer:
             Based on this resume analysis, provide suggestions for writing a compelling cover letter:
 
             Resume Highlights:
-            - Summary: {resume_sections.get('summary', 'Not provided')[:200]}
-            - Key Skills: {resume_sections.get('skills', 'Not provided')[:200]}
-            - Experience: {resume_sections.get('experience', 'Not provided')[:300]}
+            - Summary: {self._budgeted('cover_letter_summary', resume_sections.get('summary', ''), job_data) or 'Not provided'}
+            - Key Skills: {self._budgeted('cover_letter_skills', resume_sections.get('skills', ''), job_data) or 'Not provided'}
+            - Experience: {self._budgeted('cover_letter_experience', resume_sections.get('experience', ''), job_data) or 'Not provided'}
 
             Target Role: {job_data.get('description', 'Professional role')}
             Required Skills: {', '.join(job_data.get('required_skills', [])[:8])}
@@ -222,14 +657,7 @@ class LLMOptimizer:
             Focus on making the candidate stand out while staying authentic.
             """
             
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=600,
-                temperature=0.7
-            )
-            
-            return response.choices[0].message.content
+            return self._chat(prompt, 600, use_cache, model=self.model_for('cover_letter'))
             
         except Exception as e:
             return f"Cover letter suggestions unavailable: {str(e)}"
\ No newline at end of file
@@ -0,0 +1,45 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+def bounded_imap_unordered(executor: Executor, fn: Callable[[T], object],
+                           items: Iterable[T], max_in_flight: int) -> Iterator[Tuple[T, Future]]:
+    """Submit fn(item) for each item, keeping at most max_in_flight tasks pending.
+
+    Yields (item, future) pairs in completion order. Items are pulled from the
+    iterable lazily, so arbitrarily large inputs run in constant memory.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    
+    items = iter(items)
+    pending = {executor.submit(fn, item): item for item in islice(items, max_in_flight)}
+    
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future
+        
+        for item in islice(items, max_in_flight - len(pending)):
+            pending[executor.submit(fn, item)] = item
+
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Process-wide pool with one worker per CPU, started once and reused by every caller"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # spawn: callers such as Streamlit run threads, which makes forking unsafe
+            _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+        return _process_pool
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+ParseResult = Tuple[str, Dict[str, str]]
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "parses")
+
+
+class ParseCache:
+    """Two-tier cache of parsed resumes keyed by file content.
+
+    Entries live in an in-memory LRU and, optionally, in a directory of JSON
+    files capped at max_disk_bytes. Disk entries are evicted least recently
+    used first, so the directory can be shared by several processes.
+    """
+
+    def __init__(self, max_entries: int = 128, cache_dir: Optional[str] = None,
+                 max_disk_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, ParseResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _, _, size in self._disk_entries())
+
+    @staticmethod
+    def make_key(data: bytes, version: str) -> str:
+        """Content address for a file: SHA-256 of the parser version and file bytes"""
+        digest = hashlib.sha256(version.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[ParseResult]:
+        """Return the cached (text, sections) for key, or None on a miss"""
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+
+        if result is None:
+            result = self._read_disk(key)
+            if result is None:
+                return None
+            self._remember(key, result)
+
+        text, sections = result
+        return text, dict(sections)  # Callers get their own sections dict
+
+    def put(self, key: str, text: str, sections: Dict[str, str]):
+        """Store a parse result in both tiers"""
+        result = (text, dict(sections))
+        self._remember(key, result)
+        self._write_disk(key, result)
+
+    def clear(self):
+        """Drop all cached entries from memory and disk"""
+        with self._lock:
+            self._memory.clear()
+            for path, _, _ in self._disk_entries():
+                self._remove(path)
+            self._disk_bytes = 0
+
+    def _remember(self, key: str, result: ParseResult):
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[ParseResult]:
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+            os.utime(path)  # Mark as recently used for eviction
+        except (OSError, ValueError):
+            return None
+        return payload['text'], payload['sections']
+
+    def _write_disk(self, key: str, result: ParseResult):
+        if not self.cache_dir:
+            return
+        text, sections = result
+        data = json.dumps({'text': text, 'sections': sections}).encode("utf-8")
+        if len(data) > self.max_disk_bytes:
+            return
+
+        try:
+            # Write to a temporary file first so readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            return
+
+        with self._lock:
+            self._disk_bytes += len(data)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _disk_entries(self):
+        """List (path, mtime, size) for every entry in the cache directory"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # Evicted concurrently by another process
+            entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _evict_disk(self):
+        """Remove least recently used disk entries until under the size cap"""
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[1])
+        # Re-sync with the directory, which other processes may also write to
+        self._disk_bytes = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            self._remove(path)
+            self._disk_bytes -= size
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> ParseCache:
+    """Process-wide parse cache, configured from RESUME_PARSE_CACHE_DIR"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ParseCache(
+                cache_dir=os.getenv("RESUME_PARSE_CACHE_DIR", DEFAULT_CACHE_DIR)
+            )
+        return _default_cache
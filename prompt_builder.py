@@ -0,0 +1,128 @@
+"""Token-budgeted selection of resume content for LLM prompts.
+
+Instead of cutting sections at a fixed character offset, prompts spend a
+per-call token budget on the most useful lines: bullets that mention the
+skills the candidate is missing or the role's keywords, and sentences with
+measurable results. Selected lines keep their original order.
+
+Tokens are counted with tiktoken when it is installed and estimated from
+character and word counts otherwise.
+"""
+import functools
+import math
+import re
+from typing import Iterable, List, Optional
+
+# Token budgets for resume content in each prompt
+PROMPT_BUDGETS = {
+    'summary': 150,
+    'experience': 250,
+    'skills': 150,
+    'cover_letter_summary': 50,
+    'cover_letter_skills': 50,
+    'cover_letter_experience': 75
+}
+
+# Heuristic calibrated against cl100k_base on English resume text
+CHARS_PER_TOKEN = 4.0
+TOKENS_PER_WORD = 1.3
+
+MISSING_SKILL_WEIGHT = 3.0
+METRIC_WEIGHT = 2.0
+KEYWORD_WEIGHT = 1.0
+
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9])')
+_BULLET_PREFIX = re.compile(r'^[\s•\-*–·]+')
+_METRIC = re.compile(
+    r'[$€£]\s?\d|\d+(?:[.,]\d+)?\s*(?:%|percent\b|x\b|k\b|m\b|\+)|\b\d{2,}\b',
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding():
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def estimate_tokens(text: str) -> int:
+    """Token count of text under the chat models' tokenizer, or a close estimate"""
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return math.ceil(max(len(text) / CHARS_PER_TOKEN, len(text.split()) * TOKENS_PER_WORD))
+
+
+def split_units(text: str) -> List[str]:
+    """Split a section into bullets/lines, and long lines into sentences"""
+    units = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if _BULLET_PREFIX.match(line) or len(line) < 200:
+            units.append(line)
+        else:
+            units.extend(sentence.strip() for sentence in _SENTENCE_SPLIT.split(line) if sentence.strip())
+    return units
+
+
+def _term_pattern(terms: Iterable[str]) -> Optional[re.Pattern]:
+    terms = sorted({term.lower() for term in terms if term}, key=len, reverse=True)
+    if not terms:
+        return None
+    return re.compile(r'(?<!\w)(' + '|'.join(re.escape(term) for term in terms) + r')(?!\w)', re.IGNORECASE)
+
+
+def score_unit(unit: str, missing_pattern: Optional[re.Pattern] = None,
+               keyword_pattern: Optional[re.Pattern] = None) -> float:
+    """Value of a line to the prompt: missing-skill mentions, metrics and keywords"""
+    score = 0.0
+    if missing_pattern is not None:
+        score += MISSING_SKILL_WEIGHT * len({m.lower() for m in missing_pattern.findall(unit)})
+    if _METRIC.search(unit):
+        score += METRIC_WEIGHT
+    if keyword_pattern is not None:
+        score += KEYWORD_WEIGHT * len({m.lower() for m in keyword_pattern.findall(unit)})
+    return score
+
+
+def _truncate(text: str, budget: int) -> str:
+    """Cut a single unit to roughly budget tokens at a word boundary"""
+    words = text.split()
+    while words and estimate_tokens(" ".join(words)) > budget:
+        words = words[:max(1, int(len(words) * 0.8))] if len(words) > 1 else []
+    return " ".join(words)
+
+
+def select_content(text: str, budget: int, missing_skills: Iterable[str] = (),
+                   keywords: Iterable[str] = ()) -> str:
+    """Highest-value lines of text that fit within budget tokens, in original order"""
+    if not text or budget <= 0:
+        return ""
+    if estimate_tokens(text) <= budget:
+        return text.strip()
+
+    units = split_units(text)
+    missing_pattern = _term_pattern(missing_skills)
+    keyword_pattern = _term_pattern(keywords)
+    ranked = sorted(range(len(units)),
+                    key=lambda i: (-score_unit(units[i], missing_pattern, keyword_pattern), i))
+
+    chosen = []
+    remaining = budget
+    for index in ranked:
+        # Lines are joined with newlines, which cost about a token each
+        cost = estimate_tokens(units[index]) + 1
+        if cost <= remaining:
+            chosen.append(index)
+            remaining -= cost
+
+    if not chosen:
+        return _truncate(units[ranked[0]], budget) if units else ""
+    return "\n".join(units[i] for i in sorted(chosen))
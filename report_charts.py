@@ -0,0 +1,229 @@
+"""Charts embedded in the PDF report, drawn headlessly with matplotlib.
+
+Each chart is rendered from a small, rounded set of inputs, and the PNG is
+cached under a hash of those inputs, so resumes with the same score profile
+share images. render_charts_batch renders the distinct charts of a whole
+batch in a process pool.
+"""
+import hashlib
+import io
+import json
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+CHART_KINDS = ('radar', 'skills_gap', 'keyword_coverage')
+
+CHART_TITLES = {
+    'radar': 'Score Profile',
+    'skills_gap': 'Skills Gap',
+    'keyword_coverage': 'Keyword Coverage'
+}
+
+RADAR_CATEGORIES = ['Skills Match', 'Keywords', 'Experience', 'Education', 'Format', 'Readability']
+
+# Longest skill lists drawn in the skills-gap chart
+MAX_CHART_SKILLS = 10
+
+FIGURE_SIZE = (6, 4)
+DPI = 110
+
+COLORS = {
+    'primary': '#667eea',
+    'success': '#28a745',
+    'danger': '#dc3545',
+    'muted': '#dee2e6'
+}
+
+
+def _keyword_percentage(analysis: Dict) -> float:
+    matched = len(analysis['matched_keywords'])
+    return matched / max(matched + len(analysis['missing_keywords']), 1) * 100
+
+
+def chart_inputs(analysis: Dict) -> Dict[str, Dict]:
+    """Inputs each chart is drawn from, rounded so equivalent profiles hash alike"""
+    scores = [
+        analysis['skill_match_percentage'],
+        _keyword_percentage(analysis),
+        analysis.get('experience_score', 75),
+        analysis.get('education_score', 80),
+        analysis.get('format_score', 85),
+        analysis['readability_score']
+    ]
+    return {
+        'radar': {'scores': [round(min(max(score, 0), 100)) for score in scores]},
+        'skills_gap': {
+            'matched': list(analysis['matched_skills'][:MAX_CHART_SKILLS]),
+            'missing': list(analysis['missing_skills'][:MAX_CHART_SKILLS])
+        },
+        'keyword_coverage': {
+            'matched': len(analysis['matched_keywords']),
+            'missing': len(analysis['missing_keywords'])
+        }
+    }
+
+
+def chart_key(kind: str, inputs: Dict) -> str:
+    payload = json.dumps({'kind': kind, 'inputs': inputs}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _figure():
+    import matplotlib
+    matplotlib.use("Agg")  # Headless: never touch a display
+    from matplotlib.figure import Figure
+    return Figure(figsize=FIGURE_SIZE, dpi=DPI)
+
+
+def _draw_radar(fig, inputs: Dict):
+    scores = inputs['scores']
+    angles = [2 * math.pi * i / len(scores) for i in range(len(scores))]
+    ax = fig.add_subplot(projection='polar')
+    ax.plot(angles + angles[:1], scores + scores[:1], color=COLORS['primary'], linewidth=2)
+    ax.fill(angles + angles[:1], scores + scores[:1], color=COLORS['primary'], alpha=0.25)
+    ax.set_xticks(angles)
+    ax.set_xticklabels(RADAR_CATEGORIES, fontsize=8)
+    ax.set_ylim(0, 100)
+    ax.set_yticks([25, 50, 75, 100])
+    ax.tick_params(axis='y', labelsize=7)
+
+
+def _draw_skills_gap(fig, inputs: Dict):
+    matched, missing = inputs['matched'], inputs['missing']
+    ax = fig.add_subplot()
+    labels = matched + missing
+    if not labels:
+        ax.text(0.5, 0.5, 'No required skills', ha='center', va='center')
+        ax.axis('off')
+        return
+    colors = [COLORS['success']] * len(matched) + [COLORS['danger']] * len(missing)
+    positions = list(range(len(labels)))[::-1]
+    ax.barh(positions, [1] * len(labels), color=colors)
+    ax.set_yticks(positions)
+    ax.set_yticklabels(labels, fontsize=8)
+    ax.set_xticks([])
+    ax.set_xlim(0, 1)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    ax.set_title(f"{len(matched)} matched (green) / {len(missing)} missing (red)", fontsize=9)
+
+
+def _draw_keyword_coverage(fig, inputs: Dict):
+    matched, missing = inputs['matched'], inputs['missing']
+    ax = fig.add_subplot()
+    total = matched + missing
+    sizes = [matched, missing] if total else [0, 1]
+    ax.pie(sizes, colors=[COLORS['primary'], COLORS['muted']], startangle=90,
+           counterclock=False, wedgeprops={'width': 0.35})
+    ax.text(0, 0, f"{matched / max(total, 1):.0%}", ha='center', va='center', fontsize=18)
+    ax.set_title(f"{matched} of {total} keywords found", fontsize=9)
+    ax.axis('equal')
+
+
+_DRAW = {
+    'radar': _draw_radar,
+    'skills_gap': _draw_skills_gap,
+    'keyword_coverage': _draw_keyword_coverage
+}
+
+
+def render_chart(kind: str, inputs: Dict) -> bytes:
+    """PNG image of one chart"""
+    fig = _figure()
+    _DRAW[kind](fig, inputs)
+    fig.suptitle(CHART_TITLES[kind], fontsize=11)
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png')
+    return buffer.getvalue()
+
+
+def _render_item(item: Tuple[str, Dict]) -> bytes:
+    return render_chart(*item)
+
+
+class ChartCache:
+    """In-memory LRU of rendered chart PNGs keyed by chart_key"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._images: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+
+    def put(self, key: str, image: bytes):
+        with self._lock:
+            self._images[key] = image
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_entries:
+                self._images.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_chart_cache() -> ChartCache:
+    """Process-wide chart cache"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ChartCache()
+        return _default_cache
+
+
+def render_charts(analysis: Dict, cache: Optional[ChartCache] = None) -> Dict[str, bytes]:
+    """PNG for every report chart, served from the cache when possible"""
+    return render_charts_batch([analysis], workers=1, cache=cache)[0]
+
+
+def render_charts_batch(analyses: Sequence[Dict], workers: Optional[int] = None,
+                        cache: Optional[ChartCache] = None) -> List[Dict[str, bytes]]:
+    """Charts for many analyses, rendering each distinct chart once.
+
+    Cache misses are rendered in a process pool of workers processes when
+    there is more than one; pass workers=1 to render in this process.
+    """
+    cache = cache if cache is not None else get_default_chart_cache()
+    keys = []
+    images: Dict[str, bytes] = {}
+    missing: Dict[str, Tuple[str, Dict]] = {}
+
+    for analysis in analyses:
+        chart_keys = {}
+        for kind, inputs in chart_inputs(analysis).items():
+            key = chart_key(kind, inputs)
+            chart_keys[kind] = key
+            if key in images or key in missing:
+                continue
+            image = cache.get(key)
+            if image is None:
+                missing[key] = (kind, inputs)
+            else:
+                images[key] = image
+        keys.append(chart_keys)
+
+    if missing:
+        items = list(missing.items())
+        if workers == 1 or len(items) == 1:
+            rendered = map(_render_item, (item for _, item in items))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                rendered = list(executor.map(_render_item, (item for _, item in items)))
+        for (key, _), image in zip(items, rendered):
+            images[key] = image
+            cache.put(key, image)
+
+    return [{kind: images[key] for kind, key in chart_keys.items()} for chart_keys in keys]
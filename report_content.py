@@ -0,0 +1,66 @@
+"""Report content shared by the PDF, HTML and Markdown renderers.
+
+Each helper turns analysis results into the plain values a report section
+shows, so every output format says the same thing.
+"""
+from typing import Dict, List, Tuple
+
+# Suggestion categories shown in the report, in order
+PRIORITY_CATEGORIES = ['skills_improvement', 'content_enhancement', 'keyword_optimization']
+
+# Suggestions shown per category and missing skills listed
+SUGGESTIONS_PER_CATEGORY = 3
+MAX_MISSING_SKILLS = 15
+
+
+def key_metrics(analysis: Dict) -> List[str]:
+    """Headline metrics for the executive summary"""
+    return [
+        f"Overall Score: {analysis['overall_score']}/100",
+        f"Skill Match: {analysis['skill_match_percentage']:.1f}%",
+        f"Keywords Found: {len(analysis['matched_keywords'])}",
+        f"Readability Score: {analysis['readability_score']:.1f}"
+    ]
+
+
+def summary_text(analysis: Dict) -> str:
+    """Executive summary paragraph"""
+    score = analysis['overall_score']
+    skill_match = analysis['skill_match_percentage']
+
+    if score >= 85:
+        performance = "excellent"
+        advice = "Your resume is highly competitive and well-aligned with the target role."
+    elif score >= 70:
+        performance = "good"
+        advice = "Your resume shows strong potential with room for targeted improvements."
+    elif score >= 50:
+        performance = "moderate"
+        advice = "Your resume needs significant improvements to be competitive."
+    else:
+        performance = "needs improvement"
+        advice = "Your resume requires substantial revision to meet job requirements."
+
+    return f"""Your resume demonstrates {performance} alignment with the target role, achieving an overall score of {score}/100.
+With a {skill_match:.1f}% skill match rate, {advice} Focus on the recommendations below to enhance your
+competitiveness and improve your chances of securing interviews."""
+
+
+def score_breakdown(analysis: Dict) -> List[Tuple[str, float]]:
+    """(category, percentage) pairs for the detailed analysis"""
+    keyword_total = max(len(analysis['matched_keywords']) + len(analysis['missing_keywords']), 1)
+    return [
+        ('Skills Match', analysis['skill_match_percentage']),
+        ('Content Similarity', analysis.get('similarity_score', 0)),
+        ('Readability', analysis['readability_score']),
+        ('Keyword Optimization', len(analysis['matched_keywords']) / keyword_total * 100)
+    ]
+
+
+def top_recommendations(suggestions: Dict) -> List[Tuple[str, List[str]]]:
+    """(category title, top suggestions) for each priority category with suggestions"""
+    return [
+        (category.replace('_', ' ').title(), suggestions[category][:SUGGESTIONS_PER_CATEGORY])
+        for category in PRIORITY_CATEGORIES
+        if suggestions.get(category)
+    ]
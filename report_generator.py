@@ -1,10 +1,22 @@
 from fpdf import FPDF
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
+import io
 import os
-from typing import Dict
-import numpy as np
+import uuid
+from typing import Dict, Optional
+from report_content import (MAX_MISSING_SKILLS, key_metrics, score_breakdown,
+                            summary_text, top_recommendations)
+
+# Core fonts only cover Latin-1; map the punctuation resumes and LLM output commonly use
+_LATIN1_SUBSTITUTES = str.maketrans({
+    '\u2022': '-', '\u2013': '-', '\u2014': '-', '\u2018': "'", '\u2019': "'",
+    '\u201c': '"', '\u201d': '"', '\u2026': '...', '\u00a0': ' '
+})
+
+
+def _pdf_text(text) -> str:
+    """Text the core fonts can encode; anything else outside Latin-1 becomes '?'"""
+    return str(text).translate(_LATIN1_SUBSTITUTES).encode('latin-1', 'replace').decode('latin-1')
 
 class ReportGenerator:
     """Generate PDF reports for resume analysis"""
@@ -20,8 +32,12 @@ class ReportGenerator:
             'info': (23, 162, 184)
         }
     
-    def generate_pdf_report(self, analysis_data: Dict) -> str:
-        """Generate comprehensive PDF report"""
+    def render_pdf(self, analysis_data: Dict, charts: Optional[Dict[str, bytes]] = None) -> bytes:
+        """Render the comprehensive PDF report in memory.
+
+        charts maps chart kind to PNG bytes (see report_charts); they are
+        rendered, or taken from the chart cache, when not given.
+        """
         self.pdf = FPDF()
         self.pdf.add_page()
         
@@ -40,19 +56,32 @@ class ReportGenerator:
         # Recommendations
         self._add_recommendations(analysis_data)
         
-        # Charts (if possible)
-        self._add_charts_section(analysis_data)
+        # AI Insights (if generated)
+        if analysis_data.get('ai_suggestions'):
+            self._add_ai_insights(analysis_data)
         
-        # Save PDF
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"resume_analysis_report_{timestamp}.pdf"
-        filepath = os.path.join("reports", filename)
+        # Charts
+        self._add_charts_section(analysis_data, charts)
         
-        # Create reports directory if it doesn't exist
-        os.makedirs("reports", exist_ok=True)
-        
-        self.pdf.output(filepath)
-        return filepath
+        return bytes(self.pdf.output())
+    
+    def generate_pdf_report(self, analysis_data: Dict, output_path: Optional[str] = None) -> str:
+        """Generate the PDF report and write it to output_path, or a unique file under reports/"""
+        pdf_bytes = self.render_pdf(analysis_data)
+        
+        if output_path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"resume_analysis_report_{timestamp}_{uuid.uuid4().hex[:8]}.pdf"
+            output_path = os.path.join("reports", filename)
+        
+        # Create the output directory if it doesn't exist
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        with open(output_path, "wb") as f:
+            f.write(pdf_bytes)
+        return output_path
     
     def _add_header(self, data: Dict):
         """Add report header"""
@@ -64,8 +93,8 @@ class ReportGenerator:
         # Subtitle
         self.pdf.set_font('Arial', '', 12)
         self.pdf.set_text_color(0, 0, 0)
-        self.pdf.cell(0, 10, f"Generated on: {data['timestamp']}", 0, 1, 'C')
-        self.pdf.cell(0, 10, f"Target Role: {data['job_role']}", 0, 1, 'C')
+        self.pdf.cell(0, 10, _pdf_text(f"Generated on: {data['timestamp']}"), 0, 1, 'C')
+        self.pdf.cell(0, 10, _pdf_text(f"Target Role: {data['job_role']}"), 0, 1, 'C')
         
         # Line separator
         self.pdf.ln(5)
@@ -86,22 +115,14 @@ class ReportGenerator:
         self.pdf.set_font('Arial', 'B', 12)
         self.pdf.set_text_color(0, 0, 0)
         
-        metrics = [
-            f"Overall Score: {analysis['overall_score']}/100",
-            f"Skill Match: {analysis['skill_match_percentage']:.1f}%",
-            f"Keywords Found: {len(analysis['matched_keywords'])}",
-            f"Readability Score: {analysis['readability_score']:.1f}"
-        ]
-        
-        for metric in metrics:
-            self.pdf.cell(0, 8, f"• {metric}", 0, 1)
+        for metric in key_metrics(analysis):
+            self.pdf.cell(0, 8, _pdf_text(f"- {metric}"), 0, 1)
         
         self.pdf.ln(5)
         
         # Summary text
         self.pdf.set_font('Arial', '', 11)
-        summary_text = self._generate_summary_text(analysis)
-        self.pdf.multi_cell(0, 6, summary_text)
+        self.pdf.multi_cell(0, 6, _pdf_text(summary_text(analysis)))
         self.pdf.ln(10)
     
     def _add_detailed_analysis(self, data: Dict):
@@ -120,17 +141,8 @@ class ReportGenerator:
         
         self.pdf.set_font('Arial', '', 11)
         
-        # Create score breakdown
-        scores = {
-            'Skills Match': analysis['skill_match_percentage'],
-            'Content Similarity': analysis.get('similarity_score', 0),
-            'Readability': analysis['readability_score'],
-            'Keyword Optimization': (len(analysis['matched_keywords']) / 
-                                   max(len(analysis['matched_keywords']) + len(analysis['missing_keywords']), 1)) * 100
-        }
-        
-        for category, score in scores.items():
-            self.pdf.cell(0, 6, f"• {category}: {score:.1f}%", 0, 1)
+        for category, score in score_breakdown(analysis):
+            self.pdf.cell(0, 6, _pdf_text(f"- {category}: {score:.1f}%"), 0, 1)
         
         self.pdf.ln(10)
     
@@ -153,7 +165,7 @@ class ReportGenerator:
         
         if analysis['matched_skills']:
             skills_text = ', '.join(analysis['matched_skills'])
-            self.pdf.multi_cell(0, 5, skills_text)
+            self.pdf.multi_cell(0, 5, _pdf_text(skills_text))
         else:
             self.pdf.cell(0, 5, 'No specific skills matched', 0, 1)
         
@@ -168,8 +180,8 @@ class ReportGenerator:
         self.pdf.set_text_color(0, 0, 0)
         
         if analysis['missing_skills']:
-            missing_skills_text = ', '.join(analysis['missing_skills'][:15])  # Limit for space
-            self.pdf.multi_cell(0, 5, missing_skills_text)
+            missing_skills_text = ', '.join(analysis['missing_skills'][:MAX_MISSING_SKILLS])  # Limit for space
+            self.pdf.multi_cell(0, 5, _pdf_text(missing_skills_text))
         else:
             self.pdf.cell(0, 5, 'Great! You have most required skills', 0, 1)
         
@@ -185,27 +197,43 @@ class ReportGenerator:
         self.pdf.ln(5)
         
         # Add top suggestions from each category
-        priority_categories = ['skills_improvement', 'content_enhancement', 'keyword_optimization']
-        
-        for category in priority_categories:
-            if category in suggestions and suggestions[category]:
-                category_title = category.replace('_', ' ').title()
-                
-                self.pdf.set_font('Arial', 'B', 12)
-                self.pdf.set_text_color(0, 0, 0)
-                self.pdf.cell(0, 8, category_title, 0, 1)
-                
-                self.pdf.set_font('Arial', '', 10)
-                
-                # Add top 3 suggestions from this category
-                for suggestion in suggestions[category][:3]:
-                    self.pdf.multi_cell(0, 5, f"• {suggestion}")
-                    self.pdf.ln(2)
-                
-                self.pdf.ln(5)
+        for category_title, items in top_recommendations(suggestions):
+            self.pdf.set_font('Arial', 'B', 12)
+            self.pdf.set_text_color(0, 0, 0)
+            self.pdf.cell(0, 8, _pdf_text(category_title), 0, 1)
+            
+            self.pdf.set_font('Arial', '', 10)
+            
+            for suggestion in items:
+                self.pdf.multi_cell(0, 5, _pdf_text(f"- {suggestion}"))
+                self.pdf.ln(2)
+            
+            self.pdf.ln(5)
     
-    def _add_charts_section(self, data: Dict):
-        """Add charts section (placeholder for future implementation)"""
+    def _add_ai_insights(self, data: Dict):
+        """Add AI-generated suggestions for each resume section"""
+        self.pdf.set_font('Arial', 'B', 16)
+        self.pdf.set_text_color(102, 126, 234)
+        self.pdf.cell(0, 10, 'AI Insights', 0, 1)
+        self.pdf.ln(5)
+        
+        for section, suggestion in data['ai_suggestions'].items():
+            if not suggestion:
+                continue
+            self.pdf.set_font('Arial', 'B', 12)
+            self.pdf.set_text_color(0, 0, 0)
+            self.pdf.cell(0, 8, _pdf_text(f"{section.title()} Enhancement"), 0, 1)
+            
+            self.pdf.set_font('Arial', '', 10)
+            self.pdf.multi_cell(0, 5, _pdf_text(suggestion.strip()))
+            self.pdf.ln(5)
+    
+    def _add_charts_section(self, data: Dict, charts: Optional[Dict[str, bytes]] = None):
+        """Add the visual analysis page with radar, skills-gap and keyword-coverage charts"""
+        if charts is None:
+            from report_charts import render_charts
+            charts = render_charts(data['analysis'])
+        
         self.pdf.add_page()
         
         self.pdf.set_font('Arial', 'B', 16)
@@ -213,45 +241,15 @@ class ReportGenerator:
         self.pdf.cell(0, 10, 'Visual Analysis', 0, 1)
         self.pdf.ln(5)
         
+        for kind in ('radar', 'skills_gap', 'keyword_coverage'):
+            if kind in charts:
+                # Images flow with the text and break onto a new page when needed
+                self.pdf.image(io.BytesIO(charts[kind]), x=30, w=150)
+                self.pdf.ln(5)
+        
         self.pdf.set_font('Arial', '', 11)
         self.pdf.set_text_color(0, 0, 0)
-        
-        # Placeholder for charts
-        chart_info = [
-            "Score Distribution Chart: Shows how your resume performs across different categories",
-            "Skills Gap Analysis: Visual representation of matched vs missing skills",
-            "Keyword Optimization Chart: Displays keyword coverage and opportunities",
-            "Improvement Priority Matrix: Highlights areas with highest impact potential"
-        ]
-        
-        for info in chart_info:
-            self.pdf.multi_cell(0, 6, f"• {info}")
-            self.pdf.ln(2)
-        
-        self.pdf.ln(10)
         self.pdf.multi_cell(0, 6, "Note: Interactive charts and detailed visualizations are available in the web interface.")
-    
-    def _generate_summary_text(self, analysis: Dict) -> str:
-        """Generate executive summary text"""
-        score = analysis['overall_score']
-        skill_match = analysis['skill_match_percentage']
-        
-        if score >= 85:
-            performance = "excellent"
-            advice = "Your resume is highly competitive and well-aligned with the target role."
-        elif score >= 70:
-            performance = "good"
-            advice = "Your resume shows strong potential with room for targeted improvements."
-        elif score >= 50:
-            performance = "moderate"
-            advice = "Your resume needs significant improvements to be competitive."
-        else:
-            performance = "needs improvement"
-            advice = "Your resume requires substantial revision to meet job requirements."
-        
-        return f"""Your resume demonstrates {performance} alignment with the target role, achieving an overall score of {score}/100. 
-With a {skill_match:.1f}% skill match rate, {advice} Focus on the recommendations below to enhance your 
-competitiveness and improve your chances of securing interviews."""
 
 def create_sample_report():
     """Create a sample report for testing"""
@@ -0,0 +1,196 @@
+"""Lightweight HTML and Markdown reports.
+
+The same sections as the PDF report (executive summary, detailed analysis,
+skills analysis, recommendations and AI insights), rendered from templates
+compiled once at import. No layout engine is involved, so rendering is a
+handful of string substitutions, far cheaper than FPDF.
+
+render_report picks the format per call:
+    content = render_report(data, "html")
+"""
+import html
+from string import Template
+from typing import Dict, List, Tuple
+
+from report_content import (MAX_MISSING_SKILLS, key_metrics, score_breakdown,
+                            summary_text, top_recommendations)
+
+# Format name -> (MIME type, file extension)
+REPORT_FORMATS = {
+    'pdf': ('application/pdf', 'pdf'),
+    'html': ('text/html', 'html'),
+    'markdown': ('text/markdown', 'md')
+}
+
+_HTML_PAGE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Smart Resume Analysis Report</title>
+<style>
+body { font-family: Arial, Helvetica, sans-serif; max-width: 800px; margin: 2rem auto; color: #212529; line-height: 1.5; }
+h1 { color: #667eea; text-align: center; margin-bottom: 0.25rem; }
+h2 { color: #667eea; border-bottom: 2px solid #667eea; padding-bottom: 0.25rem; margin-top: 2rem; }
+.subtitle { text-align: center; color: #6c757d; }
+.matched { color: #28a745; }
+.missing { color: #dc3545; }
+.ai { background: #f8f9fa; border-left: 4px solid #667eea; padding: 0.5rem 1rem; white-space: pre-wrap; }
+</style>
+</head>
+<body>
+<h1>Smart Resume Analysis Report</h1>
+<p class="subtitle">Generated on: $timestamp<br>Target Role: $job_role</p>
+<h2>Executive Summary</h2>
+<ul>
+$metrics
+</ul>
+<p>$summary</p>
+<h2>Detailed Analysis</h2>
+<h3>Score Breakdown</h3>
+<ul>
+$scores
+</ul>
+<h2>Skills Analysis</h2>
+<h3 class="matched">Matched Skills ($matched_count)</h3>
+<p>$matched_skills</p>
+<h3 class="missing">Missing Skills ($missing_count)</h3>
+<p>$missing_skills</p>
+<h2>Recommendations</h2>
+$recommendations
+$ai_insights
+</body>
+</html>
+""")
+
+_HTML_RECOMMENDATIONS = Template("<h3>$title</h3>\n<ul>\n$items\n</ul>")
+_HTML_AI_SECTION = Template("<h3>$title</h3>\n<div class=\"ai\">$text</div>")
+
+_MARKDOWN_PAGE = Template("""# Smart Resume Analysis Report
+
+Generated on: $timestamp
+
+Target Role: $job_role
+
+## Executive Summary
+
+$metrics
+
+$summary
+
+## Detailed Analysis
+
+### Score Breakdown
+
+$scores
+
+## Skills Analysis
+
+### Matched Skills ($matched_count)
+
+$matched_skills
+
+### Missing Skills ($missing_count)
+
+$missing_skills
+
+## Recommendations
+
+$recommendations
+$ai_insights""")
+
+_MARKDOWN_RECOMMENDATIONS = Template("### $title\n\n$items\n")
+_MARKDOWN_AI_SECTION = Template("### $title\n\n$text\n")
+
+
+def _skills_text(analysis: Dict) -> Tuple[str, str]:
+    matched = ', '.join(analysis['matched_skills']) or 'No specific skills matched'
+    missing = (', '.join(analysis['missing_skills'][:MAX_MISSING_SKILLS])
+               or 'Great! You have most required skills')
+    return matched, missing
+
+
+def _ai_sections(data: Dict) -> List[Tuple[str, str]]:
+    return [(f"{section.title()} Enhancement", suggestion.strip())
+            for section, suggestion in (data.get('ai_suggestions') or {}).items() if suggestion]
+
+
+def render_html(data: Dict) -> str:
+    """Self-contained HTML report"""
+    analysis = data['analysis']
+    escape = html.escape
+    matched_skills, missing_skills = _skills_text(analysis)
+
+    recommendations = "\n".join(
+        _HTML_RECOMMENDATIONS.substitute(
+            title=escape(title),
+            items="\n".join(f"<li>{escape(item)}</li>" for item in items)
+        )
+        for title, items in top_recommendations(data['suggestions'])
+    )
+    ai_sections = _ai_sections(data)
+    ai_insights = ""
+    if ai_sections:
+        ai_insights = "<h2>AI Insights</h2>\n" + "\n".join(
+            _HTML_AI_SECTION.substitute(title=escape(title), text=escape(text))
+            for title, text in ai_sections
+        )
+
+    return _HTML_PAGE.substitute(
+        timestamp=escape(str(data['timestamp'])),
+        job_role=escape(str(data['job_role'])),
+        metrics="\n".join(f"<li><strong>{escape(metric)}</strong></li>" for metric in key_metrics(analysis)),
+        summary=escape(summary_text(analysis)),
+        scores="\n".join(f"<li>{escape(category)}: {score:.1f}%</li>"
+                         for category, score in score_breakdown(analysis)),
+        matched_count=len(analysis['matched_skills']),
+        matched_skills=escape(matched_skills),
+        missing_count=len(analysis['missing_skills']),
+        missing_skills=escape(missing_skills),
+        recommendations=recommendations,
+        ai_insights=ai_insights
+    )
+
+
+def render_markdown(data: Dict) -> str:
+    """Markdown report"""
+    analysis = data['analysis']
+    matched_skills, missing_skills = _skills_text(analysis)
+
+    recommendations = "\n".join(
+        _MARKDOWN_RECOMMENDATIONS.substitute(
+            title=title, items="\n".join(f"- {item}" for item in items)
+        )
+        for title, items in top_recommendations(data['suggestions'])
+    )
+    ai_sections = _ai_sections(data)
+    ai_insights = ""
+    if ai_sections:
+        ai_insights = "\n## AI Insights\n\n" + "\n".join(
+            _MARKDOWN_AI_SECTION.substitute(title=title, text=text) for title, text in ai_sections
+        )
+
+    return _MARKDOWN_PAGE.substitute(
+        timestamp=data['timestamp'],
+        job_role=data['job_role'],
+        metrics="\n".join(f"- **{metric}**" for metric in key_metrics(analysis)),
+        summary=" ".join(summary_text(analysis).split()),
+        scores="\n".join(f"- {category}: {score:.1f}%" for category, score in score_breakdown(analysis)),
+        matched_count=len(analysis['matched_skills']),
+        matched_skills=matched_skills,
+        missing_count=len(analysis['missing_skills']),
+        missing_skills=missing_skills,
+        recommendations=recommendations,
+        ai_insights=ai_insights
+    )
+
+
+def render_report(data: Dict, fmt: str = "html") -> bytes:
+    """Report in the requested format ('pdf', 'html' or 'markdown') as bytes"""
+    if fmt == 'html':
+        return render_html(data).encode("utf-8")
+    if fmt == 'markdown':
+        return render_markdown(data).encode("utf-8")
+    if fmt == 'pdf':
+        from report_generator import ReportGenerator
+        return ReportGenerator().render_pdf(data)
+    raise ValueError(f"Unknown report format: {fmt}")
@@ -0,0 +1,301 @@
+"""Persistent, searchable corpus of parsed resumes.
+
+Resumes are stored in SQLite and indexed in memory with a BM25 term index and
+a skill posting index. A job description query scores candidates from the
+postings only, then runs the full JobMatcher.analyze_resume breakdown for the
+top hits.
+
+Examples:
+    python resume_index.py add candidates.db resumes/
+    python resume_index.py search candidates.db job.txt --top-k 20
+"""
+import argparse
+import json
+import math
+import sqlite3
+import sys
+import threading
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from job_matcher import JobMatcher
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resumes (
+    doc_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    text TEXT NOT NULL,
+    sections TEXT NOT NULL,
+    terms TEXT NOT NULL,
+    skills TEXT NOT NULL
+)
+"""
+
+
+class _Postings:
+    """Growable posting list that is converted to NumPy arrays on demand"""
+
+    __slots__ = ('doc_slots', 'freqs', '_arrays')
+
+    def __init__(self):
+        self.doc_slots: List[int] = []
+        self.freqs: List[float] = []
+        self._arrays = None
+
+    def append(self, slot: int, freq: float):
+        self.doc_slots.append(slot)
+        self.freqs.append(freq)
+        self._arrays = None
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._arrays is None:
+            self._arrays = (np.array(self.doc_slots, dtype=np.int64),
+                            np.array(self.freqs, dtype=np.float32))
+        return self._arrays
+
+
+class ResumeIndex:
+    """BM25 and skill-posting index over stored resumes with incremental updates.
+
+    Each resume occupies an internal slot. Deleted slots are masked out of
+    results and dropped from the postings the next time the index is opened.
+    """
+
+    def __init__(self, path: str, matcher: Optional[JobMatcher] = None,
+                 k1: float = 1.5, b: float = 0.75, skill_weight: float = 1.0):
+        self.path = path
+        self.matcher = matcher or JobMatcher()
+        self.k1 = k1
+        self.b = b
+        self.skill_weight = skill_weight
+        self._analyzer = self.matcher.vectorizer.build_analyzer()
+        self._lock = threading.RLock()
+
+        self._doc_ids: List[str] = []
+        self._slots: Dict[str, int] = {}
+        self._lengths: List[int] = []
+        self._alive: List[bool] = []
+        self._total_length = 0
+        self._doc_freq: Dict[str, int] = {}
+        self._terms: Dict[str, _Postings] = {}
+        self._skills: Dict[str, set] = {}
+        self._doc_terms: List[Dict[str, int]] = []
+        self._doc_skills: List[List[str]] = []
+        # Document lengths and live mask as arrays, rebuilt only after the index changes
+        self._doc_arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(SCHEMA)
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._slots
+
+    def close(self):
+        self._conn.close()
+
+    def _load(self):
+        """Rebuild the in-memory postings from the stored term and skill data.
+
+        Every posting list is converted to arrays once here, so queries only
+        convert postings that later adds have changed.
+        """
+        for doc_id, terms, skills in self._conn.execute("SELECT doc_id, terms, skills FROM resumes"):
+            self._index(doc_id, json.loads(terms), json.loads(skills))
+        for postings in self._terms.values():
+            postings.arrays()
+        self._document_arrays()
+
+    def _document_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-slot document lengths and live mask"""
+        if self._doc_arrays is None:
+            self._doc_arrays = (np.asarray(self._lengths, dtype=np.float32),
+                                np.asarray(self._alive, dtype=bool))
+        return self._doc_arrays
+
+    def _analyze(self, text: str) -> Tuple[Dict[str, int], List[str]]:
+        """Term frequencies and lowercase skills for a resume"""
+        terms: Dict[str, int] = {}
+        for term in self._analyzer(text):
+            terms[term] = terms.get(term, 0) + 1
+        skills = [skill.lower() for skill in self.matcher.skill_matcher.find_skills(text)]
+        return terms, skills
+
+    def _index(self, doc_id: str, terms: Dict[str, int], skills: List[str]):
+        slot = len(self._doc_ids)
+        self._doc_ids.append(doc_id)
+        self._slots[doc_id] = slot
+        length = sum(terms.values())
+        self._lengths.append(length)
+        self._alive.append(True)
+        self._total_length += length
+        self._doc_terms.append(terms)
+        self._doc_skills.append(skills)
+        self._doc_arrays = None
+
+        for term, freq in terms.items():
+            postings = self._terms.get(term)
+            if postings is None:
+                postings = self._terms[term] = _Postings()
+            postings.append(slot, freq)
+            self._doc_freq[term] = self._doc_freq.get(term, 0) + 1
+        for skill in skills:
+            self._skills.setdefault(skill, set()).add(slot)
+
+    def _unindex(self, doc_id: str):
+        slot = self._slots.pop(doc_id)
+        self._alive[slot] = False
+        self._doc_arrays = None
+        self._total_length -= self._lengths[slot]
+        for term in self._doc_terms[slot]:
+            self._doc_freq[term] -= 1
+        for skill in self._doc_skills[slot]:
+            self._skills[skill].discard(slot)
+        # Postings keep the dead slot until reload; free the per-document data now
+        self._doc_terms[slot] = {}
+        self._doc_skills[slot] = []
+
+    def add(self, text: str, sections: Dict[str, str], name: str = "",
+            doc_id: Optional[str] = None) -> str:
+        """Add or replace a parsed resume and return its document id"""
+        return self.add_many([(text, sections, name, doc_id)])[0]
+
+    def add_many(self, resumes: Iterable[Tuple[str, Dict[str, str], str, Optional[str]]]) -> List[str]:
+        """Add (text, sections, name, doc_id) records in a single transaction"""
+        doc_ids = []
+        with self._lock, self._conn:
+            for text, sections, name, doc_id in resumes:
+                doc_id = doc_id or uuid.uuid4().hex
+                terms, skills = self._analyze(text)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO resumes VALUES (?, ?, ?, ?, ?, ?)",
+                    (doc_id, name, text, json.dumps(sections), json.dumps(terms), json.dumps(skills))
+                )
+                if doc_id in self._slots:
+                    self._unindex(doc_id)
+                self._index(doc_id, terms, skills)
+                doc_ids.append(doc_id)
+        return doc_ids
+
+    def delete(self, doc_id: str) -> bool:
+        """Remove a resume; returns False if it was not indexed"""
+        with self._lock, self._conn:
+            if doc_id not in self._slots:
+                return False
+            self._conn.execute("DELETE FROM resumes WHERE doc_id = ?", (doc_id,))
+            self._unindex(doc_id)
+            return True
+
+    def retrieve(self, job_description: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """Top-k (doc_id, retrieval score) pairs by BM25 plus matched-skill bonus"""
+        with self._lock:
+            if not self._slots or top_k < 1:
+                return []
+
+            doc_count = len(self._slots)
+            avg_length = max(self._total_length / doc_count, 1.0)
+            lengths, alive = self._document_arrays()
+            scores = np.zeros(len(self._doc_ids), dtype=np.float32)
+
+            for term in set(self._analyzer(job_description)):
+                postings = self._terms.get(term)
+                doc_freq = self._doc_freq.get(term, 0)
+                if postings is None or doc_freq == 0:
+                    continue
+                idf = math.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+                slots, freqs = postings.arrays()
+                norm = self.k1 * (1 - self.b + self.b * lengths[slots] / avg_length)
+                scores[slots] += idf * freqs * (self.k1 + 1) / (freqs + norm)
+
+            for skill in self.matcher.skill_matcher.find_skills(job_description):
+                slots = self._skills.get(skill.lower())
+                if slots:
+                    scores[np.fromiter(slots, dtype=np.int64, count=len(slots))] += self.skill_weight
+
+            scores[~alive] = 0
+            candidates = np.flatnonzero(scores > 0)
+            if len(candidates) > top_k:
+                candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+            ranked = candidates[np.argsort(-scores[candidates], kind='stable')]
+            return [(self._doc_ids[slot], float(scores[slot])) for slot in ranked]
+
+    def get(self, doc_id: str) -> Optional[Dict]:
+        """Stored name, text and sections for a resume"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT name, text, sections FROM resumes WHERE doc_id = ?", (doc_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        name, text, sections = row
+        return {'doc_id': doc_id, 'name': name, 'text': text, 'sections': json.loads(sections)}
+
+    def search(self, job_description: str, top_k: int = 10) -> List[Dict]:
+        """Best matching resumes with the full analyze_resume breakdown for each hit"""
+        job_data = self.matcher.analyze_job_description(job_description)
+        results = []
+        for doc_id, retrieval_score in self.retrieve(job_description, top_k):
+            resume = self.get(doc_id)
+            if resume is None:
+                continue  # Deleted concurrently
+            results.append({
+                'doc_id': doc_id,
+                'name': resume['name'],
+                'retrieval_score': retrieval_score,
+                'analysis': self.matcher.analyze_resume(resume['text'], resume['sections'], job_data)
+            })
+        return results
+
+
+def main(argv=None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Build and query a searchable resume index")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+
+    add_command = commands.add_parser("add", help="Parse and index resumes")
+    add_command.add_argument("index", help="Index database file")
+    add_command.add_argument("source", help="Directory of PDF/DOCX resumes or a manifest file")
+
+    delete_command = commands.add_parser("delete", help="Remove resumes from the index")
+    delete_command.add_argument("index", help="Index database file")
+    delete_command.add_argument("doc_ids", nargs="+")
+
+    search_command = commands.add_parser("search", help="Rank indexed resumes against a job description")
+    search_command.add_argument("index", help="Index database file")
+    search_command.add_argument("job_description", help="Text file containing the job description")
+    search_command.add_argument("-k", "--top-k", type=int, default=10)
+    args = arg_parser.parse_args(argv)
+
+    index = ResumeIndex(args.index)
+    try:
+        if args.command == "add":
+            from batch_analyze import iter_resume_paths
+            from resume_parser import ResumeFile, ResumeParser
+            parser = ResumeParser()
+            for path in iter_resume_paths(args.source):
+                try:
+                    text, sections = parser.extract_text_and_sections(ResumeFile.from_path(path))
+                except Exception as e:
+                    print(f"Skipping {path}: {e}", file=sys.stderr)
+                    continue
+                # The path doubles as a stable id so re-adding a file replaces it
+                index.add(text, sections, name=path, doc_id=path)
+            print(f"Index contains {len(index)} resumes", file=sys.stderr)
+        elif args.command == "delete":
+            for doc_id in args.doc_ids:
+                if not index.delete(doc_id):
+                    print(f"Not found: {doc_id}", file=sys.stderr)
+        else:
+            with open(args.job_description, encoding="utf-8") as f:
+                job_description = f.read()
+            for hit in index.search(job_description, args.top_k):
+                print(json.dumps(hit, ensure_ascii=False))
+    finally:
+        index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,67 @@
-import fitz  # PyMuPDF
+import io
+import os
 import re
-import docx
-from typing import Dict, List, Tuple
-import streamlit as st
+from typing import Dict, List, Optional, Tuple
+from parallel import get_process_pool
+from parse_cache import ParseCache
+from skill_matcher import get_skill_matcher
+
+# Bump whenever extraction or section detection changes so cached parses are invalidated
+PARSER_VERSION = "1"
+
+
+PDF_MIME_TYPE = "application/pdf"
+DOCX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+MIME_TYPES = {
+    '.pdf': PDF_MIME_TYPE,
+    '.docx': DOCX_MIME_TYPE,
+}
+
+
+class ResumeFile(io.BytesIO):
+    """In-memory resume file with the same interface as a Streamlit upload"""
+    
+    def __init__(self, data: bytes, name: str, mime_type: str):
+        super().__init__(data)
+        self.name = name
+        self.type = mime_type
+    
+    @classmethod
+    def from_path(cls, path: str) -> "ResumeFile":
+        """Load a PDF or DOCX file from disk"""
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in MIME_TYPES:
+            raise ValueError(f"Unsupported file format: {extension or path}")
+        with open(path, "rb") as f:
+            return cls(f.read(), os.path.basename(path), MIME_TYPES[extension])
+
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> List[str]:
+    """Extract text for pages [start, stop) from a PDF held in memory.
+
+    Runs inside a worker process: each worker reopens the document from the
+    shared bytes instead of receiving unpicklable page objects.
+    """
+    import fitz  # PyMuPDF
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        return [doc[page_number].get_text() for page_number in range(start, stop)]
+    finally:
+        doc.close()
+
 
 class ResumeParser:
     """Extract and parse resume content from PDF and DOCX files"""
     
-    def __init__(self):
+    def __init__(self, parallel_page_threshold: Optional[int] = 20,
+                 max_workers: Optional[int] = None, cache: Optional[ParseCache] = None):
+        # PDFs with at least this many pages are split across the shared process
+        # pool; typical 1-3 page resumes always take the sequential path. None
+        # disables parallel extraction (e.g. when already inside a worker)
+        self.parallel_page_threshold = parallel_page_threshold
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache = cache
         self.section_patterns = {
             'contact': r'(email|phone|address|linkedin|github)',
             'summary': r'(summary|profile|objective|about)',
@@ -22,39 +76,76 @@ class ResumeParser:
     def extract_text_and_sections(self, uploaded_file) -> Tuple[str, Dict[str, str]]:
         """Extract text and identify sections from uploaded file"""
         try:
-            if uploaded_file.type == "application/pdf":
-                text = self._extract_from_pdf(uploaded_file)
-            elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                text = self._extract_from_docx(uploaded_file)
-            else:
+            if uploaded_file.type not in (PDF_MIME_TYPE, DOCX_MIME_TYPE):
                 raise ValueError("Unsupported file format")
             
+            data = uploaded_file.read()
+            cache_key = None
+            if self.cache is not None:
+                cache_key = ParseCache.make_key(data, PARSER_VERSION)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+            
+            if uploaded_file.type == PDF_MIME_TYPE:
+                text = self._extract_from_pdf(data)
+            else:
+                text = self._extract_from_docx(data)
+            
             sections = self._identify_sections(text)
+            if cache_key is not None:
+                self.cache.put(cache_key, text, sections)
             return text, sections
             
         except Exception as e:
             raise Exception(f"Error parsing resume: {str(e)}")
     
-    def _extract_from_pdf(self, uploaded_file) -> str:
-        """Extract text from PDF file"""
+    def _extract_from_pdf(self, pdf_bytes: bytes) -> str:
+        """Extract text from PDF file contents"""
         try:
-            doc = fitz.open(stream=uploaded_file.read(), filetype="pdf")
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            doc.close()
-            return text
+            import fitz  # PyMuPDF
+            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+            try:
+                page_count = doc.page_count
+                if not self._use_parallel_extraction(page_count):
+                    return "".join(page.get_text() for page in doc)
+            finally:
+                doc.close()
+            return "".join(self._extract_pages_parallel(pdf_bytes, page_count))
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
     
-    def _extract_from_docx(self, uploaded_file) -> str:
-        """Extract text from DOCX file"""
+    def _use_parallel_extraction(self, page_count: int) -> bool:
+        """Decide whether a document is long enough to fan out to a process pool"""
+        return (
+            self.parallel_page_threshold is not None
+            and self.max_workers > 1
+            and page_count >= self.parallel_page_threshold
+        )
+    
+    def _extract_pages_parallel(self, pdf_bytes: bytes, page_count: int) -> List[str]:
+        """Extract page text in contiguous chunks across the shared worker pool"""
+        workers = min(self.max_workers, page_count)
+        chunk_size = -(-page_count // workers)  # ceiling division
+        ranges = [(start, min(start + chunk_size, page_count))
+                  for start in range(0, page_count, chunk_size)]
+        
+        # The pool is started once per process: spawning workers per PDF costs more than it saves
+        executor = get_process_pool()
+        futures = [executor.submit(_extract_page_range, pdf_bytes, start, stop)
+                   for start, stop in ranges]
+        pages = []
+        # Collect in submission order so pages stay in document order
+        for future in futures:
+            pages.extend(future.result())
+        return pages
+    
+    def _extract_from_docx(self, docx_bytes: bytes) -> str:
+        """Extract text from DOCX file contents"""
         try:
-            doc = docx.Document(uploaded_file)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
+            import docx
+            doc = docx.Document(io.BytesIO(docx_bytes))
+            return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
         except Exception as e:
             raise Exception(f"Error reading DOCX: {str(e)}")
     
@@ -124,37 +215,8 @@ class ResumeParser:
     
     def extract_skills(self, text: str) -> List[str]:
         """Extract skills from resume text"""
-        # Common technical skills
-        technical_skills = [
-            'python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-            'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express',
-            'django', 'flask', 'spring', 'laravel', 'rails',
-            'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins',
-            'git', 'github', 'gitlab', 'bitbucket',
-            'machine learning', 'deep learning', 'ai', 'nlp', 'computer vision',
-            'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
-            'tableau', 'power bi', 'excel', 'sql', 'r', 'matlab',
-            'agile', 'scrum', 'devops', 'ci/cd', 'testing', 'debugging'
-        ]
-        
-        # Soft skills
-        soft_skills = [
-            'leadership', 'communication', 'teamwork', 'problem solving',
-            'project management', 'time management', 'analytical thinking',
-            'creativity', 'adaptability', 'collaboration', 'presentation',
-            'negotiation', 'customer service', 'sales', 'marketing'
-        ]
-        
-        all_skills = technical_skills + soft_skills
-        found_skills = []
-        
-        text_lower = text.lower()
-        for skill in all_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill.title())
-        
-        return list(set(found_skills))  # Remove duplicates
+        found_skills = get_skill_matcher().find_skills(text)
+        return list(dict.fromkeys(skill.title() for skill in found_skills))  # Remove duplicates
     
     def extract_experience_years(self, text: str) -> int:
         """Estimate years of experience from resume"""
@@ -0,0 +1,270 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+from similarity_model import load_model
+from skill_matcher import SkillMatcher, get_skill_matcher
+
+ROLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "job_roles.json")
+
+# Built-in roles; entries in assets/job_roles.json override these by name
+DEFAULT_ROLES = {
+    "Software Engineer": {
+        "description": "Develop and maintain software applications using various programming languages and frameworks",
+        "required_skills": [
+            "Python", "Java", "JavaScript", "C++", "Git", "SQL", "HTML", "CSS",
+            "React", "Node.js", "API Development", "Database Design", "Testing",
+            "Debugging", "Agile", "Problem Solving", "Team Collaboration"
+        ],
+        "preferred_skills": [
+            "Docker", "Kubernetes", "AWS", "Machine Learning", "DevOps",
+            "Microservices", "GraphQL", "TypeScript", "MongoDB", "Redis"
+        ],
+        "keywords": [
+            "software development", "programming", "coding", "algorithms",
+            "data structures", "version control", "code review", "deployment",
+            "scalability", "performance optimization", "software architecture"
+        ]
+    },
+    "Data Scientist": {
+        "description": "Analyze complex data to extract insights and build predictive models",
+        "required_skills": [
+            "Python", "R", "SQL", "Machine Learning", "Statistics", "Pandas",
+            "NumPy", "Scikit-learn", "Data Visualization", "Jupyter", "Excel",
+            "Problem Solving", "Critical Thinking", "Communication"
+        ],
+        "preferred_skills": [
+            "TensorFlow", "PyTorch", "Deep Learning", "NLP", "Big Data",
+            "Spark", "Hadoop", "Tableau", "Power BI", "A/B Testing",
+            "Feature Engineering", "Model Deployment", "Cloud Platforms"
+        ],
+        "keywords": [
+            "data analysis", "predictive modeling", "statistical analysis",
+            "data mining", "business intelligence", "data pipeline",
+            "feature selection", "model validation", "data cleaning"
+        ]
+    },
+    "Product Manager": {
+        "description": "Lead product development from conception to launch",
+        "required_skills": [
+            "Product Strategy", "Market Research", "User Experience", "Analytics",
+            "Project Management", "Communication", "Leadership", "Stakeholder Management",
+            "Agile", "Scrum", "Data Analysis", "Problem Solving"
+        ],
+        "preferred_skills": [
+            "SQL", "A/B Testing", "Wireframing", "Prototyping", "Customer Development",
+            "Go-to-Market Strategy", "Pricing Strategy", "Competitive Analysis",
+            "Product Marketing", "Technical Writing"
+        ],
+        "keywords": [
+            "product roadmap", "user stories", "market analysis", "product launch",
+            "customer feedback", "product metrics", "cross-functional teams",
+            "product vision", "requirements gathering", "product lifecycle"
+        ]
+    },
+    "Marketing Manager": {
+        "description": "Develop and execute marketing strategies to promote products and services",
+        "required_skills": [
+            "Digital Marketing", "Content Marketing", "Social Media", "SEO", "SEM",
+            "Email Marketing", "Analytics", "Campaign Management", "Brand Management",
+            "Communication", "Creativity", "Project Management"
+        ],
+        "preferred_skills": [
+            "Google Analytics", "Facebook Ads", "Google Ads", "Marketing Automation",
+            "CRM", "A/B Testing", "Conversion Optimization", "Influencer Marketing",
+            "Video Marketing", "Graphic Design", "Copywriting"
+        ],
+        "keywords": [
+            "marketing campaigns", "lead generation", "brand awareness",
+            "customer acquisition", "marketing ROI", "content strategy",
+            "market segmentation", "customer journey", "marketing funnel"
+        ]
+    },
+    "Business Analyst": {
+        "description": "Analyze business processes and requirements to improve efficiency",
+        "required_skills": [
+            "Business Analysis", "Requirements Gathering", "Process Mapping",
+            "Data Analysis", "SQL", "Excel", "Documentation", "Stakeholder Management",
+            "Problem Solving", "Communication", "Critical Thinking"
+        ],
+        "preferred_skills": [
+            "Tableau", "Power BI", "Python", "R", "JIRA", "Confluence",
+            "Process Improvement", "Change Management", "Project Management",
+            "Business Intelligence", "Data Modeling"
+        ],
+        "keywords": [
+            "business requirements", "process optimization", "gap analysis",
+            "business case", "stakeholder analysis", "workflow analysis",
+            "business metrics", "reporting", "business intelligence"
+        ]
+    },
+    "UI/UX Designer": {
+        "description": "Design user interfaces and experiences for digital products",
+        "required_skills": [
+            "UI Design", "UX Design", "Wireframing", "Prototyping", "User Research",
+            "Figma", "Sketch", "Adobe Creative Suite", "Design Systems",
+            "User Testing", "Information Architecture", "Creativity"
+        ],
+        "preferred_skills": [
+            "HTML", "CSS", "JavaScript", "Animation", "Interaction Design",
+            "Accessibility", "Mobile Design", "Responsive Design", "Design Thinking",
+            "Usability Testing", "A/B Testing"
+        ],
+        "keywords": [
+            "user experience", "user interface", "design thinking", "user journey",
+            "design systems", "visual design", "interaction design",
+            "usability", "accessibility", "design research"
+        ]
+    }
+}
+
+
+class RoleProfile:
+    """A job role with lookup structures precomputed at load time"""
+    
+    def __init__(self, name: str, data: Dict, description_vector=None):
+        self.name = name
+        self.data = data
+        self.required_skills = tuple(skill.lower() for skill in data.get('required_skills', ()))
+        self.preferred_skills = tuple(skill.lower() for skill in data.get('preferred_skills', ()))
+        self.skill_set = frozenset(self.required_skills + self.preferred_skills)
+        self.keywords = tuple(kw.lower() for kw in data.get('keywords', ()))
+        self.keyword_set = frozenset(self.keywords)
+        self.description_vector = description_vector
+
+
+class RoleRegistry:
+    """Read-only catalog of job roles shared by every JobMatcher in the process.
+
+    Role data is frozen into tuples at load time and must not be mutated by
+    callers; lowercase skill and keyword sets, the skill matcher and each
+    role's TF-IDF description vector are computed once here, along with
+    inverted indexes from skills and keywords to roles.
+    
+    The TF-IDF state is built on first use so that listing roles stays cheap:
+    the vectorizer is the prebuilt similarity model when one exists,
+    otherwise it is fitted on the catalog descriptions. That fallback
+    vocabulary is too small to compare arbitrary texts, so without a corpus
+    model JobMatcher fits TF-IDF per compared pair instead.
+    """
+    
+    def __init__(self, roles: Dict[str, Dict], vectorizer=None, load_vectorizer=None):
+        self.roles: Dict[str, Dict] = {
+            name: self._freeze(data) for name, data in roles.items()
+        }
+        self._vectorizer = vectorizer
+        self._load_vectorizer = load_vectorizer
+        self._corpus_model = vectorizer is not None
+        self._vectors_ready = False
+        self._vectors_lock = threading.Lock()
+        
+        self.profiles: Dict[str, RoleProfile] = {
+            name: RoleProfile(name, data) for name, data in self.roles.items()
+        }
+        # Role data dicts live as long as the registry, so identity lookups are stable
+        self._profiles_by_id = {id(profile.data): profile for profile in self.profiles.values()}
+        
+        self.skill_matcher: SkillMatcher = get_skill_matcher(
+            skill for profile in self.profiles.values()
+            for skill in profile.data.get('required_skills', ()) + profile.data.get('preferred_skills', ())
+        )
+        
+        # Inverted indexes from lowercase skills and keyword phrases to role names
+        self.skill_postings: Dict[str, Tuple[str, ...]] = self._build_postings(
+            (profile.name, profile.skill_set) for profile in self.profiles.values()
+        )
+        self.keyword_postings: Dict[str, Tuple[str, ...]] = self._build_postings(
+            (profile.name, profile.keyword_set) for profile in self.profiles.values()
+        )
+        self.keyword_matcher = SkillMatcher(self.keyword_postings)
+    
+    @staticmethod
+    def load_roles(path: str = ROLES_PATH) -> Dict[str, Dict]:
+        """Built-in roles overlaid with the JSON catalog at path"""
+        roles = dict(DEFAULT_ROLES)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                roles.update(json.load(f))
+        return roles
+    
+    @classmethod
+    def from_json(cls, path: str = ROLES_PATH) -> "RoleRegistry":
+        """Load the role catalog; the prebuilt similarity model is loaded on first use"""
+        return cls(cls.load_roles(path), load_vectorizer=load_model)
+    
+    @property
+    def vectorizer(self):
+        """Shared TF-IDF vectorizer, built together with the description vectors"""
+        self._ensure_vectors()
+        return self._vectorizer
+    
+    @property
+    def has_corpus_model(self) -> bool:
+        """Whether the vectorizer was fitted on a resume and job description corpus"""
+        self._ensure_vectors()
+        return self._corpus_model
+    
+    def description_vector(self, profile: "RoleProfile"):
+        """Precomputed TF-IDF vector for a catalog role (None for custom roles)"""
+        self._ensure_vectors()
+        return profile.description_vector
+    
+    def _ensure_vectors(self):
+        if self._vectors_ready:
+            return
+        with self._vectors_lock:
+            if self._vectors_ready:
+                return
+            descriptions = [data.get('description', '') for data in self.roles.values()]
+            vectorizer = self._vectorizer
+            if vectorizer is None and self._load_vectorizer is not None:
+                vectorizer = self._load_vectorizer()
+                self._corpus_model = vectorizer is not None
+            if vectorizer is None:
+                from sklearn.feature_extraction.text import TfidfVectorizer
+                vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
+                vectorizer.fit(descriptions)
+            
+            vectors = vectorizer.transform(descriptions)
+            for index, profile in enumerate(self.profiles.values()):
+                profile.description_vector = vectors[index]
+            self._vectorizer = vectorizer
+            self._vectors_ready = True
+    
+    @staticmethod
+    def _build_postings(role_terms) -> Dict[str, Tuple[str, ...]]:
+        postings: Dict[str, List[str]] = {}
+        for name, terms in role_terms:
+            for term in terms:
+                postings.setdefault(term, []).append(name)
+        return {term: tuple(names) for term, names in postings.items()}
+    
+    @staticmethod
+    def _freeze(data: Dict) -> Dict:
+        return {key: tuple(value) if isinstance(value, list) else value
+                for key, value in data.items()}
+    
+    def role_names(self) -> List[str]:
+        """Names of all roles in catalog order"""
+        return list(self.roles)
+    
+    def get(self, name: str) -> Optional[RoleProfile]:
+        """Profile for a role name, or None if unknown"""
+        return self.profiles.get(name)
+    
+    def profile_for(self, job_data: Dict) -> Optional[RoleProfile]:
+        """Profile whose data is job_data itself, or None for custom job data"""
+        return self._profiles_by_id.get(id(job_data))
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_role_registry() -> RoleRegistry:
+    """Process-wide role registry, loaded on first use"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = RoleRegistry.from_json()
+        return _registry
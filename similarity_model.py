@@ -0,0 +1,106 @@
+"""Corpus-fitted TF-IDF model used for resume/job description similarity.
+
+The vectorizer is fitted offline on a corpus of resumes and job descriptions
+and saved with joblib; at runtime it is only loaded and used to transform.
+
+Build a model:
+    python similarity_model.py corpus/resumes corpus/job_descriptions.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Iterable, Iterator
+
+MODEL_PATH = os.getenv(
+    "RESUME_TFIDF_MODEL",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "tfidf_model.joblib")
+)
+
+
+def fit_model(documents: Iterable[str], max_features: int = 20000,
+              min_df: int = 2, max_df: float = 0.9):
+    """Fit a TF-IDF vectorizer on a document corpus"""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    vectorizer = TfidfVectorizer(stop_words='english', max_features=max_features,
+                                 min_df=min_df, max_df=max_df, sublinear_tf=True,
+                                 dtype='float32')
+    vectorizer.fit(documents)
+    # stop_words_ only records terms pruned during fitting; dropping it keeps the file small
+    vectorizer.stop_words_ = None
+    return vectorizer
+
+
+def save_model(vectorizer, path: str = MODEL_PATH):
+    """Save a fitted vectorizer uncompressed so it loads without decompression"""
+    import joblib
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    joblib.dump(vectorizer, path, compress=0)
+
+
+def load_model(path: str = MODEL_PATH):
+    """Load a prebuilt TfidfVectorizer, or None if no model has been built"""
+    if not os.path.exists(path):
+        return None
+    import joblib
+    return joblib.load(path)
+
+
+def iter_corpus(paths: Iterable[str]) -> Iterator[str]:
+    """Yield document texts from .txt, .jsonl, .pdf and .docx files or directories.
+
+    JSONL files hold one document per line in a "text" or "description" field.
+    """
+    from resume_parser import MIME_TYPES, ResumeFile, ResumeParser
+    parser = ResumeParser()
+
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                yield from iter_corpus(os.path.join(root, name) for name in sorted(files))
+            continue
+
+        extension = os.path.splitext(path)[1].lower()
+        try:
+            if extension == '.txt':
+                with open(path, encoding="utf-8") as f:
+                    yield f.read()
+            elif extension == '.jsonl':
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            record = json.loads(line)
+                            yield record.get('text') or record.get('description', '')
+            elif extension in MIME_TYPES:
+                text, _ = parser.extract_text_and_sections(ResumeFile.from_path(path))
+                yield text
+        except Exception as e:
+            print(f"Skipping {path}: {e}", file=sys.stderr)
+
+
+def main(argv=None) -> int:
+    arg_parser = argparse.ArgumentParser(
+        description="Fit the TF-IDF similarity model on a resume and job description corpus"
+    )
+    arg_parser.add_argument("paths", nargs="+", help="Corpus files or directories")
+    arg_parser.add_argument("-o", "--output", default=MODEL_PATH, help="Model output path")
+    arg_parser.add_argument("--max-features", type=int, default=20000)
+    arg_parser.add_argument("--min-df", type=int, default=2)
+    arg_parser.add_argument("--max-df", type=float, default=0.9)
+    args = arg_parser.parse_args(argv)
+
+    from role_registry import RoleRegistry
+    # Always include the catalog descriptions so role terms are weighted against the corpus
+    documents = [data.get('description', '') for data in RoleRegistry.load_roles().values()]
+    documents.extend(iter_corpus(args.paths))
+
+    vectorizer = fit_model(documents, args.max_features, args.min_df, args.max_df)
+    save_model(vectorizer, args.output)
+    print(f"Saved model with {len(vectorizer.vocabulary_)} terms from "
+          f"{len(documents)} documents to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple
+
+# Common technical skills
+TECHNICAL_SKILLS = (
+    'python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
+    'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express',
+    'django', 'flask', 'spring', 'laravel', 'rails',
+    'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins',
+    'git', 'github', 'gitlab', 'bitbucket',
+    'machine learning', 'deep learning', 'ai', 'nlp', 'computer vision',
+    'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
+    'tableau', 'power bi', 'excel', 'sql', 'r', 'matlab',
+    'agile', 'scrum', 'devops', 'ci/cd', 'testing', 'debugging'
+)
+
+# Soft and general professional skills
+SOFT_SKILLS = (
+    'leadership', 'communication', 'teamwork', 'problem solving',
+    'project management', 'time management', 'analytical thinking',
+    'creativity', 'adaptability', 'collaboration', 'presentation',
+    'negotiation', 'customer service', 'sales', 'marketing',
+    'team work', 'critical thinking', 'analytical skills', 'writing', 'research'
+)
+
+BASE_SKILLS = TECHNICAL_SKILLS + SOFT_SKILLS
+
+
+class SkillMatch(NamedTuple):
+    """A skill occurrence; start/end are offsets into the lowercased text"""
+    skill: str
+    start: int
+    end: int
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton that finds every known skill in one pass.
+
+    Matching is case-insensitive and respects word boundaries, so short
+    skills such as "r", "go" or "ai" do not match inside longer words.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        self.skills: List[str] = []
+        seen = set()
+        for skill in skills:
+            key = skill.strip().lower()
+            if key and key not in seen:
+                seen.add(key)
+                self.skills.append(skill.strip())
+
+        self._patterns = [skill.lower() for skill in self.skills]
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def _build(self):
+        """Build the trie, failure links and merged output sets"""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(self._patterns):
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+        # Only enforce a boundary on sides where the pattern itself has a word character
+        self._check_start = [pattern[0].isalnum() for pattern in self._patterns]
+        self._check_end = [pattern[-1].isalnum() for pattern in self._patterns]
+
+    def find_all(self, text: str) -> List[SkillMatch]:
+        """Return every word-bounded skill occurrence, ordered by end offset"""
+        text_lower = text.lower()
+        length = len(text_lower)
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        matches = []
+
+        state = 0
+        for position, char in enumerate(text_lower):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if not outputs[state]:
+                continue
+            end = position + 1
+            for index in outputs[state]:
+                start = end - len(self._patterns[index])
+                if self._check_start[index] and start > 0 and text_lower[start - 1].isalnum():
+                    continue
+                if self._check_end[index] and end < length and text_lower[end].isalnum():
+                    continue
+                matches.append(SkillMatch(self.skills[index], start, end))
+
+        return matches
+
+    def find_skills(self, text: str) -> List[str]:
+        """Return the distinct skills found in text, in order of first appearance"""
+        found = {}
+        for match in sorted(self.find_all(text), key=lambda match: match.start):
+            found.setdefault(match.skill, None)
+        return list(found)
+
+
+@lru_cache(maxsize=32)
+def _compile(skills: tuple) -> SkillMatcher:
+    return SkillMatcher(skills)
+
+
+def get_skill_matcher(extra_skills: Iterable[str] = ()) -> SkillMatcher:
+    """Shared matcher for the base taxonomy plus extra_skills, compiled once per process.
+
+    Extra skills come first so their casing wins over the lowercase base list.
+    """
+    return _compile(tuple(sorted(set(extra_skills))) + BASE_SKILLS)
@@ -0,0 +1,152 @@
+import asyncio
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import api_server
+
+ANALYSIS = {
+    'overall_score': 72,
+    'skill_match_percentage': 60.0,
+    'similarity_score': 35.5,
+    'readability_score': 48.2,
+    'matched_skills': ['Python', 'Sql'],
+    'missing_skills': ['Docker'],
+    'matched_keywords': ['programming'],
+    'missing_keywords': ['deployment'],
+}
+
+REPORT = {'analysis': ANALYSIS, 'suggestions': {'skills_improvement': ["Learn Docker"]}, 'job_role': "Software Engineer"}
+
+PIPELINE_DEPENDENCIES = ('fitz', 'docx', 'fpdf', 'sklearn', 'textstat')
+
+
+@pytest.fixture
+def client():
+    with TestClient(api_server.app) as client:
+        yield client
+
+
+def test_health_and_roles(client):
+    assert client.get("/health").json()['status'] == "ok"
+    assert "Software Engineer" in client.get("/roles").json()['roles']
+
+
+def test_html_report_renders_inline(client):
+    response = client.post("/report", params={'format': "html"}, json=REPORT)
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith("text/html")
+    assert b"Learn Docker" in response.content
+
+
+def test_malformed_analysis_is_a_422(client):
+    analysis = {key: value for key, value in ANALYSIS.items() if key != 'matched_skills'}
+    response = client.post("/report", params={'format': "markdown"}, json=dict(REPORT, analysis=analysis))
+    assert response.status_code == 422
+
+
+@pytest.mark.skipif(any(importlib.util.find_spec(name) is None for name in PIPELINE_DEPENDENCIES),
+                    reason="pipeline dependencies not installed")
+def test_suggestions(client):
+    response = client.post("/suggestions", json={
+        'analysis': ANALYSIS,
+        'resume_sections': {'summary': "Python developer", 'skills': "Python, SQL"},
+        'job_data': api_server.get_role_registry().roles["Software Engineer"]
+    })
+    assert response.status_code == 200
+    suggestions = response.json()['suggestions']
+    assert isinstance(suggestions, dict) and suggestions
+
+
+def test_unknown_role_is_a_404(client):
+    response = client.post("/analyze/role", data={'role': "Astronaut"},
+                           files={'file': ("resume.pdf", b"%PDF-1.4", "application/pdf")})
+    assert response.status_code == 404
+
+
+def test_unsupported_and_empty_uploads_are_rejected(client):
+    assert client.post("/parse", files={'file': ("resume.txt", b"text", "text/plain")}).status_code == 415
+    assert client.post("/parse", files={'file': ("resume.pdf", b"", "application/pdf")}).status_code == 400
+
+
+def test_oversized_upload_is_a_413(client, monkeypatch):
+    monkeypatch.setattr(api_server, "MAX_UPLOAD_BYTES", 1024)
+    response = client.post("/parse", files={'file': ("resume.pdf", b"x" * 4096, "application/pdf")})
+    assert response.status_code == 413
+
+
+def test_oversized_content_length_is_a_413(client):
+    response = client.post("/suggestions", content=b"x" * (api_server.MAX_REQUEST_BYTES + 1),
+                           headers={'content-type': "application/json"})
+    assert response.status_code == 413
+
+
+def test_oversized_chunked_body_is_a_413(client):
+    chunk = b"x" * (1024 * 1024)
+    chunks = (chunk for _ in range(api_server.MAX_REQUEST_BYTES // len(chunk) + 2))
+    response = client.post("/suggestions", content=chunks, headers={'content-type': "application/json"})
+    assert response.status_code == 413
+
+
+def test_full_queue_is_a_503(monkeypatch):
+    monkeypatch.setattr(api_server, "QUEUE_TIMEOUT", 0.05)
+
+    async def scenario():
+        pool = api_server._Pool(workers=1, max_queued=0)
+        try:
+            await pool._slots.acquire()  # The only slot is busy
+            with pytest.raises(HTTPException) as error:
+                await pool.run(max, 1, 2)
+            return error.value.status_code
+        finally:
+            pool.shutdown()
+
+    assert asyncio.run(scenario()) == 503
+
+
+def test_crashed_worker_is_a_503_and_the_pool_recovers():
+    async def scenario():
+        pool = api_server._Pool(workers=1, max_queued=0)
+        broken = pool.executor
+        try:
+            with pytest.raises(HTTPException) as error:
+                await pool.run(os._exit, 1)
+            return error.value.status_code, pool.executor is not broken
+        finally:
+            pool.shutdown()
+
+    assert asyncio.run(scenario()) == (503, True)
+
+
+@pytest.mark.skipif(any(importlib.util.find_spec(name) is None for name in PIPELINE_DEPENDENCIES),
+                    reason="pipeline dependencies not installed")
+def test_unparseable_resume_is_a_422(client):
+    response = client.post("/parse", files={'file': ("resume.pdf", b"not a pdf", "application/pdf")})
+    assert response.status_code == 422
+
+
+@pytest.mark.skipif(any(importlib.util.find_spec(name) is None for name in PIPELINE_DEPENDENCIES),
+                    reason="pipeline dependencies not installed")
+def test_pdf_report(client):
+    response = client.post("/report", params={'format': "pdf"}, json=REPORT)
+    assert response.status_code == 200
+    assert response.headers['content-type'] == "application/pdf"
+    assert response.content.startswith(b"%PDF")
+
+
+@pytest.mark.skipif(any(importlib.util.find_spec(name) is None for name in PIPELINE_DEPENDENCIES),
+                    reason="pipeline dependencies not installed")
+def test_failed_render_is_a_500_and_keeps_the_pool(client):
+    executor = api_server._pool.executor
+    response = client.post("/report", params={'format': "pdf"},
+                           json=dict(REPORT, suggestions={'skills_improvement': 5}))
+    assert response.status_code == 500
+    assert api_server._pool.executor is executor
+    assert client.post("/report", params={'format': "pdf"}, json=REPORT).status_code == 200
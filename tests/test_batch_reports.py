@@ -0,0 +1,28 @@
+import os
+
+from batch_reports import render_reports
+
+RECORD = {
+    'file': "resumes/jane doe.pdf",
+    'job_role': "Software Engineer",
+    'timestamp': "2024-01-01 12:00:00",
+    'analysis': {
+        'overall_score': 72,
+        'skill_match_percentage': 60.0,
+        'similarity_score': 35.5,
+        'readability_score': 48.2,
+        'matched_skills': ['Python'],
+        'missing_skills': ['Docker'],
+        'matched_keywords': ['programming'],
+        'missing_keywords': ['deployment'],
+    },
+    'suggestions': {'skills_improvement': ["Learn Docker"]},
+}
+
+
+def test_a_bad_record_is_counted_without_stopping_the_batch(tmp_path):
+    records = [RECORD, {'file': "broken.pdf", 'analysis': None}, dict(RECORD, file="john.pdf")]
+    counts = render_reports(records, str(tmp_path), workers=2, fmt='markdown')
+
+    assert counts == {'ok': 2, 'error': 1}
+    assert sorted(os.listdir(tmp_path)) == ["00000_jane_doe.md", "00002_john.md"]
@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+pytest.importorskip("sklearn")
+pytest.importorskip("textstat")
+
+from batch_scoring import score_resumes
+from job_matcher import JobMatcher
+
+RESUMES = [
+    ("Software engineer with five years of Python, Java and SQL. Built React front ends and "
+     "Node.js APIs, led code review and performance optimization for a scalable deployment pipeline.",
+     {'summary': "Software engineer with five years of Python, Java and SQL.",
+      'experience': "Built React front ends and Node.js APIs, led code review and performance optimization.",
+      'skills': "Python, Java, SQL, React, Node.js, Git, Docker"}),
+    ("Data scientist experienced in machine learning, statistics and Python. Designed A/B testing "
+     "frameworks and dashboards; communicated insights to product managers.",
+     {'summary': "Data scientist experienced in machine learning, statistics and Python.",
+      'skills': "Python, Machine Learning, Statistics, SQL, Tableau"}),
+    ("Product manager who owns the roadmap, writes user stories and runs agile ceremonies with "
+     "stakeholders across engineering and design.",
+     {'experience': "Owns the roadmap, writes user stories and runs agile ceremonies."}),
+]
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return JobMatcher()
+
+
+def test_score_resumes_matches_analyze_resume(matcher):
+    roles = list(matcher.job_roles_data)
+    jobs = [matcher.get_job_requirements(role) for role in roles]
+    scores = score_resumes(RESUMES, jobs, matcher=matcher)
+
+    assert scores.shape == (len(RESUMES), len(jobs))
+    for i, (text, sections) in enumerate(RESUMES):
+        for j, job in enumerate(jobs):
+            expected = matcher.analyze_resume(text, sections, job)
+            details = scores.pair_details(i, j)
+            assert details['skill_match_percentage'] == pytest.approx(expected['skill_match_percentage'], abs=1e-9)
+            assert details['similarity_score'] == pytest.approx(expected['similarity_score'], abs=1e-9)
+            assert details['matched_skills'] == expected['matched_skills']
+            assert details['matched_keywords'] == expected['matched_keywords']
+            assert details['overall_score'] == expected['overall_score']
+
+
+def test_custom_job_description(matcher):
+    job = matcher.analyze_job_description(
+        "We are hiring a backend developer with Python, SQL and Docker experience to build APIs."
+    )
+    text, sections = RESUMES[0]
+    scores = score_resumes([(text, sections)], [job], matcher=matcher)
+    assert scores.overall[0, 0] == matcher.analyze_resume(text, sections, job)['overall_score']
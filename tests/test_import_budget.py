@@ -0,0 +1,105 @@
+"""Import-time budget for the library modules.
+
+Each module is imported in a fresh interpreter; the test fails if the import
+takes longer than its budget or pulls in a heavy dependency that should only
+load on the code path that needs it.
+"""
+import glob
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds allowed for a cold import of each module
+BUDGETS = {
+    'api_server': 1.0,
+    'background_tasks': 0.3,
+    'batch_analyze': 0.3,
+    'batch_reports': 0.3,
+    'batch_scoring': 3.0,
+    'job_matcher': 0.3,
+    'llm_backends': 0.3,
+    'llm_cache': 0.3,
+    'llm_client': 0.3,
+    'llm_optimizer': 0.3,
+    'parallel': 0.3,
+    'parse_cache': 0.3,
+    'prompt_builder': 0.3,
+    'report_charts': 0.3,
+    'report_content': 0.3,
+    'report_generator': 0.5,
+    'report_renderers': 0.3,
+    'resume_index': 1.0,
+    'resume_parser': 0.3,
+    'role_registry': 0.3,
+    'similarity_model': 0.3,
+    'skill_matcher': 0.3,
+    'suggestor': 0.3,
+}
+
+# Dependencies that must stay out of sys.modules after importing a module
+HEAVY_MODULES = (
+    'fitz', 'docx', 'sklearn', 'scipy', 'numpy', 'pandas', 'textstat', 'openai',
+    'plotly', 'matplotlib', 'seaborn', 'fpdf', 'joblib', 'streamlit',
+)
+
+# Dependencies a module needs at import time by design, along with whatever heavy modules they
+# import themselves (sklearn loads joblib, newer fpdf2 loads numpy); it is skipped when they are
+# not installed
+IMPORT_TIME_DEPENDENCIES = {
+    'api_server': ('fastapi',),
+    'batch_scoring': ('numpy', 'scipy', 'sklearn', 'textstat'),
+    'report_generator': ('fpdf',),
+    'resume_index': ('numpy',),
+}
+
+# Streamlit scripts run when imported; their imports are covered through the modules above
+SCRIPTS = {'app'}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted(name for name in {heavy!r} if name in sys.modules)
+print(json.dumps({{'seconds': elapsed, 'heavy': heavy}}))
+"""
+
+
+def measure(module: str) -> Dict:
+    """Cold-import module (or "a, b") in a subprocess and report time and heavy imports"""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True, text=True, cwd=ROOT
+    )
+    assert result.returncode == 0, f"import {module} failed:\n{result.stderr}"
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_every_module_has_a_budget():
+    modules = {os.path.splitext(os.path.basename(path))[0] for path in glob.glob(os.path.join(ROOT, "*.py"))}
+    assert modules - SCRIPTS == set(BUDGETS)
+
+
+@pytest.mark.parametrize("module", sorted(BUDGETS))
+def test_import_budget(module):
+    dependencies = IMPORT_TIME_DEPENDENCIES.get(module, ())
+    missing = [name for name in dependencies if importlib.util.find_spec(name) is None]
+    if missing:
+        pytest.skip(f"{', '.join(missing)} not installed")
+
+    allowed = set(dependencies)
+    if dependencies:
+        allowed.update(measure(", ".join(dependencies))['heavy'])
+    stats = measure(module)
+    unexpected = [name for name in stats['heavy'] if name not in allowed]
+    assert not unexpected, f"{module} imports {', '.join(unexpected)} at import time"
+    assert stats['seconds'] <= BUDGETS[module], (
+        f"{module} took {stats['seconds']:.3f}s to import (budget {BUDGETS[module]:.3f}s)"
+    )
@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip("sklearn")
+pytest.importorskip("textstat")
+
+from job_matcher import JobMatcher
+from role_registry import RoleRegistry
+
+RESUME = ("Marine biologist who surveyed coral reef ecosystems, tagged sea turtles and "
+          "published fieldwork on plankton blooms.")
+JOB_DESCRIPTION = "Seeking a marine biologist for coral reef surveys and sea turtle tagging fieldwork."
+
+
+def test_custom_job_description_similarity_without_a_corpus_model():
+    registry = RoleRegistry(RoleRegistry.load_roles())
+    matcher = JobMatcher(registry)
+    assert not registry.has_corpus_model
+    assert matcher._calculate_text_similarity(RESUME, JOB_DESCRIPTION) > 0
+
+
+def test_custom_job_description_similarity_with_a_corpus_model():
+    from similarity_model import fit_model
+    vectorizer = fit_model([RESUME, JOB_DESCRIPTION, "Python developer building web services"],
+                           max_features=1000, min_df=1, max_df=1.0)
+    registry = RoleRegistry(RoleRegistry.load_roles(), vectorizer=vectorizer)
+    matcher = JobMatcher(registry)
+    assert registry.has_corpus_model
+    assert matcher._calculate_text_similarity(RESUME, JOB_DESCRIPTION) > 0
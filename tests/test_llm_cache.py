@@ -0,0 +1,79 @@
+import pytest
+
+import llm_cache
+from llm_backends import StubBackend
+from llm_cache import LLMResponseCache
+from llm_optimizer import LLMOptimizer
+
+MESSAGES = [{"role": "user", "content": "Improve my summary"}]
+
+RESUME_SECTIONS = {'summary': "Engineer", 'skills': "Python"}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(str(tmp_path / "responses.sqlite"), ttl=60, max_entries=2)
+
+
+def test_key_covers_model_messages_and_params():
+    key = LLMResponseCache.make_key("model", MESSAGES, max_tokens=100)
+    assert key == LLMResponseCache.make_key("model", [dict(MESSAGES[0])], max_tokens=100)
+    assert key != LLMResponseCache.make_key("other", MESSAGES, max_tokens=100)
+    assert key != LLMResponseCache.make_key("model", MESSAGES, max_tokens=200)
+
+
+def test_entries_expire_after_ttl(cache, clock):
+    cache.put("a", "reply")
+    clock[0] += 59
+    assert cache.get("a") == "reply"
+    clock[0] += 2
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted(cache, clock):
+    cache.put("a", "reply a")
+    clock[0] += 1
+    cache.put("b", "reply b")
+    clock[0] += 1
+    assert cache.get("a") == "reply a"  # a is now more recent than b
+    clock[0] += 1
+    cache.put("c", "reply c")
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "reply a"
+
+
+def test_entries_persist_across_instances(tmp_path):
+    path = str(tmp_path / "responses.sqlite")
+    LLMResponseCache(path).put("a", "reply")
+    assert LLMResponseCache(path).get("a") == "reply"
+
+
+def test_optimizer_serves_repeated_prompts_from_cache(cache):
+    backend = StubBackend()
+    optimizer = LLMOptimizer(backend=backend, cache=cache)
+    first = optimizer.optimize_resume_sections({'summary': "Engineer"}, {}, {})
+    calls = backend.calls
+    assert optimizer.optimize_resume_sections({'summary': "Engineer"}, {}, {}) == first
+    assert backend.calls == calls
+    optimizer.optimize_resume_sections({'summary': "Engineer"}, {}, {}, use_cache=False)
+    assert backend.calls == calls * 2
+
+
+def test_sequential_path_goes_through_section_helpers():
+    class Optimizer(LLMOptimizer):
+        def _optimize_skills(self, skills_text, job_data, analysis_results, use_cache=True):
+            return f"custom {skills_text}"
+
+    result = Optimizer(backend=StubBackend()).optimize_resume_sections(RESUME_SECTIONS, {}, {})
+    assert result['skills'] == "custom Python"
+    assert set(result) == {'summary', 'skills', 'overall'}
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+import llm_client
+from llm_client import LLMClient, TokenBucket, get_llm_client
+
+
+def test_bucket_allows_a_burst_then_paces_at_rate():
+    bucket = TokenBucket(rate=20, capacity=3)
+    started = time.monotonic()
+    for _ in range(3):
+        assert bucket.acquire()
+    assert time.monotonic() - started < 0.05
+
+    assert bucket.acquire()
+    assert 0.03 < time.monotonic() - started < 0.5
+
+
+def test_bucket_gives_up_when_the_wait_exceeds_timeout():
+    bucket = TokenBucket(rate=1, capacity=1)
+    assert bucket.acquire()
+    started = time.monotonic()
+    assert not bucket.acquire(timeout=0.1)
+    assert time.monotonic() - started < 0.05
+
+
+def test_bucket_refills_up_to_capacity():
+    bucket = TokenBucket(rate=100, capacity=2)
+    assert bucket.acquire(2)
+    time.sleep(0.1)  # Enough for 10 tokens, capped at 2
+    assert bucket.acquire(2, timeout=0)
+    assert not bucket.acquire(timeout=0)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(llm_client, "_clients", type(llm_client._clients)())
+    monkeypatch.setattr(llm_client, "_buckets", type(llm_client._buckets)())
+    monkeypatch.setattr(llm_client, "MAX_CLIENTS", 2)
+    monkeypatch.setattr(llm_client, "LLMClient",
+                        lambda api_key, base_url, rate_limiter: (base_url, rate_limiter))
+
+
+def test_clients_are_shared_and_keyed_without_the_api_key(registry):
+    client = get_llm_client("sk-secret", "http://a")
+    assert get_llm_client("sk-secret", "http://a") is client
+    # Clients for one key share its rate limiter
+    assert get_llm_client("sk-secret", "http://b")[1] is client[1]
+    assert not any("sk-secret" in key for key in llm_client._clients)
+    assert not any("sk-secret" in key for key in llm_client._buckets)
+
+
+def test_least_recently_used_clients_are_released(registry):
+    first = get_llm_client("key-1")
+    get_llm_client("key-2")
+    get_llm_client("key-3")
+    assert len(llm_client._clients) == 2
+    assert get_llm_client("key-1") is not first
+
+
+def test_retries_stop_at_the_deadline():
+    pytest.importorskip("openai")
+    # Nothing listens on this port, so every attempt fails with a retryable connection error
+    client = LLMClient("sk-test", base_url="http://127.0.0.1:9/v1", backoff_base=0.2)
+    started = time.monotonic()
+    with pytest.raises(Exception):
+        client.create_chat_completion(timeout=0.5, model="gpt-3.5-turbo",
+                                      messages=[{"role": "user", "content": "hi"}])
+    assert time.monotonic() - started < 1.0
@@ -0,0 +1,57 @@
+import os
+
+from parse_cache import ParseCache
+
+
+def test_key_depends_on_content_and_parser_version():
+    key = ParseCache.make_key(b"resume", "1")
+    assert key == ParseCache.make_key(b"resume", "1")
+    assert key != ParseCache.make_key(b"resume", "2")
+    assert key != ParseCache.make_key(b"resume2", "1")
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ParseCache(max_entries=2)
+    cache.put("a", "text a", {})
+    cache.put("b", "text b", {})
+    assert cache.get("a") is not None  # a is now more recent than b
+    cache.put("c", "text c", {})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == ("text a", {})
+    assert cache.get("c") == ("text c", {})
+
+
+def test_callers_get_their_own_sections():
+    cache = ParseCache()
+    cache.put("a", "text", {'skills': "Python"})
+    cache.get("a")[1]['skills'] = "changed"
+    assert cache.get("a") == ("text", {'skills': "Python"})
+
+
+def test_disk_tier_is_shared_between_instances(tmp_path):
+    ParseCache(cache_dir=str(tmp_path)).put("a", "text", {'summary': "Hi"})
+    assert ParseCache(cache_dir=str(tmp_path)).get("a") == ("text", {'summary': "Hi"})
+
+
+def test_disk_tier_evicts_least_recently_used_past_size_cap(tmp_path):
+    cache = ParseCache(max_entries=0, cache_dir=str(tmp_path))
+    cache.put("old", "x" * 100, {})
+    cache.put("new", "y" * 100, {})
+    os.utime(tmp_path / "old.json", (1, 1))
+    entry_size = os.path.getsize(tmp_path / "new.json")
+
+    cache.max_disk_bytes = entry_size * 2
+    cache.put("newest", "z" * 100, {})
+
+    assert sorted(os.listdir(tmp_path)) == ["new.json", "newest.json"]
+    assert cache.get("old") is None
+    assert cache.get("new") == ("y" * 100, {})
+
+
+def test_clear_removes_both_tiers(tmp_path):
+    cache = ParseCache(cache_dir=str(tmp_path))
+    cache.put("a", "text", {})
+    cache.clear()
+    assert cache.get("a") is None
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,62 @@
+from prompt_builder import estimate_tokens, score_unit, select_content, split_units, _term_pattern
+
+EXPERIENCE = "\n".join([
+    "- Organized the team offsite and weekly social events",
+    "- Built Kubernetes deployment pipelines for 40 services",
+    "- Answered internal support tickets about laptops",
+    "- Cut cloud spend by 35% by rightsizing AWS instances",
+    "- Wrote onboarding documentation for new hires",
+    "- Migrated reporting jobs to Airflow and dbt",
+    "- Mentored junior engineers through design reviews",
+    "- Presented quarterly roadmap updates to leadership",
+])
+
+
+def test_text_within_budget_is_returned_unchanged():
+    assert select_content("  Python developer.  ", 50) == "Python developer."
+
+
+def test_empty_text_or_budget_gives_nothing():
+    assert select_content("", 50) == ""
+    assert select_content("Python developer", 0) == ""
+
+
+def test_selection_fits_the_budget():
+    budget = 40
+    selected = select_content(EXPERIENCE, budget, ["Kubernetes"], ["cloud"])
+    assert selected
+    assert estimate_tokens(selected) <= budget
+
+
+def test_missing_skills_and_metrics_are_kept_first():
+    selected = select_content(EXPERIENCE, 30, ["Kubernetes", "Airflow"])
+    assert "Kubernetes" in selected
+    assert "Airflow" in selected
+    assert "offsite" not in selected
+
+
+def test_selected_lines_keep_their_original_order():
+    lines = select_content(EXPERIENCE, 60, ["Airflow", "Kubernetes"]).splitlines()
+    positions = [EXPERIENCE.splitlines().index(line) for line in lines]
+    assert positions == sorted(positions)
+
+
+def test_single_oversized_unit_is_truncated_at_a_word_boundary():
+    text = "Python " * 400
+    selected = select_content(text, 20)
+    assert 0 < estimate_tokens(selected) <= 20
+    assert set(selected.split()) == {"Python"}
+
+
+def test_long_lines_are_split_into_sentences():
+    line = "Led the platform team. " * 12
+    assert split_units(line) == ["Led the platform team."] * 12
+    assert split_units("- short bullet\n\n* another") == ["- short bullet", "* another"]
+
+
+def test_score_counts_distinct_missing_skills_metrics_and_keywords():
+    missing = _term_pattern(["SQL", "Docker"])
+    keywords = _term_pattern(["pipelines"])
+    assert score_unit("SQL and Docker pipelines, 3x faster", missing, keywords) == 3.0 * 2 + 2.0 + 1.0
+    assert score_unit("Nothing relevant here", missing, keywords) == 0
+    assert score_unit("NoSQL stores", missing) == 0
@@ -0,0 +1,36 @@
+import pytest
+
+pytest.importorskip("fpdf")
+
+from report_generator import ReportGenerator
+
+REPORT = {
+    'timestamp': "2024-01-01 12:00:00",
+    'job_role': "Software Engineer",
+    'analysis': {
+        'overall_score': 78,
+        'skill_match_percentage': 65.5,
+        'similarity_score': 72.3,
+        'readability_score': 68.2,
+        'matched_skills': ['Python', 'SQL', 'Node.js'],
+        'missing_skills': ['Docker', 'C++'],
+        'matched_keywords': ['programming'],
+        'missing_keywords': ['ci/cd'],
+    },
+    'suggestions': {
+        'skills_improvement': ["Learn Docker – it’s “essential” for deployment…"],
+        'content_enhancement': ["Quantify achievements • e.g. 30% faster"],
+    },
+    'ai_suggestions': {'summary': "Use “impact” verbs — ✓ measurable results"},
+}
+
+
+def test_render_pdf_returns_pdf_bytes():
+    pdf = ReportGenerator().render_pdf(REPORT, charts={})
+    assert pdf.startswith(b"%PDF")
+
+
+def test_render_pdf_with_charts():
+    pytest.importorskip("matplotlib")
+    pdf = ReportGenerator().render_pdf(REPORT)
+    assert pdf.startswith(b"%PDF")
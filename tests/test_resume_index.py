@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+
+from resume_index import ResumeIndex
+
+PYTHON_DEV = "Backend developer writing Python services, SQL databases and REST APIs with Docker."
+DESIGNER = "Graphic designer creating brand identities, illustrations and print layouts."
+DATA = "Data scientist using Python, pandas and machine learning to build forecasting models."
+
+JOB = "Looking for a Python backend developer to build REST APIs on SQL databases."
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ResumeIndex(str(tmp_path / "index.db"))
+    index.add_many([(PYTHON_DEV, {}, "dev", "dev"), (DESIGNER, {}, "designer", "designer"),
+                    (DATA, {}, "data", "data")])
+    yield index
+    index.close()
+
+
+def test_retrieve_ranks_relevant_resumes_first(index):
+    ranked = [doc_id for doc_id, _ in index.retrieve(JOB, top_k=3)]
+    assert ranked[0] == "dev"
+    assert "designer" not in ranked
+
+
+def test_delete_removes_from_results(index):
+    assert index.delete("dev")
+    assert "dev" not in [doc_id for doc_id, _ in index.retrieve(JOB)]
+    assert not index.delete("dev")
+
+
+def test_replacing_a_document_updates_its_postings(index):
+    index.add(DESIGNER, {}, "dev", doc_id="dev")
+    assert len(index) == 3
+    assert "dev" not in [doc_id for doc_id, _ in index.retrieve(JOB)]
+
+
+def test_reopened_index_returns_the_same_ranking(index, tmp_path):
+    before = index.retrieve(JOB, top_k=3)
+    reopened = ResumeIndex(str(tmp_path / "index.db"), matcher=index.matcher)
+    try:
+        after = reopened.retrieve(JOB, top_k=3)
+        assert [doc_id for doc_id, _ in after] == [doc_id for doc_id, _ in before]
+        assert [score for _, score in after] == pytest.approx([score for _, score in before])
+    finally:
+        reopened.close()
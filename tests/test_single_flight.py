@@ -0,0 +1,134 @@
+import threading
+import time
+
+import pytest
+
+from llm_backends import StubBackend
+from llm_optimizer import LLMOptimizer, SingleFlight, get_llm_metrics
+
+
+def start_leader(flight, fn, key="k"):
+    """Run flight.do(key, fn) in a thread and wait until it is in flight"""
+    outcome = {}
+
+    def run():
+        try:
+            outcome['result'] = flight.do(key, fn)
+        except BaseException as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    while flight.metrics()['in_flight'] == 0:
+        time.sleep(0.001)
+    return thread, outcome
+
+
+def test_followers_share_the_leaders_result():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def request():
+        calls.append(1)
+        release.wait(5)
+        return "reply"
+
+    leader, outcome = start_leader(flight, request)
+    results = []
+    followers = [threading.Thread(target=lambda: results.append(flight.do("k", request)))
+                 for _ in range(3)]
+    for follower in followers:
+        follower.start()
+    while flight.metrics()['coalesced'] < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join()
+
+    assert outcome['result'] == "reply"
+    assert results == ["reply"] * 3
+    assert len(calls) == 1
+    assert flight.metrics() == {'requests': 1, 'coalesced': 3, 'in_flight': 0}
+
+
+def test_leader_error_reaches_followers():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise ValueError("bad request")
+
+    leader, outcome = start_leader(flight, failing)
+    threading.Timer(0.05, release.set).start()
+    with pytest.raises(ValueError, match="bad request"):
+        flight.do("k", lambda: "unused")
+    leader.join()
+    assert isinstance(outcome['error'], ValueError)
+    assert flight.metrics()['in_flight'] == 0
+
+
+def test_follower_wait_has_a_deadline():
+    flight = SingleFlight()
+    release = threading.Event()
+    leader, _ = start_leader(flight, lambda: release.wait(5) and "late")
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        flight.do("k", lambda: "unused", timeout=0.05)
+    assert time.monotonic() - started < 1
+    release.set()
+    leader.join()
+
+
+def test_follower_takes_over_when_the_leader_is_abandoned():
+    flight = SingleFlight()
+    future, leader = flight.join("k")
+    assert leader
+
+    results = []
+    follower = threading.Thread(target=lambda: results.append(flight.do("k", lambda: "retried")))
+    follower.start()
+    while flight.metrics()['coalesced'] == 0:
+        time.sleep(0.001)
+    flight.abandon("k")
+    follower.join()
+
+    assert results == ["retried"]
+    assert flight.metrics()['requests'] == 2
+
+
+def test_interrupted_leader_abandons_instead_of_failing_followers():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def interrupted():
+        release.wait(5)
+        raise KeyboardInterrupt
+
+    leader, outcome = start_leader(flight, interrupted)
+    threading.Timer(0.05, release.set).start()
+    assert flight.do("k", lambda: "retried") == "retried"
+    leader.join()
+    assert isinstance(outcome['error'], KeyboardInterrupt)
+
+
+def test_closed_stream_hands_the_request_to_a_waiting_caller():
+    optimizer = LLMOptimizer(backend=StubBackend(responses={'overall': "one two three"}, token_delay=0.01),
+                             timeout=5)
+    leader = optimizer._stream_chat("Strategic advice please", 100)
+    assert next(leader) == "one"
+
+    results = []
+    coalesced = get_llm_metrics()['coalesced']
+    follower = threading.Thread(
+        target=lambda: results.append("".join(optimizer._stream_chat("Strategic advice please", 100)))
+    )
+    follower.start()
+    while get_llm_metrics()['coalesced'] == coalesced:
+        time.sleep(0.001)
+    leader.close()
+    follower.join(5)
+
+    assert results == ["one two three"]
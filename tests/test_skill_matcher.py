@@ -0,0 +1,40 @@
+from skill_matcher import SkillMatch, SkillMatcher, get_skill_matcher
+
+
+def test_symbol_skills_match_on_word_boundaries():
+    matcher = get_skill_matcher()
+    assert matcher.find_skills("Skilled in C++, C# and Node.js; set up CI/CD.") == ['c++', 'c#', 'node.js', 'ci/cd']
+
+
+def test_short_skills_do_not_match_inside_words():
+    matcher = get_skill_matcher()
+    assert matcher.find_skills("Maintained a Google dashboard for every year") == []
+    assert matcher.find_skills("Used R and Go for AI research") == ['r', 'go', 'ai', 'research']
+
+
+def test_longer_skill_does_not_imply_its_prefix():
+    matcher = get_skill_matcher()
+    assert matcher.find_skills("JavaScript developer") == ['javascript']
+    assert matcher.find_skills("Java and JavaScript") == ['java', 'javascript']
+
+
+def test_extra_skills_keep_their_casing():
+    matcher = get_skill_matcher(['A/B Testing', 'Node.js'])
+    assert matcher.find_skills("Ran a/b testing with node.js services") == ['A/B Testing', 'testing', 'Node.js']
+
+
+def test_case_insensitive_and_deduplicated_in_order_of_first_appearance():
+    matcher = SkillMatcher(['Docker', 'Kubernetes', 'docker'])
+    assert len(matcher) == 2
+    assert matcher.find_skills("KUBERNETES on docker, then Docker again") == ['Kubernetes', 'Docker']
+
+
+def test_find_all_reports_offsets_in_the_text():
+    matcher = SkillMatcher(['machine learning', 'learning'])
+    text = "Deep Machine Learning"
+    assert matcher.find_all(text) == [SkillMatch('machine learning', 5, 21), SkillMatch('learning', 13, 21)]
+
+
+def test_matchers_are_shared_per_skill_set():
+    assert get_skill_matcher(['Terraform']) is get_skill_matcher(['Terraform'])
+    assert get_skill_matcher(['Terraform']) is not get_skill_matcher()